@@ -0,0 +1,69 @@
+"""
+Helpers shared by the benchmarks: a throwaway install with one registered user, plus a wall-time
+and peak-RSS probe. Benchmarks print their numbers; nothing here asserts.
+"""
+import importlib
+import os
+import shutil
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+REPO = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(REPO / "tests")) # synthetic.py: the generator the slow tests use too
+
+_PROBE = (
+    "import resource, subprocess, sys, time\n"
+    "t = time.perf_counter()\n"
+    "subprocess.run(sys.argv[1:], stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)\n"
+    "print(time.perf_counter() - t, resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024)\n"
+)
+
+
+class Install:
+    """A copy of a src/ tree in a temp dir, so data/, logs/ and backup/ never touch the checkout."""
+
+    def __init__(self, src: Path = REPO / "src"):
+        self.root = Path(tempfile.mkdtemp(prefix="work-bench-"))
+        shutil.copytree(src, self.root / "src", ignore=shutil.ignore_patterns("__pycache__"))
+        for folder in ("data", "logs", "backup"):
+            (self.root / folder).mkdir()
+        self.script = self.root / "src" / "Working_Code.py"
+        self.db_path = self.root / "data" / "working_code.db"
+        self.run("REGISTER", input="bench\npw\npw\n")
+
+    def run(self, *args, input: str = "", prefix=()) -> subprocess.CompletedProcess:
+        env = dict(os.environ, PYTHONWARNINGS="ignore", COLUMNS="120")
+        result = subprocess.run([sys.executable, *prefix, str(self.script), *args],
+                                input=input, capture_output=True, text=True, cwd=self.root, env=env)
+        if result.returncode != 0:
+            raise RuntimeError(f"work {' '.join(args)} failed:\n{result.stdout}\n{result.stderr}")
+        return result
+
+    def measure(self, *args) -> (float, float):
+        """(wall seconds, peak RSS MB) of one `work ...` run, output discarded."""
+        result = subprocess.run([sys.executable, "-c", _PROBE, sys.executable, str(self.script), *args],
+                                capture_output=True, text=True, cwd=self.root)
+        if result.returncode != 0:
+            raise RuntimeError(result.stderr)
+        wall, rss = result.stdout.split()
+        return float(wall), float(rss)
+
+    def load(self):
+        """Import this install's Working_Code in-process (its DB_PATH points into the install)."""
+        sys.path.insert(0, str(self.root / "src"))
+        sys.argv = sys.argv[:1]
+        for name in ("fast_path", "translations", "Working_Code"): # synthetic.py loads the checkout's
+            sys.modules.pop(name, None)
+        return importlib.import_module("Working_Code")
+
+    def close(self):
+        shutil.rmtree(self.root, ignore_errors=True)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
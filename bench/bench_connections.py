@@ -0,0 +1,46 @@
+"""
+How many SQLite connections one `work` command opens (config reads used to open one each).
+
+    python bench/bench_connections.py [--src OTHER/src]
+
+Compare with an older tree: `git worktree add /tmp/before <rev>` and pass --src /tmp/before/src.
+"""
+import argparse
+from pathlib import Path
+
+from _common import REPO, Install
+
+# Counts sqlite3.connect calls made while the script runs, reported on stderr at exit
+COUNTER = (
+    "import atexit, os, runpy, sqlite3, sys\n"
+    "calls = [0]\n"
+    "connect = sqlite3.connect\n"
+    "def counting(*a, **k):\n"
+    "    calls[0] += 1\n"
+    "    return connect(*a, **k)\n"
+    "sqlite3.connect = counting\n"
+    "atexit.register(lambda: sys.stderr.write(f'CONNECTIONS={calls[0]}\\n'))\n"
+    "sys.argv = sys.argv[1:]\n"
+    "sys.path.insert(0, os.path.dirname(os.path.abspath(sys.argv[0])))\n"
+    "runpy.run_path(sys.argv[0], run_name='__main__')\n"
+)
+
+COMMANDS = [("help screen",), ("TIME-TODAY",), ("ON",), ("TIME",), ("OFF",)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--src", type=Path, default=REPO / "src", help="src/ tree to measure")
+    args = parser.parse_args()
+
+    with Install(args.src) as install:
+        print(f"{'command':<12} connections")
+        for command in COMMANDS:
+            argv = () if command == ("help screen",) else command
+            stderr = install.run(*argv, prefix=("-c", COUNTER)).stderr
+            count = stderr.rsplit("CONNECTIONS=", 1)[1].split()[0]
+            print(f"{command[0]:<12} {count}")
+
+
+if __name__ == "__main__":
+    main()
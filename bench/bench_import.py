@@ -0,0 +1,48 @@
+"""
+IMPORT of 1M sessions from CSV and from JSONL: wall time and peak RSS, then a re-run (all duplicates).
+
+    python bench/bench_import.py [--rows 1000000]
+
+Rows are one 50-minute session per hour from 2015-01-01 (tests/synthetic.py); the CSV uses the
+EXPORT-CSV layout. Peak RSS should stay flat as --rows grows: the file is streamed in batches.
+"""
+import argparse
+import json
+
+from _common import Install
+from synthetic import session_times
+
+
+def write_csv(path, rows: int):
+    with open(path, "w", encoding="utf-8") as f:
+        f.write("Date,Start,End,Duration,Description\n")
+        for n, (begin, end) in enumerate(session_times(rows)):
+            f.write(f"{begin:%Y-%m-%d},{begin:%H:%M:%S},{end:%H:%M:%S},00:50:00,Task {n % 17}\n")
+
+
+def write_jsonl(path, rows: int):
+    with open(path, "w", encoding="utf-8") as f:
+        for n, (begin, end) in enumerate(session_times(rows)):
+            f.write(json.dumps({"start": begin.isoformat(), "end": end.isoformat(), "description": f"Task {n % 17}"}) + "\n")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--rows", type=int, default=1_000_000, help="sessions per file")
+    args = parser.parse_args()
+
+    print(f"{args.rows} sessions per file")
+    print(f"{'run':<22} {'wall (s)':>9} {'peak RSS (MB)':>14}")
+    for name, write in (("csv", write_csv), ("jsonl", write_jsonl)):
+        with Install() as install:
+            path = install.root / f"history.{name}"
+            write(path, args.rows)
+            wall, rss = install.measure("IMPORT", str(path))
+            print(f"{name.upper() + ' import':<22} {wall:>9.1f} {rss:>14.0f}")
+            if name == "csv":
+                wall, rss = install.measure("IMPORT", str(path))
+                print(f"{'CSV re-run (skipped)':<22} {wall:>9.1f} {rss:>14.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+"""
+START/STOP pairing over 1M events held in memory: ISO parsing per row against integer epochs.
+
+    python bench/bench_pairing.py [--events 1000000]
+
+process_sessions parses every timestamp with fromisoformat (the path for backups without
+ts_epoch); pair_events, used by the sessions backfill and ROLLUP-CHECK, only subtracts epochs.
+"""
+import argparse
+import time
+
+from _common import Install
+from synthetic import session_times, to_epoch
+
+
+def event_rows(count: int) -> list:
+    rows = []
+    for n, (begin, end) in enumerate(session_times(count // 2)):
+        rows.append({'user_id': 1, 'timestamp': begin.isoformat(), 'ts_epoch': to_epoch(begin),
+                     'event_type': 'START', 'description': f"Task {n}"})
+        rows.append({'user_id': 1, 'timestamp': end.isoformat(), 'ts_epoch': to_epoch(end),
+                     'event_type': 'STOP', 'description': None})
+    return rows
+
+
+def best_of(fn, rows, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        pairs = fn(rows)
+        best = min(best, time.perf_counter() - began)
+    return best, len(pairs)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--events", type=int, default=1_000_000)
+    args = parser.parse_args()
+
+    rows = event_rows(args.events)
+    with Install() as install:
+        W = install.load()
+        print(f"{len(rows)} events, best of 3")
+        for label, fn in (("process_sessions (fromisoformat)", W.process_sessions),
+                          ("pair_events (ts_epoch)", lambda r: list(W.pair_events(r)))):
+            seconds, pairs = best_of(fn, rows)
+            print(f"{label:<34} {seconds:6.2f} s  {pairs} sessions")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+"""
+TIME-RANGE totals over 1, 30, 365 and 3650 days: the rollup query against the old per-day event scan.
+
+    python bench/bench_range.py [--years 10] [--full]
+
+The history is one 50-minute session per hour from 2015-01-01 (tests/synthetic.py). "per-day scan"
+is the loop TIME-RANGE used to run: one `timestamp LIKE 'YYYY-MM-DD%'` query per day, paired in Python.
+Each of those is a full table scan, so the 3650-day scan (about 3 minutes) only runs with --full.
+"""
+import argparse
+import sqlite3
+import time
+from datetime import datetime, timedelta
+
+from _common import Install
+from synthetic import START, populate
+
+SPANS = (1, 30, 365, 3650)
+
+
+def per_day_scan(conn, uid, start_date, end_date) -> timedelta:
+    total = timedelta()
+    day = start_date
+    while day <= end_date:
+        rows = conn.execute("SELECT timestamp, event_type FROM events WHERE timestamp LIKE ? AND user_id=? ORDER BY timestamp ASC",
+                            (f"{day.strftime('%Y-%m-%d')}%", uid)).fetchall()
+        session_start = None
+        for row in rows:
+            ts = datetime.fromisoformat(row['timestamp'])
+            if row['event_type'] == 'START':
+                if session_start is None:
+                    session_start = ts
+            elif session_start:
+                total += ts - session_start
+                session_start = None
+        day += timedelta(days=1)
+    return total
+
+
+def best_of(fn, *args, repeat=3):
+    best = float("inf")
+    for _ in range(repeat):
+        began = time.perf_counter()
+        result = fn(*args)
+        best = min(best, time.perf_counter() - began)
+    return best, result
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--years", type=int, default=10, help="history length")
+    parser.add_argument("--full", action="store_true", help="also time the 3650-day per-day scan")
+    args = parser.parse_args()
+
+    with Install() as install:
+        populate(install.db_path, args.years * 365 * 24)
+        W = install.load()
+        conn = sqlite3.connect(install.db_path)
+        conn.row_factory = sqlite3.Row
+        print(f"{args.years} years of history ({args.years * 365 * 24} sessions)")
+        print(f"{'days':>5} {'per-day scan':>14} {'rollup':>10}  totals agree")
+        for days in SPANS:
+            end = START + timedelta(days=days - 1)
+            new, new_total = best_of(W.calculate_range_total, START, end)
+            if days > 365 and not args.full:
+                print(f"{days:>5} {'(--full)':>14} {new * 1000:>7.2f} ms")
+                continue
+            old, old_total = best_of(per_day_scan, conn, 1, START, end, repeat=1 if days > 1 else 3)
+            print(f"{days:>5} {old * 1000:>11.2f} ms {new * 1000:>7.2f} ms  {old_total == new_total}")
+        conn.close()
+
+
+if __name__ == "__main__":
+    main()
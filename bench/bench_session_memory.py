@@ -0,0 +1,74 @@
+"""
+Memory of 100k exported sessions (tracemalloc): the old 6-key dicts, a list of Session objects,
+and EXPORT-CSV streaming Session objects straight off the cursor.
+
+    python bench/bench_session_memory.py [--sessions 100000]
+
+"held" is what the built list keeps alive, "peak" the most allocated at once while building it.
+"""
+import argparse
+import os
+import tracemalloc
+from datetime import datetime
+
+from _common import Install
+from synthetic import populate
+
+LO, HI = "2015-01-01T00:00:00", "2400-01-01T00:00:00"
+
+
+def old_dicts(W, conn):
+    """process_sessions' former output: formatted strings and a timedelta per session."""
+    sessions = []
+    for _, start, end, desc in W.session_rows(conn, 1, LO, HI):
+        begin, finish = datetime.fromtimestamp(start), datetime.fromtimestamp(end)
+        duration = finish - begin
+        sessions.append({
+            "date": begin.strftime("%Y-%m-%d"),
+            "start": begin.strftime("%H:%M:%S"),
+            "end": finish.strftime("%H:%M:%S"),
+            "duration": duration,
+            "duration_str": W.format_duration(duration),
+            "description": W.decrypt_text(desc or ''),
+        })
+    return sessions
+
+
+def session_list(W, conn):
+    return list(W.iter_sessions(W.session_rows(conn, 1, LO, HI)))
+
+
+def streamed_csv(W, conn):
+    W.generate_csv_file(W.iter_sessions_from_db(W.DB_PATH, "01/01/2015", "31/12/2399"), "01/01/2015", "31/12/2399")
+
+
+def traced(fn, *args) -> (float, float):
+    """(held MB, peak MB) allocated by fn."""
+    tracemalloc.start()
+    result = fn(*args)
+    held, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    del result
+    return held / 2**20, peak / 2**20
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--sessions", type=int, default=100_000)
+    args = parser.parse_args()
+
+    with Install() as install:
+        populate(install.db_path, args.sessions)
+        W = install.load()
+        os.chdir(install.root) # generate_csv_file writes to the working directory
+        print(f"{args.sessions} sessions")
+        print(f"{'shape':<24} {'held (MB)':>10} {'peak (MB)':>10}")
+        with W.DB.scope(read_only=True) as conn:
+            for label, fn in (("6-key dicts (old)", old_dicts), ("list of Session", session_list),
+                              ("EXPORT-CSV, streamed", streamed_csv)):
+                held, peak = traced(fn, W, conn)
+                print(f"{label:<24} {held:>10.1f} {peak:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
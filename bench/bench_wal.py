@@ -0,0 +1,103 @@
+"""
+Readers against concurrent writers, per DB profile (rollback journal vs WAL).
+
+    python bench/bench_wal.py [--writers 2] [--readers 4] [--cycles 400]
+
+Writers run ON/OFF cycles through fast_path (one commit each, as the CLI does); readers loop the
+TIME-TODAY query until the writers are done. Reports writer wall time, reads served and lock errors.
+"""
+import argparse
+import multiprocessing
+import sqlite3
+import sys
+import time
+from datetime import datetime, timedelta
+
+from _common import Install
+
+DAY = datetime(2024, 3, 1)
+
+
+def connect(db_path, profile):
+    import fast_path # from the install's src/, put on sys.path by the caller
+    conn = sqlite3.connect(db_path, timeout=10)
+    conn.row_factory = sqlite3.Row
+    fast_path.apply_db_profile(conn, profile)
+    return conn
+
+
+def writer(src, db_path, profile, uid, cycles, start, result):
+    sys.path.insert(0, src)
+    import fast_path
+    conn = connect(db_path, profile)
+    start.wait()
+    errors = 0
+    began = time.perf_counter()
+    for i in range(cycles):
+        now = DAY + timedelta(minutes=2 * i)
+        try:
+            fast_path.open_session(conn, uid, now, "bench")
+            conn.commit()
+            fast_path.close_session(conn, uid, fast_path.get_active_timer(conn, uid), now + timedelta(minutes=1))
+            conn.commit()
+        except sqlite3.OperationalError:
+            conn.rollback()
+            errors += 1
+    result.put(("writer", time.perf_counter() - began, errors))
+
+
+def reader(src, db_path, profile, uid, start, done, result):
+    sys.path.insert(0, src)
+    import fast_path
+    conn = connect(db_path, profile)
+    start.wait()
+    reads = errors = 0
+    while not done.is_set():
+        try:
+            fast_path.range_total_seconds(conn, uid, DAY, DAY, DAY + timedelta(days=1))
+            reads += 1
+        except sqlite3.OperationalError:
+            errors += 1
+    result.put(("reader", reads, errors))
+
+
+def measure(install, profile, writers, readers, cycles):
+    src, db_path = str(install.root / "src"), str(install.db_path)
+    sys.path.insert(0, src)
+    connect(db_path, profile).close() # switch the journal mode while nobody else has the file open
+    start, done, result = multiprocessing.Barrier(writers + readers + 1), multiprocessing.Event(), multiprocessing.Queue()
+    # Writers use uids 1..N: active_timers is keyed by user, so each needs its own
+    procs = [multiprocessing.Process(target=writer, args=(src, db_path, profile, n + 1, cycles, start, result))
+             for n in range(writers)]
+    procs += [multiprocessing.Process(target=reader, args=(src, db_path, profile, n % writers + 1, start, done, result))
+              for n in range(readers)]
+    for proc in procs:
+        proc.start()
+    start.wait()
+    outcomes = [result.get() for _ in range(writers)]
+    done.set()
+    outcomes += [result.get() for _ in range(readers)]
+    for proc in procs:
+        proc.join()
+    wall = max(o[1] for o in outcomes if o[0] == "writer")
+    reads = sum(o[1] for o in outcomes if o[0] == "reader")
+    return wall, reads, sum(o[2] for o in outcomes)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument("--writers", type=int, default=2)
+    parser.add_argument("--readers", type=int, default=4)
+    parser.add_argument("--cycles", type=int, default=400, help="ON/OFF pairs per writer")
+    args = parser.parse_args()
+
+    print(f"{args.writers} writers x {args.cycles} ON/OFF, {args.readers} readers")
+    print(f"{'profile':<12} {'writes (s)':>10} {'reads':>9} {'lock errors':>12}")
+    for profile in ("default", "shared", "performance"):
+        with Install() as install:
+            wall, reads, errors = measure(install, profile, args.writers, args.readers, args.cycles)
+            print(f"{profile:<12} {wall:>10.2f} {reads:>9} {errors:>12}")
+
+
+if __name__ == "__main__":
+    main()
@@ -1,40 +1,59 @@
+import sys
+import time
+import fast_path
+
+# A running `work --daemon` answers first; else FAST-MODE hot commands are served before typer/rich load
+if __name__ == "__main__":
+    sys.argv[1:] = fast_path.enable_profiling(sys.argv[1:])
+    fast_path.record_phase("imports", time.perf_counter() - fast_path.PROFILE_T0)
+    _code = fast_path.daemon_request(sys.argv[1:])
+    if _code is not None:
+        sys.exit(_code)
+    if fast_path.run(sys.argv[1:]):
+        sys.exit(0)
+
+_imports_start = time.perf_counter()
 import typer
 import sqlite3
 import shutil
 import os
-from datetime import datetime, timedelta
-from rich.console import Console
-from rich.table import Table
-from rich.panel import Panel
-from rich.text import Text
 import platform
-import sys
+import hashlib
+import secrets
 from datetime import datetime, timedelta
-import typer
-import sqlite3
-import shutil
-import os
-import locale
 from rich.console import Console
 from rich.table import Table
 from rich.panel import Panel
 from rich.text import Text
 from rich import box
 from rich.align import Align
-from rich.traceback import install
 from pathlib import Path
 from typing import Optional
-from translations import get_text, TRANSLATIONS
-
-# Install rich traceback handler for prettier unhandled exceptions
-install(show_locals=False)
-
-# Configuration
-DB_NAME = "working_code.db"
-SCRIPT_DIR = Path(__file__).parent.absolute()
-# Go up one level from src/ to root, then into data/
-DB_PATH = SCRIPT_DIR.parent / "data" / DB_NAME
-BACKUP_DIR = SCRIPT_DIR.parent / "backup"
+from contextlib import contextmanager
+from itertools import chain, groupby, islice
+from translations import LANGUAGES, get_text, load_language
+from fast_path import (
+    SCHEMA_VERSION, DB_NAME, DB_PATH, LOGS_DIR, KEY_PATH, BACKUP_DIR, DB_PROFILES, DB_PROFILE_ENV,
+    resolve_db_profile, apply_db_profile, resolve_language, write_audit, format_duration,
+    get_active_timer, open_session, close_session, range_total_seconds, to_epoch, write_status_file, remove_status_file,
+    prompt_text, profiled, profile_connection, record_phase, auto_backup_due, spawn_auto_backup,
+    release_auto_backup_lock, day_start_hour, logical_date, day_start, calendar_buckets, clip_intervals, bucket_rollup, day_rollup,
+)
+record_phase("imports", time.perf_counter() - _imports_start)
+
+# Heavy modules (cryptography, csv, xhtml2pdf, AI SDKs, webbrowser, rich.traceback)
+# are imported inside the commands that need them, keeping ON/OFF/TIME startup light.
+
+def _rich_excepthook(exc_type, exc, tb):
+    """Install rich's traceback handler only when an exception actually escapes."""
+    from rich.traceback import install
+    install(show_locals=False)
+    sys.excepthook(exc_type, exc, tb)
+
+# Rich traceback handler for prettier unhandled exceptions
+sys.excepthook = _rich_excepthook
+
+# Configuration (paths shared with fast_path)
 
 # Platform specific robustness
 SYSTEM_PLATFORM = platform.system()
@@ -56,6 +75,7 @@ class UI:
         return get_config("ui_mode") == "fast"
 
     @staticmethod
+    @profiled("render")
     def print(content, title=None, style=None, border_style="blue", box_type=box.ROUNDED):
         if UI.is_fast_mode():
             # Fast Mode: Plain text
@@ -81,6 +101,7 @@ class UI:
             console.print(Panel(msg, title=title, border_style=border_style, box=box_type, padding=(1, 2) if title else (0,0)))
 
     @staticmethod
+    @profiled("render")
     def table(columns, rows):
         if UI.is_fast_mode():
             # Fast Table
@@ -96,37 +117,67 @@ class UI:
                 t.add_row(*[str(r) for r in row])
             console.print(t)
 
+    @staticmethod
+    @profiled("render")
+    def stream_table(columns, rows, widths=None, chunk: int = 200):
+        """
+        Like table(), but rows can be any iterable (e.g. a generator over DB pages).
+        Rows are printed as they arrive. Normal Mode pads every column but the last to
+        its fixed width instead of measuring a rich Table, and prints a chunk of lines
+        per call.
+        """
+        if UI.is_fast_mode():
+            print("\t".join([c for c, _ in columns]))
+            for row in rows:
+                print("\t".join([str(r) for r in row]))
+            return
+        widths = list(widths or [])
+        widths = [max(w or 0, len(c)) for w, (c, _) in zip(widths + [0] * len(columns), columns)]
+        widths[-1] = 0  # last column takes what is left of the line
+        console.print(Text("  ".join(c.ljust(w) for w, (c, _) in zip(widths, columns)).rstrip(), style="bold"))
+        console.print(Text("─" * (sum(widths) + 2 * (len(columns) - 1) + len(columns[-1][0])), style="dim"))
+        rows = iter(rows)
+        while True:
+            part = list(islice(rows, chunk))
+            if not part:
+                break
+            block = Text()
+            for row in part:
+                for i, (cell, (_, style)) in enumerate(zip(row, columns)):
+                    block.append(str(cell).ljust(widths[i]), style)
+                    block.append("\n" if i == len(columns) - 1 else "  ")
+            block.rstrip()
+            console.print(block, highlight=False, soft_wrap=True)
+
 # --- Config & Helpers ---
 
+# Resolved once per process; reset when the setting or the DB file changes
+_LANGUAGE: Optional[str] = None
+_TEXTS: dict = {}
+
 def get_language() -> str:
     """Determine language: DB -> System -> Default (EN)."""
-    # 1. Check DB
-    try:
-        if DB_PATH.exists():
-            lang = get_config("language")
-            if lang and lang in TRANSLATIONS:
-                return lang
-    except Exception:
-        pass # Fallback if DB invalid or error
+    global _LANGUAGE, _TEXTS
+    if _LANGUAGE is None:
+        lang = None
+        try:
+            if DB_PATH.exists():
+                lang = get_config("language")
+        except Exception:
+            pass # Fallback if DB invalid or error
+        _LANGUAGE = resolve_language(lang)
+        _TEXTS = load_language(_LANGUAGE)
+    return _LANGUAGE
 
-    # 2. Check System
-    try:
-        sys_lang, _ = locale.getdefaultlocale()
-        if sys_lang:
-             prefix = sys_lang.split("_")[0].upper()
-             # Map common codes
-             if prefix in ["ES", "EN", "FR", "PT"]:
-                 return prefix
-             if prefix == "BR": return "PT" # Portuguese Brazil
-    except Exception:
-        pass
-        
-    # 3. Default
-    return "EN"
+def reset_language():
+    global _LANGUAGE
+    _LANGUAGE = None
 
 def T(key: str) -> str:
     """Short helper to translate text based on current context."""
-    return get_text(key, get_language())
+    if _LANGUAGE is None:
+        get_language()
+    return _TEXTS.get(key, key)
 
 def check_db_permissions():
     """Ensure we have write permissions to the database directory."""
@@ -143,58 +194,219 @@ def check_db_permissions():
         console.print(T('check_permissions'))
         sys.exit(1)
 
-def get_db_connection():
-    check_db_permissions()
-    try:
-        conn = sqlite3.connect(DB_PATH, timeout=10) # 10s timeout to handle potential locks
-        conn.row_factory = sqlite3.Row
-        return conn
-    except sqlite3.OperationalError as e:
-        console.print(f"[{ERROR_STYLE}]{T('database_error')}:[/{ERROR_STYLE}] {e}")
-        console.print(f"[{WARNING_STYLE}]{T('database_locked_hint')}[/{WARNING_STYLE}]")
-        raise typer.Exit(code=1)
+# --- Storage Profiles ---
+# DB_PROFILES and apply_db_profile live in fast_path, which opens its own connection.
 
+def get_db_profile_name() -> str:
+    """Profile: env WORK_DB_PROFILE -> config 'db_profile' -> default."""
+    return resolve_db_profile(get_config("db_profile"))
 
+def db_side_files(db_path: Path) -> list:
+    """WAL mode keeps committed pages in -wal/-shm next to the main file."""
+    return [db_path.with_name(db_path.name + suffix) for suffix in ("-wal", "-shm")]
 
-def get_config(key: str) -> Optional[str]:
+# --- Connection Manager ---
+
+class DB:
+    """
+    One lazily opened SQLite connection per process, shared by every helper.
+    A command pays for connection setup and permission checks only once.
+    """
+    _conn: Optional[sqlite3.Connection] = None
+    schema_ready = False # Set once init_db() has seen a current schema
+
+    @staticmethod
+    def connect() -> sqlite3.Connection:
+        if DB._conn is None:
+            check_db_permissions()
+            try:
+                conn = sqlite3.connect(DB_PATH, timeout=10) # 10s timeout to handle potential locks
+                conn.row_factory = sqlite3.Row
+                profile_connection(conn)
+            except sqlite3.OperationalError as e:
+                console.print(f"[{ERROR_STYLE}]{T('database_error')}:[/{ERROR_STYLE}] {e}")
+                console.print(f"[{WARNING_STYLE}]{T('database_locked_hint')}[/{WARNING_STYLE}]")
+                raise typer.Exit(code=1)
+            DB._conn = conn
+            # Profile may come from the config table, which needs the connection itself
+            try:
+                apply_db_profile(conn, get_db_profile_name())
+            except sqlite3.OperationalError as e:
+                console.print(f"[{WARNING_STYLE}]{T('database_error')}: {e}[/{WARNING_STYLE}]")
+        return DB._conn
+
+    @staticmethod
+    def close():
+        """Release the connection (end of process, or before the DB file is replaced)."""
+        global _CONFIG_CACHE
+        if DB._conn is not None:
+            DB._conn.close()
+            DB._conn = None
+        DB.schema_ready = False
+        _CONFIG_CACHE = None # Snapshot belonged to that connection/file
+        reset_language()
+
+    @staticmethod
+    @contextmanager
+    def scope(read_only: bool = False):
+        """Run a block on the shared connection. read_only rejects any write inside it."""
+        conn = DB.connect()
+        if not read_only:
+            yield conn
+            return
+        previous = conn.execute("PRAGMA query_only").fetchone()[0]
+        conn.execute("PRAGMA query_only = ON")
+        try:
+            yield conn
+        finally:
+            if DB._conn is conn:
+                conn.execute(f"PRAGMA query_only = {previous}")
+
+def get_db_connection() -> sqlite3.Connection:
+    """Shared connection for this process. Callers must not close it."""
+    return DB.connect()
+
+# --- Config Snapshot ---
+# The config table is tiny, so it is read once per process and served from memory.
+# PRAGMA data_version tells us when another process committed changes since.
+_CONFIG_CACHE: Optional[dict] = None
+_CONFIG_STAMP = None
+
+def load_config_snapshot(force: bool = False) -> dict:
+    """Return the whole config table, reloading only if another connection wrote."""
+    global _CONFIG_CACHE, _CONFIG_STAMP
     conn = get_db_connection()
+    stamp = conn.execute("PRAGMA data_version").fetchone()[0]
+    if _CONFIG_CACHE is not None and not force and stamp == _CONFIG_STAMP:
+        return _CONFIG_CACHE
+
     try:
-        cursor = conn.execute("SELECT value FROM config WHERE key=?", (key,))
-        row = cursor.fetchone()
-        return row['value'] if row else None
+        rows = conn.execute("SELECT key, value FROM config").fetchall()
+        _CONFIG_CACHE = {row['key']: row['value'] for row in rows}
+    except sqlite3.OperationalError:
+        _CONFIG_CACHE = {} # Table missing (init_db not run yet)
+    _CONFIG_STAMP = stamp
+    return _CONFIG_CACHE
+
+def get_config(key: str) -> Optional[str]:
+    try:
+        return load_config_snapshot().get(key)
     except Exception:
         return None
-    finally:
-        conn.close()
 
-import hashlib
-import secrets
-
-# Logging Config
-LOGS_DIR = SCRIPT_DIR.parent / "logs"
-LOG_FILE = LOGS_DIR / "log.txt"
+def get_day_start_hour() -> int:
+    """Hour (0-23) at which a tracking day begins; see DAY-START."""
+    return day_start_hour(get_config("day_start_hour"))
 
+@profiled("audit")
 def log_audit(action: str, details: str = ""):
     """Append to audit log."""
-    if not LOGS_DIR.exists():
-        LOGS_DIR.mkdir(parents=True, exist_ok=True)
-        
-    user = get_current_user_name() or "SYSTEM/GUEST"
-    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
-    entry = f"[{timestamp}] [{user}] [{action}] {details}\n"
-    
-    with open(LOG_FILE, "a", encoding="utf-8") as f:
-        f.write(entry)
+    write_audit(get_current_user_name() or "SYSTEM/GUEST", action, details)
 
 def set_config(key: str, value: str):
     conn = get_db_connection()
     conn.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", (key, value))
     conn.commit()
-    conn.close()
 
-def init_db():
-    conn = get_db_connection()
-    
+    # Write-through: our own commits don't bump data_version, so keep the snapshot in sync
+    if _CONFIG_CACHE is not None:
+        _CONFIG_CACHE[key] = value
+    if key == "language":
+        reset_language()
+
+# --- Sessions & Rollups ---
+
+def pair_events(rows):
+    """
+    Yield (user_id, start, end, duration_seconds, description) for each START/STOP pair.
+    Rows need ts_epoch and must be ordered by user_id, ts_epoch. Same rule as process_sessions:
+    the first START opens a session, the next STOP closes it. No ISO parsing per row.
+    Within one second, a STOP goes first while a session is open: an imported session that
+    ends when a stored one starts has the later id, but still closes before the next opens.
+    """
+    open_starts = {}
+    held = None # START met while a session was open; opens next if a STOP in the same second closes that one
+    for ev in rows:
+        uid = ev['user_id']
+        if held is not None:
+            if ev['event_type'] == 'STOP' and uid == held['user_id'] and ev['ts_epoch'] == held['ts_epoch']:
+                start = open_starts.pop(uid)
+                yield (uid, start['timestamp'], ev['timestamp'], ev['ts_epoch'] - start['ts_epoch'], start['description'])
+                open_starts[uid] = held
+                held = None
+                continue
+            held = None # A plain repeated START: ignored
+        if ev['event_type'] == 'START':
+            if uid in open_starts:
+                held = ev
+            else:
+                open_starts[uid] = ev
+        elif ev['event_type'] == 'STOP' and uid in open_starts:
+            start = open_starts.pop(uid)
+            yield (uid, start['timestamp'], ev['timestamp'], ev['ts_epoch'] - start['ts_epoch'], start['description'])
+
+def save_day_rollup(conn, uid, days: dict):
+    """Write day_rollup() results over the existing rows for those days."""
+    conn.executemany(
+        "INSERT OR REPLACE INTO daily_totals (user_id, day, seconds, sessions, first_start) VALUES (?, ?, ?, ?, ?)",
+        [(uid, day, seconds, started, datetime.fromtimestamp(first).isoformat())
+         for day, (seconds, started, first) in days.items()]
+    )
+
+def refresh_daily_totals(conn, uid, days, hour: int = 0):
+    """Recompute only the given days (YYYY-MM-DD) from sessions, after historical edits or imports."""
+    for day in set(days):
+        d = datetime.strptime(day, "%Y-%m-%d").date()
+        lo_iso, hi_iso = day_start(d, hour).isoformat(), day_start(d + timedelta(days=1), hour).isoformat()
+        # Sessions never overlap, so only the last one starting before the day can reach into it
+        rows = conn.execute('''
+            SELECT CAST(strftime('%s', start, 'utc') AS INTEGER), CAST(strftime('%s', end, 'utc') AS INTEGER)
+            FROM sessions WHERE user_id IS ? AND start < ? AND start >= COALESCE(
+                (SELECT MAX(start) FROM sessions WHERE user_id IS ? AND start < ?), ?)
+            ORDER BY start
+        ''', (uid, hi_iso, uid, lo_iso, lo_iso)).fetchall()
+        conn.execute("DELETE FROM daily_totals WHERE user_id IS ? AND day=?", (uid, day))
+        rollup = day_rollup(rows, hour)
+        if day in rollup:
+            save_day_rollup(conn, uid, {day: rollup[day]})
+
+def rebuild_daily_totals(conn, hour: int = 0):
+    """Recompute every user's rollup in one ordered pass over sessions (migration, DAY-START)."""
+    conn.execute("DELETE FROM daily_totals")
+    rows = conn.execute('''
+        SELECT user_id, CAST(strftime('%s', start, 'utc') AS INTEGER), CAST(strftime('%s', end, 'utc') AS INTEGER)
+        FROM sessions ORDER BY user_id, start
+    ''')
+    for uid, user_rows in groupby(rows, key=lambda row: row[0]):
+        save_day_rollup(conn, uid, day_rollup(((row[1], row[2]) for row in user_rows), hour))
+
+def sync_active_timer(conn, uid):
+    """Rebuild a user's active_timers row from their latest event (migration, historical edits)."""
+    conn.execute("DELETE FROM active_timers WHERE user_id=?", (uid,))
+    row = conn.execute(
+        "SELECT timestamp, ts_epoch, event_type, description FROM events WHERE user_id=? ORDER BY ts_epoch DESC, id DESC LIMIT 1",
+        (uid,)
+    ).fetchone()
+    if row and row['event_type'] == 'START':
+        conn.execute(
+            "INSERT INTO active_timers (user_id, started_at, started_epoch, description) VALUES (?, ?, ?, ?)",
+            (uid, row['timestamp'], row['ts_epoch'], row['description'])
+        )
+
+def refresh_status_file():
+    """Bring the shell-prompt status file in line with the DB for whoever is logged in now."""
+    uid = get_current_user_id()
+    if uid:
+        write_status_file(get_db_connection(), uid, hour=get_day_start_hour())
+    else:
+        remove_status_file()
+
+# --- Schema Migrations ---
+# The schema version lives in PRAGMA user_version. Each step upgrades it by one;
+# append new steps (indexes, rollup tables...) at the end, never edit a shipped one.
+
+def _migrate_base_schema(conn):
+    """v1: users, events, config (tolerates pre-versioned databases)."""
     # Users Table
     conn.execute('''
         CREATE TABLE IF NOT EXISTS users (
@@ -217,16 +429,12 @@ def init_db():
         )
     ''')
     
-    # Migrations
-    try:
+    # Legacy databases may predate these columns
+    columns = {row['name'] for row in conn.execute("PRAGMA table_info(events)")}
+    if "description" not in columns:
         conn.execute("ALTER TABLE events ADD COLUMN description TEXT")
-    except sqlite3.OperationalError:
-        pass 
-        
-    try:
+    if "user_id" not in columns:
         conn.execute("ALTER TABLE events ADD COLUMN user_id INTEGER")
-    except sqlite3.OperationalError:
-        pass
 
     # Config Table
     conn.execute('''
@@ -235,8 +443,123 @@ def init_db():
             value TEXT NOT NULL
         )
     ''')
-    conn.commit()
-    conn.close()
+
+def _migrate_events_index(conn):
+    """v2: covering index for per-user date range reads (totals, first start, active session)."""
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_events_user_ts
+        ON events (user_id, timestamp, event_type)
+    ''')
+
+def _migrate_sessions_table(conn):
+    """v3: materialized START/STOP pairs, backfilled once from existing events."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS sessions (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            user_id INTEGER,
+            start TEXT NOT NULL,
+            end TEXT NOT NULL,
+            duration_seconds REAL NOT NULL,
+            description TEXT
+        )
+    ''')
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_sessions_user_start
+        ON sessions (user_id, start, duration_seconds)
+    ''')
+
+    # ts_epoch only arrives in v5; derive it inline (the 'utc' modifier reads local time)
+    rows = conn.execute('''
+        SELECT timestamp, CAST(strftime('%s', timestamp, 'utc') AS INTEGER) AS ts_epoch,
+               event_type, description, user_id
+        FROM events ORDER BY user_id, timestamp, id
+    ''')
+    conn.executemany(
+        "INSERT INTO sessions (user_id, start, end, duration_seconds, description) VALUES (?, ?, ?, ?, ?)", pair_events(rows)
+    )
+
+def _migrate_daily_totals(conn):
+    """v4: per-user daily rollup of sessions (keyed by the day a session started)."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS daily_totals (
+            user_id INTEGER,
+            day TEXT NOT NULL,
+            seconds REAL NOT NULL,
+            sessions INTEGER NOT NULL,
+            first_start TEXT NOT NULL,
+            PRIMARY KEY (user_id, day)
+        )
+    ''')
+    conn.execute('''
+        INSERT OR REPLACE INTO daily_totals (user_id, day, seconds, sessions, first_start)
+        SELECT user_id, substr(start, 1, 10), SUM(duration_seconds), COUNT(*), MIN(start)
+        FROM sessions GROUP BY user_id, substr(start, 1, 10)
+    ''')
+
+def _migrate_events_epoch(conn):
+    """v5: integer epoch seconds on events for filters, ordering and duration arithmetic."""
+    conn.execute("ALTER TABLE events ADD COLUMN ts_epoch INTEGER")
+    # Timestamps are naive local time: 'utc' converts them to a real epoch (same as datetime.timestamp())
+    conn.execute("UPDATE events SET ts_epoch = CAST(strftime('%s', timestamp, 'utc') AS INTEGER)")
+    # id breaks ties between events written within the same second (e.g. ON + OFF from a hook)
+    conn.execute("DROP INDEX IF EXISTS idx_events_user_ts")
+    conn.execute('''
+        CREATE INDEX IF NOT EXISTS idx_events_user_epoch
+        ON events (user_id, ts_epoch, id, event_type)
+    ''')
+
+def _migrate_split_daily_totals(conn):
+    """v7: rollup rows hold sessions cut at midnight, so night shifts count towards both days."""
+    rebuild_daily_totals(conn)
+
+def _migrate_active_timers(conn):
+    """v6: one state row per user with a running timer (O(1) status lookups)."""
+    conn.execute('''
+        CREATE TABLE IF NOT EXISTS active_timers (
+            user_id INTEGER PRIMARY KEY,
+            started_at TEXT NOT NULL,
+            started_epoch INTEGER NOT NULL,
+            description TEXT
+        )
+    ''')
+    for row in conn.execute("SELECT DISTINCT user_id FROM events WHERE user_id IS NOT NULL").fetchall():
+        sync_active_timer(conn, row['user_id'])
+
+MIGRATIONS = [
+    _migrate_base_schema,     # 1
+    _migrate_events_index,    # 2
+    _migrate_sessions_table,  # 3
+    _migrate_daily_totals,    # 4
+    _migrate_events_epoch,    # 5
+    _migrate_active_timers,   # 6
+    _migrate_split_daily_totals, # 7
+]
+assert len(MIGRATIONS) == SCHEMA_VERSION, "fast_path.SCHEMA_VERSION must match the last migration"
+
+@profiled("init_db")
+def init_db():
+    """Bring the schema up to SCHEMA_VERSION. A no-op read when already current."""
+    if DB.schema_ready:
+        return
+    conn = get_db_connection()
+    if conn.execute("PRAGMA user_version").fetchone()[0] >= SCHEMA_VERSION:
+        DB.schema_ready = True
+        return
+
+    if conn.in_transaction:
+        conn.commit()
+    # Take the write lock first, then re-check: another process may have migrated meanwhile
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        version = conn.execute("PRAGMA user_version").fetchone()[0]
+        for number, migration in enumerate(MIGRATIONS[version:], start=version + 1):
+            migration(conn)
+            conn.execute(f"PRAGMA user_version = {number}")
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+    DB.schema_ready = True
     
 # --- Auth Helpers ---
 
@@ -276,10 +599,10 @@ def get_current_user_name() -> Optional[str]:
         
     conn = get_db_connection()
     row = conn.execute("SELECT username FROM users WHERE id=?", (uid,)).fetchone()
-    conn.close()
     return row['username'] if row else None
 
 
+@profiled("auth")
 def ensure_logged_in():
     """Check login status, exit if failed."""
     if not get_current_user_id():
@@ -320,20 +643,20 @@ def main(ctx: typer.Context):
              raise typer.Exit(code=1)
 
     if ctx.invoked_subcommand is None:
-        print_banner(T('app_subtitle'))
+        print_banner(T('welcome_banner'))
         
         # Build Command List
         columns = [("Command", "cyan"), ("Description", "white"), ("Example", "dim")]
         rows = [
-            ("ON [Desc]", T("desc_start"), "work ON 'Project A'"),
-            ("OFF", T("desc_stop"), "work OFF"),
+            ("ON [Desc]", T("desc_on"), "work ON 'Project A'"),
+            ("OFF", T("desc_off"), "work OFF"),
             ("TIME", T("desc_time"), "work TIME"),
-            ("TIME-TODAY", T("desc_today"), "work TIME-TODAY"),
-            ("TIME-SELECT", T("desc_select"), "work TIME-SELECT 01/01/2024"),
-            ("TIME-RANGE", T("desc_range"), "work TIME-RANGE 01/01/2024 31/01/2024"),
-            ("INIT-TIME", T("desc_init"), "work INIT-TIME"),
-            ("INIT-TIME_WHEN", T("desc_init_when"), "work INIT-TIME_WHEN 01/01/2024"),
-            ("AI-GEN-ASK", T("desc_ai_ask"), "work AI-GEN-ASK \"Trend?\""),
+            ("TIME-TODAY", T("desc_time_today"), "work TIME-TODAY"),
+            ("TIME-SELECT", T("desc_time_select"), "work TIME-SELECT 01/01/2024"),
+            ("TIME-RANGE", T("desc_time_range"), "work TIME-RANGE 01/01/2024 31/01/2024"),
+            ("INIT-TIME", T("desc_init_time"), "work INIT-TIME"),
+            ("INIT-TIME_WHEN", T("desc_init_time_when"), "work INIT-TIME_WHEN 01/01/2024"),
+            ("AI-GEN-ASK", T("desc_ai_gen_ask"), "work AI-GEN-ASK \"Trend?\""),
             ("AI-SEL-ASK-RANGE-TIME", T("desc_ai_range_ask"), "work AI-SEL-ASK-RANGE-TIME d1 d2"),
             ("EXPORT-CSV", T("desc_export_csv"), "work EXPORT-CSV d1 d2"),
             ("EXPORT-PDF", T("desc_export_pdf"), "work EXPORT-PDF d1 d2"),
@@ -349,14 +672,14 @@ def main(ctx: typer.Context):
             ("REGISTER", T("desc_register"), "work REGISTER"),
             ("LOGIN", T("desc_login"), "work LOGIN"),
             ("BACKUP", T("desc_backup"), "work BACKUP"),
-            ("CONF-BACKUP-AUTO", T("desc_conf_backup"), "work CONF-BACKUP-AUTO"),
+            ("CONF-BACKUP-AUTO", T("desc_config_backup"), "work CONF-BACKUP-AUTO"),
             ("LOAD-BACKUP", T("desc_load_backup"), "work LOAD-BACKUP"),
             ("FAST-MODE", "Enable Fast Mode", "work FAST-MODE"),
             ("NORMAL-MODE", "Enable Normal Mode", "work NORMAL-MODE"),
             ("AI-CONFIG", T("desc_ai_config"), "work AI-CONFIG"),
             ("LANG-SET", T("desc_lang_set"), "work LANG-SET"),
             ("DB", T("desc_db"), "work DB"),
-            ("CLEAR-ALL", T("desc_clear"), "work CLEAR-ALL"),
+            ("CLEAR-ALL", T("desc_clear_all"), "work CLEAR-ALL"),
         ]
             
         UI.table(columns, rows)
@@ -368,60 +691,6 @@ def main(ctx: typer.Context):
         else:
             UI.print("Not logged in.", style="yellow")
 
-@app.command(name="EXPORT-CSV")
-def export_csv(start_date_str: str, end_date_str: str):
-    """Export work history to CSV."""
-    init_db()
-    ensure_logged_in()
-    try:
-        start_date = parse_date(start_date_str)
-        end_date = parse_date(end_date_str)
-        s_iso = start_date.strftime("%Y-%m-%dT00:00:00")
-        e_iso = (end_date + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
-        uid = get_current_user_id()
-        
-        conn = get_db_connection()
-        cursor = conn.execute(
-            "SELECT timestamp, event_type, description FROM events WHERE timestamp >= ? AND timestamp < ? AND user_id=? ORDER BY timestamp ASC",
-            (s_iso, e_iso, uid)
-        )
-        events = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        sessions = process_sessions(events)
-        path = generate_csv_file(sessions, start_date_str, end_date_str)
-        console.print(Panel(f"{T('export_csv_success')}:\n[blue]{path}[/blue] 📊", border_style="green"))
-
-    except Exception as e:
-        console.print(Panel(f"[bold red]Error: {e}[/bold red]", border_style="red"))
-
-@app.command(name="EXPORT-PDF")
-def export_pdf(start_date_str: str, end_date_str: str):
-    """Export work history to PDF."""
-    init_db()
-    ensure_logged_in()
-    try:
-        start_date = parse_date(start_date_str)
-        end_date = parse_date(end_date_str)
-        s_iso = start_date.strftime("%Y-%m-%dT00:00:00")
-        e_iso = (end_date + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
-        uid = get_current_user_id()
-        
-        conn = get_db_connection()
-        cursor = conn.execute(
-            "SELECT timestamp, event_type, description FROM events WHERE timestamp >= ? AND timestamp < ? AND user_id=? ORDER BY timestamp ASC",
-            (s_iso, e_iso, uid)
-        )
-        events = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        
-        sessions = process_sessions(events)
-        path = generate_pdf_file(sessions, start_date_str, end_date_str)
-        console.print(Panel(f"{T('export_pdf_success')}:\n[blue]{path}[/blue] 📊", border_style="green"))
-
-    except Exception as e:
-        console.print(Panel(f"[bold red]Error: {e}[/bold red]", border_style="red"))
-
 @app.command(name="REGISTER")
 def register_user():
     """Create a new user."""
@@ -453,6 +722,9 @@ def register_user():
         # Claim orphans if first user
         if is_first:
             conn.execute("UPDATE events SET user_id = ? WHERE user_id IS NULL", (user_id,))
+            conn.execute("UPDATE sessions SET user_id = ? WHERE user_id IS NULL", (user_id,))
+            conn.execute("UPDATE daily_totals SET user_id = ? WHERE user_id IS NULL", (user_id,))
+            sync_active_timer(conn, user_id)
             console.print("[yellow]First user: Claimed all existing events.[/yellow]")
             
         conn.commit()
@@ -461,11 +733,10 @@ def register_user():
         
         # Auto-login
         set_config("current_user_id", str(user_id))
+        refresh_status_file()
         
     except sqlite3.IntegrityError:
         console.print("[red]Username already exists.[/red]")
-    finally:
-        conn.close()
 
 @app.command(name="LOGIN")
 def login_user():
@@ -476,10 +747,10 @@ def login_user():
     
     conn = get_db_connection()
     user = conn.execute("SELECT * FROM users WHERE username=?", (username,)).fetchone()
-    conn.close()
     
     if user and verify_password(user['password_hash'], user['salt'], password):
         set_config("current_user_id", str(user['id']))
+        refresh_status_file()
         console.print(f"[green]{T('auth_login_success')} {username}[/green]")
         log_audit("LOGIN", "Success")
     else:
@@ -492,6 +763,7 @@ def logout_user():
     init_db()
     log_audit("LOGOUT")
     set_config("current_user_id", "")
+    remove_status_file()
     console.print(f"[yellow]{T('auth_logout')}[/yellow]")
 
 @app.command(name="USER-DELETE")
@@ -512,18 +784,18 @@ def delete_user_account():
     if user and verify_password(user['password_hash'], user['salt'], password):
         # Delete data first
         conn.execute("DELETE FROM events WHERE user_id=?", (uid,))
+        conn.execute("DELETE FROM sessions WHERE user_id=?", (uid,))
+        conn.execute("DELETE FROM daily_totals WHERE user_id=?", (uid,))
+        conn.execute("DELETE FROM active_timers WHERE user_id=?", (uid,))
         conn.execute("DELETE FROM users WHERE id=?", (uid,))
         conn.commit()
-        conn.close()
         
         set_config("current_user_id", "")
+        remove_status_file(uid)
         log_audit("USER-DELETE", f"Deleted user {user['username']}")
         console.print("[red]Account and data deleted.[/red]")
     else:
-        conn.close()
         console.print("[red]Invalid password.[/red]")
-    conn.commit()
-    conn.close()
 
 # --- Core Logic ---
 
@@ -537,27 +809,24 @@ def parse_date(date_str: str) -> datetime:
         console.print(f"[{ERROR_STYLE}]{T('invalid_date_format')}[/{ERROR_STYLE}]")
         raise typer.Exit(code=1)
 
-
-def get_active_session_start(conn) -> Optional[datetime]:
-    """Returns the start time of the current session for current user."""
+@profiled("query")
+def get_active_session(conn) -> Optional[sqlite3.Row]:
+    """Returns the running session (timestamp, ts_epoch, description) for current user."""
     uid = get_current_user_id()
     if not uid: return None
     
-    cursor = conn.execute("SELECT timestamp, event_type FROM events WHERE user_id=? ORDER BY timestamp DESC LIMIT 1", (uid,))
-    row = cursor.fetchone()
-    if row and row['event_type'] == 'START':
-        return datetime.fromisoformat(row['timestamp'])
-    return None
+    # active_timers is the source of truth: a primary key lookup, no event scan
+    return get_active_timer(conn, uid)
+
+def get_active_session_start(conn) -> Optional[datetime]:
+    """Returns the start time of the current session for current user."""
+    row = get_active_session(conn)
+    return datetime.fromtimestamp(row['ts_epoch']) if row else None
 
 def calculate_duration(start_time: datetime, end_time: datetime) -> timedelta:
     return end_time - start_time
 
-def format_duration(td: timedelta) -> str:
-    total_seconds = int(td.total_seconds())
-    hours, remainder = divmod(total_seconds, 3600)
-    minutes, seconds = divmod(remainder, 60)
-    return f"{hours:02}:{minutes:02}:{seconds:02}"
-
+@profiled("render")
 def print_banner(subtitle: str = ""):
     """Prints a styled banner."""
     if UI.is_fast_mode():
@@ -592,7 +861,6 @@ def start_timer(description: str = typer.Argument(None)):
     conn = get_db_connection()
     if get_active_session_start(conn):
         UI.print(f"[bold yellow]{T('timer_already_running')}[/bold yellow]", title="Info", border_style="yellow")
-        conn.close()
         return
 
     now = datetime.now()
@@ -601,10 +869,12 @@ def start_timer(description: str = typer.Argument(None)):
     # User ID check
     uid = get_current_user_id()
     
-    conn.execute("INSERT INTO events (timestamp, event_type, description, user_id) VALUES (?, ?, ?, ?)", 
-                 (now.isoformat(), 'START', desc_enc, uid))
+    if not open_session(conn, uid, now, desc_enc):
+        conn.rollback()
+        UI.print(f"[bold yellow]{T('timer_already_running')}[/bold yellow]", title="Info", border_style="yellow")
+        return
     conn.commit()
-    conn.close()
+    write_status_file(conn, uid, now, get_day_start_hour())
     
     log_audit("CMD_ON", f"Started. Desc: {description or 'None'}")
     
@@ -623,20 +893,24 @@ def stop_timer():
     ensure_logged_in()
     
     conn = get_db_connection()
-    start_time = get_active_session_start(conn)
-    if not start_time:
+    active = get_active_session(conn)
+    if not active:
         UI.print(f"[bold yellow]{T('timer_not_running')}[/bold yellow]", title="Info", border_style="yellow")
-        conn.close()
         return
 
     now = datetime.now()
-    duration = calculate_duration(start_time, now)
     uid = get_current_user_id()
     
-    conn.execute("INSERT INTO events (timestamp, event_type, user_id) VALUES (?, ?, ?)", 
-                 (now.isoformat(), 'STOP', uid))
+    # STOP event, session, rollup and state row land in the same transaction
+    hour = get_day_start_hour()
+    seconds = close_session(conn, uid, active, now, hour)
+    if seconds is None:
+        conn.rollback()
+        UI.print(f"[bold yellow]{T('timer_not_running')}[/bold yellow]", title="Info", border_style="yellow")
+        return
     conn.commit()
-    conn.close()
+    write_status_file(conn, uid, now, hour)
+    duration = timedelta(seconds=seconds)
     
     log_audit("CMD_OFF", f"Stopped. Duration: {format_duration(duration)}")
     
@@ -652,9 +926,8 @@ def current_time():
     """Show current session time."""
     init_db()
     ensure_logged_in()
-    conn = get_db_connection()
-    start_time = get_active_session_start(conn)
-    conn.close()
+    with DB.scope(read_only=True) as conn:
+        start_time = get_active_session_start(conn)
 
     if start_time:
         duration = calculate_duration(start_time, datetime.now())
@@ -663,54 +936,104 @@ def current_time():
     else:
         UI.print(f"[dim]{T('timer_inactive')}[/dim]", title="Status", border_style="dim")
 
-def calculate_daily_total(target_date: datetime) -> timedelta:
-    conn = get_db_connection()
+@profiled("query")
+def calculate_range_total(start_date: datetime, end_date: datetime) -> timedelta:
+    """Total time for whole days start_date..end_date (inclusive), read from the daily rollup."""
     uid = get_current_user_id()
-    date_str = target_date.strftime("%Y-%m-%d")
-    cursor = conn.execute(
-        "SELECT timestamp, event_type FROM events WHERE timestamp LIKE ? AND user_id=? ORDER BY timestamp ASC", 
-        (f"{date_str}%", uid)
-    )
-    events = cursor.fetchall()
-    conn.close()
+    with DB.scope(read_only=True) as conn:
+        return timedelta(seconds=range_total_seconds(conn, uid, start_date, end_date, datetime.now(), get_day_start_hour()))
 
-    total_duration = timedelta()
-    session_start = None
+def get_today() -> datetime:
+    """Start of the current tracking day (yesterday's date before DAY-START's hour)."""
+    hour = get_day_start_hour()
+    return day_start(logical_date(datetime.now(), hour), hour)
 
-    for event in events:
-        ts = datetime.fromisoformat(event['timestamp'])
-        etype = event['event_type']
-
-        if etype == 'START':
-            if session_start is None:
-                session_start = ts
-        elif etype == 'STOP':
-            if session_start:
-                total_duration += (ts - session_start)
-                session_start = None
-
-    if session_start:
-        if target_date.date() == datetime.now().date():
-             total_duration += (datetime.now() - session_start)
-    
-    return total_duration
+def calculate_daily_total(target_date: datetime) -> timedelta:
+    return calculate_range_total(target_date, target_date)
 
 @app.command(name="TIME-TODAY")
 def time_today():
     """Show total time worked today."""
     init_db()
     ensure_logged_in()
-    now = datetime.now()
-    total = calculate_daily_total(now)
+    today = get_today()
+    total = calculate_daily_total(today)
     
-    UI.print(f"{T('total_time_today')} ([cyan]{now.strftime('%d/%m/%Y')}[/cyan])\n[bold green]{format_duration(total)}[/bold green] 📅", 
+    UI.print(f"{T('total_time_today')} ([cyan]{today.strftime('%d/%m/%Y')}[/cyan])\n[bold green]{format_duration(total)}[/bold green] 📅", 
              title=T('daily_summary'), border_style="green", box_type=box.DOUBLE)
 
+@app.command(name="PROMPT")
+def prompt(today: bool = typer.Option(False, "--today", help="Today's total instead of the running session.")):
+    """Elapsed time for PS1/tmux, read from the status file (no DB access)."""
+    # Normally answered by fast_path before this module loads; kept for --help and imports
+    text = prompt_text(today=today)
+    if text:
+        print(text)
+
 @app.command(name="DB")
 def show_db_path():
     """Show database path."""
     UI.print(f"[bold]{T('database_path')}:[/bold]\n[blue]{DB_PATH}[/blue] 📂", title="Configuration", border_style="blue")
 
+@app.command(name="DB-PROFILE")
+def db_profile(name: Optional[str] = typer.Argument(None)):
+    """Show or set the storage profile (default, shared, performance)."""
+    init_db()
+    if name:
+        name = name.lower()
+        if name not in DB_PROFILES:
+            UI.print(f"[red]Invalid profile. Use: {', '.join(DB_PROFILES)}[/red]", border_style="red")
+            return
+        set_config("db_profile", name)
+        # Re-open so the new PRAGMAs (journal mode included) take effect now
+        DB.close()
+
+    conn = get_db_connection()
+    active = get_db_profile_name()
+    rows = [(pragma, conn.execute(f"PRAGMA {pragma}").fetchone()[0]) for pragma in DB_PROFILES[active]]
+    source = f" ({DB_PROFILE_ENV})" if os.environ.get(DB_PROFILE_ENV) else ""
+    UI.print(f"Profile: [bold cyan]{active}[/bold cyan]{source}", title="Configuration", border_style="blue")
+    UI.table([("PRAGMA", "cyan"), ("Value", "white")], rows)
+
+@app.command(name="DAY-START")
+def day_start_cmd(hour: Optional[int] = typer.Argument(None)):
+    """Show or set the hour (0-23) at which a tracking day begins."""
+    init_db()
+    if hour is not None:
+        if not 0 <= hour <= 23:
+            UI.print("[red]Invalid hour. Use 0-23.[/red]", border_style="red")
+            return
+        # Daily totals are stored per tracking day: re-split them, committed together with the setting
+        rebuild_daily_totals(get_db_connection(), hour)
+        set_config("day_start_hour", str(hour))
+        refresh_status_file()
+        log_audit("DAY_START", str(hour))
+
+    UI.print(T('day_start_is').format(hour=f"{get_day_start_hour():02d}:00"), title="Configuration", border_style="blue")
+
+def backup_database() -> (str, Path):
+    """Snapshot the DB and logs into backup/backup_<timestamp>/. Shared by BACKUP and BACKUP-AUTO."""
+    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
+    backup_name = f"{DB_NAME}_{timestamp}"
+    backup_folder = BACKUP_DIR / f"backup_{timestamp}"
+    backup_folder.mkdir(parents=True, exist_ok=True)
+    
+    backup_path = backup_folder / DB_NAME
+    
+    # Online backup API: consistent snapshot that includes pages still in the -wal file
+    target = sqlite3.connect(backup_path)
+    try:
+        get_db_connection().backup(target)
+    finally:
+        target.close()
+    
+    # Backup Logs
+    if LOGS_DIR.exists():
+        log_backup = backup_folder / "logs"
+        shutil.copytree(LOGS_DIR, log_backup, dirs_exist_ok=True) # Same minute as another backup
+    
+    return backup_name, backup_folder
+
 @app.command(name="BACKUP")
 def backup_db():
     """Backup the database."""
@@ -725,24 +1048,11 @@ def backup_db():
         UI.print(f"[bold red]{T('database_exist_error')}[/bold red]", border_style="red")
         return
     
-    timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M")
-    backup_name = f"{DB_NAME}_{timestamp}"
-    backup_folder = BACKUP_DIR / f"backup_{timestamp}"
-    backup_folder.mkdir(parents=True, exist_ok=True)
-    
-    backup_path = backup_folder / DB_NAME
-    
-    shutil.copy(DB_PATH, backup_path)
-    
-    # Backup Logs
-    if LOGS_DIR.exists():
-        log_backup = backup_folder / "logs"
-        shutil.copytree(LOGS_DIR, log_backup)
-    
+    backup_name, backup_folder = backup_database()
     log_audit("BACKUP", f"Created backup at {backup_folder}")
     
     UI.print(f"{T('backup_created')}: [bold green]{backup_name}[/bold green]\n{T('location')}: [blue]{backup_folder}[/blue] 💾", 
-             title="Backup Success", border_style="green", box=box.ROUNDED)
+             title="Backup Success", border_style="green", box_type=box.ROUNDED)
 
 @app.command(name="TIME-SELECT")
 def time_select(date_str: str = typer.Argument(..., metavar="dd/mm/yyyy")):
@@ -752,7 +1062,7 @@ def time_select(date_str: str = typer.Argument(..., metavar="dd/mm/yyyy")):
     target_date = parse_date(date_str)
     total = calculate_daily_total(target_date)
     UI.print(f"{T('total_time_on')} [cyan]{date_str}[/cyan]\n[bold magenta]{format_duration(total)}[/bold magenta] 🗓️", 
-             title=T('historical_data'), border_style="magenta", box=box.ROUNDED)
+             title=T('historical_data'), border_style="magenta", box_type=box.ROUNDED)
 
 @app.command(name="TIME-RANGE")
 def time_range(start_date_str: str = typer.Argument(..., metavar="dd/mm/yyyy"), end_date_str: str = typer.Argument(..., metavar="dd/mm/yyyy")):
@@ -762,33 +1072,98 @@ def time_range(start_date_str: str = typer.Argument(..., metavar="dd/mm/yyyy"),
     start_date = parse_date(start_date_str)
     end_date = parse_date(end_date_str)
     
-    total_duration = timedelta()
-    current_date = start_date
-    while current_date <= end_date:
-        total_duration += calculate_daily_total(current_date)
-        current_date += timedelta(days=1)
+    total_duration = calculate_range_total(start_date, end_date)
         
     UI.print(f"Range: [cyan]{start_date_str}[/cyan] - [cyan]{end_date_str}[/cyan]\n"
              f"{T('total_time')}: [bold orange1]{format_duration(total_duration)}[/bold orange1] 📊",
-             title=T('range_summary'), border_style="orange1", box=box.ROUNDED)
+             title=T('range_summary'), border_style="orange1", box_type=box.ROUNDED)
+
+STATS_UNITS = ("week", "month", "year")
+
+@profiled("query")
+def calculate_stats(unit: str, lo: Optional[datetime], hi: datetime) -> dict:
+    """
+    bucket_rollup() per week/month/year over [lo, hi) (lo None: from the first session),
+    in one ordered scan of sessions plus the running one up to now.
+    """
+    uid = get_current_user_id()
+    with DB.scope(read_only=True) as conn:
+        intervals = session_spans(conn, uid, lo.isoformat() if lo else "", hi.isoformat())
+        active = get_active_timer(conn, uid)
+        if active:
+            intervals = chain(intervals, [(active['ts_epoch'], max(active['ts_epoch'], to_epoch(datetime.now())))])
+        return bucket_rollup(intervals, calendar_buckets(unit, get_day_start_hour()),
+                             to_epoch(lo) if lo else float("-inf"), to_epoch(hi))
+
+@app.command(name="TIME-STATS")
+def time_stats(start_date_str: Optional[str] = typer.Argument(None, metavar="[dd/mm/yyyy]"),
+               end_date_str: Optional[str] = typer.Argument(None, metavar="[dd/mm/yyyy]"),
+               by: str = typer.Option("week", "--by", help="week, month or year."),
+               as_json: bool = typer.Option(False, "--json", help="Print JSON instead of a table.")):
+    """Totals, session count, average session and first start per week/month/year. No dates: everything."""
+    init_db()
+    ensure_logged_in()
+    by = by.lower()
+    if by not in STATS_UNITS:
+        UI.print(f"[red]{T('stats_invalid_unit')}: {', '.join(STATS_UNITS)}[/red]", border_style="red")
+        return
+    hour = get_day_start_hour()
+    lo = day_start(parse_date(start_date_str).date(), hour) if start_date_str else None
+    end = parse_date(end_date_str) if end_date_str else get_today()
+    hi = day_start(end.date() + timedelta(days=1), hour)
+
+    stats = sorted(calculate_stats(by, lo, hi).items())
+
+    if as_json:
+        import json
+        print(json.dumps([
+            {"period": key, "seconds": round(seconds), "sessions": started,
+             "average_seconds": round(length / started) if started else 0,
+             "first_start": datetime.fromtimestamp(first).isoformat()}
+            for key, (seconds, started, first, length) in stats
+        ], indent=2))
+        return
+
+    if not stats:
+        UI.print(f"[yellow]{T('stats_empty')}[/yellow]", border_style="yellow")
+        return
+    columns = [(T("header_period"), "cyan"), (T("total_time"), "bold magenta"), (T("header_sessions"), "white"),
+               (T("header_average"), "green"), (T("header_first_start"), "yellow")]
+    # One row per week over decades of history: stream_table, not a measured rich Table
+    UI.stream_table(columns, (
+        (key, format_duration(timedelta(seconds=seconds)), started,
+         format_duration(timedelta(seconds=length / started)) if started else "-",
+         datetime.fromtimestamp(first).strftime("%d/%m/%Y %H:%M"))
+        for key, (seconds, started, first, length) in stats
+    ), widths=[8, 10, 8, 8, None])
+
+@profiled("query")
+def get_first_start(target_date: datetime) -> Optional[datetime]:
+    """
+    First START of that tracking day: the earliest session begun in it, or the running one.
+    A session carried over from the night before began the day before, so it doesn't count.
+    """
+    uid = get_current_user_id()
+    hour = get_day_start_hour()
+    lo, hi = day_start(target_date.date(), hour), day_start(target_date.date() + timedelta(days=1), hour)
+    with DB.scope(read_only=True) as conn:
+        row = conn.execute("SELECT MIN(start) AS first FROM sessions WHERE user_id=? AND start >= ? AND start < ?",
+                           (uid, lo.isoformat(), hi.isoformat())).fetchone()
+        active_start = get_active_session_start(conn)
+
+    candidates = [datetime.fromisoformat(row['first'])] if row['first'] else []
+    if active_start and lo <= active_start < hi:
+        candidates.append(active_start)
+    return min(candidates) if candidates else None
 
 @app.command(name="INIT-TIME")
 def init_time():
     """Show first start time today."""
     init_db()
     ensure_logged_in()
-    today_str = get_today_str()
-    conn = get_db_connection()
-    uid = get_current_user_id()
-    cursor = conn.execute(
-        "SELECT timestamp FROM events WHERE timestamp LIKE ? AND event_type='START' AND user_id=? ORDER BY timestamp ASC LIMIT 1",
-        (f"{today_str}%", uid)
-    )
-    row = cursor.fetchone()
-    conn.close()
+    first_time = get_first_start(get_today())
     
-    if row:
-        first_time = datetime.fromisoformat(row['timestamp'])
+    if first_time:
         UI.print(f"{T('first_start_today')}:\n[bold cyan]{first_time.strftime('%H:%M:%S')}[/bold cyan] 🌅", 
                  title="Start Time", border_style="cyan", box_type=box.ROUNDED)
     else:
@@ -800,24 +1175,232 @@ def init_time_when(date_str: str = typer.Argument(..., metavar="dd/mm/yyyy")):
     init_db()
     ensure_logged_in()
     target_date = parse_date(date_str)
-    date_iso_prefix = target_date.strftime("%Y-%m-%d")
-    uid = get_current_user_id()
+    first_time = get_first_start(target_date)
     
-    conn = get_db_connection()
-    cursor = conn.execute(
-        "SELECT timestamp FROM events WHERE timestamp LIKE ? AND event_type='START' AND user_id=? ORDER BY timestamp ASC LIMIT 1",
-        (f"{date_iso_prefix}%", uid)
-    )
-    row = cursor.fetchone()
-    conn.close()
-    
-    if row:
-        first_time = datetime.fromisoformat(row['timestamp'])
+    if first_time:
         UI.print(f"{T('first_start_on')} [cyan]{date_str}[/cyan]:\n[bold cyan]{first_time.strftime('%H:%M:%S')}[/bold cyan] 🗓️", title="Historical Start Time", border_style="cyan")
     else:
         UI.print(f"[dim]{T('no_sessions_found')} {date_str}.[/dim]", title="Historical Start Time", border_style="dim")
 
 
+# --- Batch ---
+# BATCH replays many operations in one process: one connection, one transaction, a savepoint per
+# line so a bad line is undone on its own. Writes go through the same helpers as ON/OFF.
+
+BATCH_OPS = ("ON", "OFF", "TIME", "TIME-TODAY", "LANG-SET", "FAST-MODE", "NORMAL-MODE")
+
+def parse_when(value: str) -> datetime:
+    """'dd/mm/yyyy HH:MM[:SS]' (the CLI's date style) or ISO 8601."""
+    for fmt in ("%d/%m/%Y %H:%M:%S", "%d/%m/%Y %H:%M"):
+        try:
+            return datetime.strptime(value, fmt)
+        except ValueError:
+            pass
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        raise ValueError(f"Invalid time '{value}'. Use 'dd/mm/yyyy HH:MM' or ISO 8601.")
+
+def parse_batch_line(line: str) -> (str, list, Optional[str]):
+    """Text (`ON "Task" --at "31/01/2024 09:00"`) or JSON ({"op": "ON", "args": ["Task"], "at": "..."})."""
+    import shlex
+    if line.startswith("{"):
+        import json
+        item = json.loads(line)
+        op, args, at = item.get("op", ""), item.get("args", []), item.get("at")
+        if not isinstance(op, str):
+            raise ValueError('"op" must be a string')
+        if not isinstance(args, list) or not all(isinstance(a, str) for a in args):
+            raise ValueError('"args" must be a list of strings')
+        if at is not None and not isinstance(at, str):
+            raise ValueError('"at" must be a string')
+        return op.upper(), args, at
+
+    tokens = shlex.split(line)
+    at = None
+    if "--at" in tokens:
+        i = tokens.index("--at")
+        if i + 1 >= len(tokens):
+            raise ValueError("--at needs a value")
+        at = tokens[i + 1]
+        del tokens[i:i + 2]
+    return tokens[0].upper(), tokens[1:], at
+
+def run_batch_op(conn, uid, op: str, args: list, at: Optional[str]) -> str:
+    """Apply one operation inside the caller's transaction. Returns the result text, raises ValueError."""
+    if op not in BATCH_OPS:
+        raise ValueError(f"Unsupported in BATCH: {op or '(empty)'}. Use: {', '.join(BATCH_OPS)}")
+    if len(args) > (1 if op in ("ON", "LANG-SET") else 0):
+        raise ValueError(f"Too many arguments for {op}")
+    now = datetime.now()
+    when = parse_when(at) if at else now
+    if when > now:
+        raise ValueError("--at is in the future")
+
+    if op == "ON":
+        if get_active_timer(conn, uid):
+            raise ValueError(T('timer_already_running'))
+        last = conn.execute("SELECT MAX(ts_epoch) AS e FROM events WHERE user_id=?", (uid,)).fetchone()['e']
+        if last is not None and to_epoch(when) < last:
+            raise ValueError("--at is before the latest recorded event")
+        description = args[0] if args else None
+        open_session(conn, uid, when, encrypt_text(description) if description else None)
+        return f"{T('timer_started')} {when.strftime('%d/%m/%Y %H:%M:%S')}"
+
+    if op == "OFF":
+        active = get_active_timer(conn, uid)
+        if not active:
+            raise ValueError(T('timer_not_running'))
+        if to_epoch(when) < active['ts_epoch']:
+            raise ValueError("--at is before the running session started")
+        seconds = close_session(conn, uid, active, when, get_day_start_hour())
+        return f"{T('timer_stopped')} {when.strftime('%d/%m/%Y %H:%M:%S')} ({format_duration(timedelta(seconds=seconds))})"
+
+    if op == "TIME":
+        active = get_active_timer(conn, uid)
+        if not active:
+            return T('timer_inactive')
+        return format_duration(when - datetime.fromtimestamp(active['ts_epoch']))
+
+    if op == "TIME-TODAY":
+        hour = get_day_start_hour()
+        today = day_start(logical_date(when, hour), hour)
+        return format_duration(timedelta(seconds=range_total_seconds(conn, uid, today, today, when, hour)))
+
+    # Config setters: written in the transaction, the snapshot is refreshed after commit
+    if op == "LANG-SET":
+        code = args[0].upper() if args else ""
+        if code not in LANGUAGES:
+            raise ValueError(f"Invalid code. Available: {', '.join(LANGUAGES)}")
+        key, value = "language", code
+    else:
+        key, value = "ui_mode", "fast" if op == "FAST-MODE" else "normal"
+    conn.execute("INSERT OR REPLACE INTO config (key, value) VALUES (?, ?)", (key, value))
+    return f"{key} = {value}"
+
+@app.command(name="BATCH")
+def batch(source: Optional[str] = typer.Argument(None, help="File with one operation per line (default: stdin)."),
+          dry_run: bool = typer.Option(False, "--dry-run", help="Run and report every line, then roll back.")):
+    """Run many operations (ON/OFF with --at, TIME, LANG-SET...) in one process and one transaction."""
+    init_db()
+    ensure_logged_in()
+    uid = get_current_user_id()
+    conn = get_db_connection()
+
+    if source in (None, "-"):
+        stream = sys.stdin
+    else:
+        try:
+            stream = open(source, encoding="utf-8")
+        except OSError as e:
+            UI.print(f"[bold red]Cannot read {source}: {e.strerror}[/bold red]", border_style="red")
+            raise typer.Exit(code=1)
+    ok = failed = 0
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE") # Take the write lock once for the whole batch
+    try:
+        for lineno, line in enumerate(stream, 1):
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            conn.execute("SAVEPOINT batch_line")
+            try:
+                op, args, at = parse_batch_line(line)
+                result = run_batch_op(conn, uid, op, args, at)
+                conn.execute("RELEASE batch_line")
+                ok += 1
+                print(f"{lineno}\tOK\t{result}", flush=True)
+            except (ValueError, sqlite3.Error) as e: # json.JSONDecodeError is a ValueError
+                conn.execute("ROLLBACK TO batch_line")
+                conn.execute("RELEASE batch_line")
+                failed += 1
+                print(f"{lineno}\tERROR\t{e}", flush=True)
+
+        if dry_run:
+            conn.rollback()
+        else:
+            conn.commit()
+            load_config_snapshot(force=True)
+            reset_language()
+            write_status_file(conn, uid, hour=get_day_start_hour())
+            log_audit("BATCH", f"{ok} ok, {failed} failed")
+    except BaseException:
+        conn.rollback()
+        raise
+    finally:
+        if stream is not sys.stdin:
+            stream.close()
+
+    summary = f"{ok} OK, {failed} ERROR"
+    if dry_run:
+        UI.print(f"[yellow]{summary}. {T('batch_dry_run')}[/yellow]", title="Batch", border_style="yellow")
+    else:
+        UI.print(f"[bold green]{summary}[/bold green]", title="Batch", border_style="green" if not failed else "yellow")
+    if failed:
+        raise typer.Exit(code=1) # Scripts replaying a batch must see that part of it failed
+
+@app.command(name="ROLLUP-CHECK")
+def rollup_check(fix: bool = typer.Option(False, "--fix", help="Rebuild drifted days from raw events.")):
+    """Recompute daily totals from raw events and report drift."""
+    init_db()
+    ensure_logged_in()
+    uid = get_current_user_id()
+    conn = get_db_connection()
+
+    # Source of truth: pair the raw events again and cut the sessions at day starts
+    hour = get_day_start_hour()
+    day_of = calendar_buckets("day", hour)
+    by_start_day = {}
+    rows = conn.execute("SELECT timestamp, ts_epoch, event_type, description, user_id FROM events WHERE user_id=? ORDER BY ts_epoch, id", (uid,))
+
+    def intervals():
+        for session in pair_events(rows):
+            start = to_epoch(datetime.fromisoformat(session[1]))
+            if fix: # Only a rebuild needs the sessions themselves
+                by_start_day.setdefault(day_of(start)[0], []).append(session)
+            yield start, start + session[3]
+
+    expected = day_rollup(intervals(), hour)
+    stored = {row['day']: row for row in conn.execute("SELECT day, seconds, sessions FROM daily_totals WHERE user_id=?", (uid,))}
+
+    drift = []
+    for day in sorted(set(expected) | set(stored)):
+        want_seconds, want_count, _ = expected.get(day, (0, 0, 0))
+        have_seconds = stored[day]['seconds'] if day in stored else 0
+        have_count = stored[day]['sessions'] if day in stored else 0
+        if have_count != want_count or abs(have_seconds - want_seconds) >= 0.5:
+            drift.append((day, have_count, want_count,
+                          format_duration(timedelta(seconds=have_seconds)), format_duration(timedelta(seconds=want_seconds))))
+
+    if not drift:
+        UI.print(f"[bold green]Rollups consistent ({len(stored)} days).[/bold green]", border_style="green")
+        return
+
+    UI.table([("Day", "cyan"), ("Stored", "white"), ("Events", "white"), ("Stored Total", "yellow"), ("Events Total", "green")], drift)
+
+    if fix:
+        days = [d[0] for d in drift]
+        touched = set(days)
+        for day in days:
+            d = datetime.strptime(day, "%Y-%m-%d").date()
+            conn.execute("DELETE FROM sessions WHERE user_id=? AND start >= ? AND start < ?",
+                         (uid, day_start(d, hour).isoformat(), day_start(d + timedelta(days=1), hour).isoformat()))
+            sessions = by_start_day.get(day, [])
+            conn.executemany(
+                "INSERT INTO sessions (user_id, start, end, duration_seconds, description) VALUES (?, ?, ?, ?, ?)", sessions
+            )
+            # A rebuilt night shift also changes the days it runs into
+            touched.update(day_rollup([(to_epoch(datetime.fromisoformat(s[1])), to_epoch(datetime.fromisoformat(s[2]))) for s in sessions], hour))
+        refresh_daily_totals(conn, uid, touched, hour)
+        sync_active_timer(conn, uid)
+        conn.commit()
+        refresh_status_file()
+        log_audit("ROLLUP-FIX", f"Rebuilt {len(days)} days")
+        UI.print(f"[bold green]Rebuilt {len(days)} days from events.[/bold green]", border_style="green")
+    else:
+        UI.print(f"[yellow]{len(drift)} days drifted. Run 'work ROLLUP-CHECK --fix' to rebuild them.[/yellow]", border_style="yellow")
+
 @app.command(name="CLEAR-ALL")
 def clear_all():
     """Clear all database data for current user."""
@@ -834,8 +1417,11 @@ def clear_all():
     conn = get_db_connection()
     uid = get_current_user_id()
     conn.execute("DELETE FROM events WHERE user_id=?", (uid,))
+    conn.execute("DELETE FROM sessions WHERE user_id=?", (uid,))
+    conn.execute("DELETE FROM daily_totals WHERE user_id=?", (uid,))
+    conn.execute("DELETE FROM active_timers WHERE user_id=?", (uid,))
     conn.commit()
-    conn.close()
+    refresh_status_file()
     console.print(Panel(f"[bold red]{T('database_cleared')}[/bold red]", title="Warning", border_style="red", box=box.HEAVY))
 
 @app.command(name="LANG")
@@ -854,26 +1440,26 @@ def set_lang_command(code: Optional[str] = typer.Argument(None)):
     
     if code:
         code = code.upper()
-        if code in TRANSLATIONS:
+        if code in LANGUAGES:
             set_config("language", code)
-            new_lang_text = TRANSLATIONS[code]["language_updated"]
+            new_lang_text = get_text("language_updated", code)
             UI.print(f"[bold green]{new_lang_text} {code}![/bold green]", border_style="green")
             return
         else:
              console.print(f"[yellow]Invalid code '{code}'. Showing menu...[/yellow]")
 
     console.print(f"[bold]{T('language_select')}:[/bold]")
-    for code_key in TRANSLATIONS.keys():
+    for code_key in LANGUAGES:
         marker = "(*)" if code_key == current else "   "
         console.print(f"{marker} {code_key}")
         
     choice = typer.prompt("Code").upper()
-    if choice in TRANSLATIONS:
+    if choice in LANGUAGES:
         set_config("language", choice)
-        new_lang_text = TRANSLATIONS[choice]["language_updated"]
+        new_lang_text = get_text("language_updated", choice)
         UI.print(f"[bold green]{new_lang_text} {choice}![/bold green]", border_style="green")
     else:
-        console.print(f"[red]Invalid code. Available: {', '.join(TRANSLATIONS.keys())}[/red]")
+        console.print(f"[red]Invalid code. Available: {', '.join(LANGUAGES)}[/red]")
 
 
 # --- AI Commands ---
@@ -925,7 +1511,6 @@ def ai_gen_ask(question: str):
              conn = get_db_connection()
              cursor = conn.execute("SELECT timestamp, event_type FROM events ORDER BY timestamp ASC")
              events = [dict(row) for row in cursor.fetchall()]
-             conn.close()
              context = handler.format_context(events)
              response = handler.ask_ai(question, context)
              UI.print(response, title=f"🤖 {provider} Response", border_style="magenta")
@@ -940,7 +1525,6 @@ def ai_gen_ask(question: str):
                 conn = get_db_connection()
                 cursor = conn.execute("SELECT timestamp, event_type FROM events ORDER BY timestamp ASC")
                 events = [dict(row) for row in cursor.fetchall()]
-                conn.close()
                 
                 context = handler.format_context(events)
                 response = handler.ask_ai(question, context)
@@ -986,7 +1570,6 @@ def ai_range_ask(start_date_str: str, end_date_str: str, question: str):
                 (s_iso, e_iso)
             )
             events = [dict(row) for row in cursor.fetchall()]
-            conn.close()
             
             handler = AIHandler(provider, api_key)
             context = handler.format_context(events)
@@ -1000,36 +1583,74 @@ def ai_range_ask(start_date_str: str, end_date_str: str, question: str):
 
 # --- Export Commands ---
 
+class Session:
+    """
+    One finished session: epoch start/end plus the description as stored (maybe encrypted).
+    Dates, times and the description are formatted or decrypted only when read.
+    """
+    __slots__ = ("start_epoch", "end_epoch", "raw_description")
+
+    def __init__(self, start_epoch: int, end_epoch: int, raw_description: Optional[str] = None):
+        self.start_epoch = start_epoch
+        self.end_epoch = end_epoch
+        self.raw_description = raw_description
+
+    @property
+    def seconds(self) -> int:
+        return self.end_epoch - self.start_epoch
+
+    @property
+    def duration(self) -> timedelta:
+        return timedelta(seconds=self.seconds)
+
+    @property
+    def date(self) -> str:
+        return time.strftime("%Y-%m-%d", time.localtime(self.start_epoch))
+
+    @property
+    def start(self) -> str:
+        return time.strftime("%H:%M:%S", time.localtime(self.start_epoch))
+
+    @property
+    def end(self) -> str:
+        return time.strftime("%H:%M:%S", time.localtime(self.end_epoch))
+
+    @property
+    def duration_str(self) -> str:
+        return format_duration(self.duration)
+
+    @property
+    def description(self) -> str:
+        return decrypt_text(self.raw_description or '')
+
+    def __eq__(self, other):
+        return isinstance(other, Session) and (self.start_epoch, self.end_epoch, self.raw_description) == \
+            (other.start_epoch, other.end_epoch, other.raw_description)
+
+    def __repr__(self):
+        return f"Session({self.date} {self.start}-{self.end}, {self.duration_str})"
+
+@profiled("sessions")
 def process_sessions(events):
     """
     Process raw events into sessions (Start -> Stop).
-    Returns list of dicts: {date, start, end, duration}
+    Returns a list of Session.
+    Reference implementation of the pairing rule: pair_event_rows must agree with it.
     """
     sessions = []
     session_start = None
     session_desc = None
     
     for ev in events:
-        ts = datetime.fromisoformat(ev['timestamp'])
         etype = ev['event_type']
         
         if etype == 'START':
             if session_start is None:
-                session_start = ts
-                # Decrypt here
-                raw_desc = ev.get('description', '') or ''
-                session_desc = decrypt_text(raw_desc)
+                session_start = to_epoch(datetime.fromisoformat(ev['timestamp']))
+                session_desc = ev.get('description')
         elif etype == 'STOP':
-            if session_start:
-                duration = ts - session_start
-                sessions.append({
-                    "date": session_start.strftime("%Y-%m-%d"),
-                    "start": session_start.strftime("%H:%M:%S"),
-                    "end": ts.strftime("%H:%M:%S"),
-                    "duration": duration, # Timedelta
-                    "duration_str": format_duration(duration),
-                    "description": session_desc
-                })
+            if session_start is not None:
+                sessions.append(Session(session_start, to_epoch(datetime.fromisoformat(ev['timestamp'])), session_desc))
                 session_start = None
                 session_desc = None
             
@@ -1037,10 +1658,71 @@ def process_sessions(events):
     # For export, usually we export finished sessions.
     return sessions
 
+# Row sources below yield (id, start epoch, end epoch, raw description) straight off the
+# cursor; iter_sessions streams them one Session at a time. Nothing collects them into
+# columns: exports must run in constant memory, and totals come from daily_totals.
+
+def pair_event_rows(conn, uid, s_iso: str, e_iso: str):
+    """
+    Pair a user's raw events in SQL, for databases older than the sessions table. Keeping
+    only the first event of every run of equal types leaves START/STOP alternating, so each
+    STOP head closes the START head before it: the same pairs as process_sessions.
+    """
+    cursor = conn.execute('''
+        WITH ev AS (
+            SELECT rowid AS id, user_id, timestamp, event_type, description,
+                   LAG(event_type) OVER (PARTITION BY user_id ORDER BY timestamp, rowid) AS prev_type
+            FROM events WHERE user_id = ? AND timestamp >= ? AND timestamp < ?
+        ), heads AS (
+            SELECT timestamp, event_type,
+                   LAG(id) OVER w AS start_id, LAG(timestamp) OVER w AS start_ts,
+                   LAG(event_type) OVER w AS start_type, LAG(description) OVER w AS start_desc
+            FROM ev WHERE prev_type IS NOT event_type
+            WINDOW w AS (PARTITION BY user_id ORDER BY timestamp, id)
+        )
+        SELECT start_id, start_ts, timestamp, start_desc FROM heads
+        WHERE event_type = 'STOP' AND start_type = 'START'
+    ''', (uid, s_iso, e_iso))
+    for sid, start, end, desc in cursor:
+        # Epochs as to_epoch computes them, so pairs match process_sessions exactly
+        yield sid, to_epoch(datetime.fromisoformat(start)), to_epoch(datetime.fromisoformat(end)), desc
+
+def session_rows(conn, uid, s_iso: str, e_iso: str) -> sqlite3.Cursor:
+    """Finished sessions of a user that started in [s_iso, e_iso), whole. Single indexed range read."""
+    return conn.execute(
+        # Local ISO -> epoch in SQLite (the 'utc' modifier reads local time), as in the v3 backfill
+        "SELECT id, CAST(strftime('%s', start, 'utc') AS INTEGER), CAST(strftime('%s', end, 'utc') AS INTEGER), description "
+        "FROM sessions WHERE user_id=? AND start >= ? AND start < ? ORDER BY start ASC",
+        (uid, s_iso, e_iso)
+    )
+
+def session_spans(conn, uid, s_iso: str, e_iso: str):
+    """
+    (start epoch, end epoch) of the sessions that started in [s_iso, e_iso), plus the one before that
+    may run into it (a user's sessions never overlap, so there is at most one). Read from the
+    (user_id, start, duration_seconds) index alone: one date conversion per row instead of two.
+    """
+    rows = conn.execute(
+        "SELECT CAST(strftime('%s', start, 'utc') AS INTEGER), duration_seconds FROM sessions "
+        "WHERE user_id=? AND start >= COALESCE((SELECT MAX(start) FROM sessions WHERE user_id=? AND start < ?), ?) AND start < ? "
+        "ORDER BY start ASC",
+        (uid, uid, s_iso, s_iso, e_iso)
+    )
+    return ((start, start + seconds) for start, seconds in rows)
+
+def day_range(start_date: datetime, end_date: datetime) -> (datetime, datetime):
+    """Whole tracking days start_date..end_date as local [lo, hi), honouring DAY-START."""
+    hour = get_day_start_hour()
+    return day_start(start_date.date(), hour), day_start(end_date.date() + timedelta(days=1), hour)
+
+def iter_sessions(rows):
+    """Session per row, lazily: memory stays flat however many rows the source yields."""
+    for _, start, end, desc in rows:
+        yield Session(start, end, desc)
+
 # --- Email & helpers ---
-import webbrowser
-import subprocess
 
+@profiled("render")
 def generate_csv_file(sessions, start_date_str, end_date_str) -> str:
     """Generate CSV file and return path."""
     import csv
@@ -1051,14 +1733,30 @@ def generate_csv_file(sessions, start_date_str, end_date_str) -> str:
         writer = csv.writer(file)
         writer.writerow([T('header_date'), T('header_start'), T('header_end'), T('header_duration'), T('header_desc')])
         for s in sessions:
-            writer.writerow([s['date'], s['start'], s['end'], s['duration_str'], s['description']])
+            writer.writerow([s.date, s.start, s.end, s.duration_str, s.description])
     return file_path
 
+@profiled("render")
 def generate_pdf_file(sessions, start_date_str, end_date_str) -> str:
-    """Generate PDF file and return path."""
+    """Generate PDF file and return path. sessions is read once, so a generator works too."""
     from xhtml2pdf import pisa
-    total_sessions = len(sessions)
-    total_duration = sum([s['duration'] for s in sessions], timedelta())
+    # The summary sits above the table: collect the rows while totalling in the same pass
+    total_sessions = 0
+    total_seconds = 0
+    rows = []
+    for s in sessions:
+        total_sessions += 1
+        total_seconds += s.seconds
+        rows.append(f"""
+            <tr>
+                <td>{s.date}</td>
+                <td>{s.start}</td>
+                <td>{s.end}</td>
+                <td>{s.duration_str}</td>
+                <td>{s.description}</td>
+            </tr>
+        """)
+    total_duration = timedelta(seconds=total_seconds)
     
     html = f"""
     <html>
@@ -1092,18 +1790,7 @@ def generate_pdf_file(sessions, start_date_str, end_date_str) -> str:
                 <th>{T('header_desc')}</th>
             </tr>
     """
-    
-    for s in sessions:
-        html += f"""
-            <tr>
-                <td>{s['date']}</td>
-                <td>{s['start']}</td>
-                <td>{s['end']}</td>
-                <td>{s['duration_str']}</td>
-                <td>{s['description']}</td>
-            </tr>
-        """
-        
+    html += "".join(rows)
     html += """
         </table>
     </body>
@@ -1122,22 +1809,14 @@ def generate_pdf_file(sessions, start_date_str, end_date_str) -> str:
 def export_csv(start_date_str: str, end_date_str: str):
     """Export work history to CSV."""
     init_db()
+    ensure_logged_in()
     try:
-        start_date = parse_date(start_date_str)
-        end_date = parse_date(end_date_str)
-        s_iso = start_date.strftime("%Y-%m-%dT00:00:00")
-        e_iso = (end_date + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
-        
-        conn = get_db_connection()
-        cursor = conn.execute(
-            "SELECT timestamp, event_type, description FROM events WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp ASC",
-            (s_iso, e_iso)
-        )
-        events = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        lo, hi = day_range(parse_date(start_date_str), parse_date(end_date_str))
+        uid = get_current_user_id()
         
-        sessions = process_sessions(events)
-        path = generate_csv_file(sessions, start_date_str, end_date_str)
+        with DB.scope(read_only=True) as conn:
+            rows = session_rows(conn, uid, lo.isoformat(), hi.isoformat())
+            path = generate_csv_file(iter_sessions(rows), start_date_str, end_date_str)
         UI.print(f"{T('export_csv_success')}:\n[blue]{path}[/blue] 📊", border_style="green")
 
     except Exception as e:
@@ -1147,30 +1826,314 @@ def export_csv(start_date_str: str, end_date_str: str):
 def export_pdf(start_date_str: str, end_date_str: str):
     """Export work history to PDF."""
     init_db()
+    ensure_logged_in()
     try:
-        start_date = parse_date(start_date_str)
-        end_date = parse_date(end_date_str)
-        s_iso = start_date.strftime("%Y-%m-%dT00:00:00")
-        e_iso = (end_date + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
-        
-        conn = get_db_connection()
-        cursor = conn.execute(
-            "SELECT timestamp, event_type, description FROM events WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp ASC",
-            (s_iso, e_iso)
-        )
-        events = [dict(row) for row in cursor.fetchall()]
-        conn.close()
+        lo, hi = day_range(parse_date(start_date_str), parse_date(end_date_str))
+        uid = get_current_user_id()
         
-        sessions = process_sessions(events)
-        path = generate_pdf_file(sessions, start_date_str, end_date_str)
+        with DB.scope(read_only=True) as conn:
+            rows = session_rows(conn, uid, lo.isoformat(), hi.isoformat())
+            path = generate_pdf_file(iter_sessions(rows), start_date_str, end_date_str)
         UI.print(f"{T('export_pdf_success')}:\n[blue]{path}[/blue] 📄", border_style="green")
 
     except Exception as e:
          UI.print(f"[bold red]Error: {e}[/bold red]", border_style="red")
 
+# --- History ---
+# HISTORY walks sessions with keyset pagination on (start, id): every page is one indexed
+# range read starting right after the last row shown, so the cost of a page does not grow
+# with how far into the history it is, and nothing beyond one page is held in memory.
+
+HISTORY_PAGE = 500
+
+def parse_history_cursor(value: str) -> (str, int):
+    """'<start ISO>,<id>' as printed by HISTORY --limit -> (start, id)."""
+    start, _, sid = value.rpartition(",")
+    try:
+        datetime.fromisoformat(start)
+        return start, int(sid)
+    except ValueError:
+        raise typer.BadParameter(f"{value!r} (expected <start>,<id>)", param_hint="--after")
+
+def iter_history(conn, uid, s_iso: str, e_iso: str, after: (str, int) = ("", 0), limit: Optional[int] = None):
+    """Yield sessions rows of a user in [s_iso, e_iso) ordered by (start, id), one page per query."""
+    while limit is None or limit > 0:
+        size = HISTORY_PAGE if limit is None else min(HISTORY_PAGE, limit)
+        rows = conn.execute(
+            "SELECT id, start, end, duration_seconds, description FROM sessions "
+            "WHERE user_id=? AND start >= ? AND start < ? AND (start, id) > (?, ?) "
+            "ORDER BY start, id LIMIT ?",
+            # SQLite only seeks the index on the plain bound, so fold the cursor into it
+            (uid, max(s_iso, after[0]), e_iso, after[0], after[1], size)
+        ).fetchall()
+        yield from rows
+        if len(rows) < size:
+            return
+        after = (rows[-1]['start'], rows[-1]['id'])
+        if limit is not None:
+            limit -= len(rows)
+
+@app.command(name="HISTORY")
+def history(start_date_str: Optional[str] = typer.Argument(None, metavar="[dd/mm/yyyy]"),
+            end_date_str: Optional[str] = typer.Argument(None, metavar="[dd/mm/yyyy]"),
+            limit: Optional[int] = typer.Option(None, "--limit", min=1, help="Show at most N sessions."),
+            after: Optional[str] = typer.Option(None, "--after", help="Continue after this cursor (printed by --limit).")):
+    """List finished sessions, oldest first. No dates: everything; one date: from that day on."""
+    init_db()
+    ensure_logged_in()
+    s_iso, e_iso = "", "9999"
+    if start_date_str:
+        # Same tracking days as EXPORT-CSV/PDF and SEND-TO, so the same dates list the same sessions
+        lo, hi = day_range(parse_date(start_date_str), parse_date(end_date_str or start_date_str))
+        s_iso = lo.isoformat()
+        if end_date_str:
+            e_iso = hi.isoformat()
+    cursor = parse_history_cursor(after) if after else ("", 0)
+    uid = get_current_user_id()
+    last = {}
+
+    def rows(conn):
+        # One row beyond --limit tells whether there is a next page
+        for n, row in enumerate(iter_history(conn, uid, s_iso, e_iso, cursor, limit + 1 if limit else None)):
+            if limit and n == limit:
+                last['more'] = True
+                return
+            last['key'] = f"{row['start']},{row['id']}"
+            start, end = row['start'], row['end']
+            yield (start[:10], start[11:19], end[11:19],
+                   format_duration(timedelta(seconds=row['duration_seconds'])),
+                   decrypt_text(row['description'] or ''))
+
+    columns = [(T("header_date"), "cyan"), (T("header_start"), "green"), (T("header_end"), "red"),
+               (T("header_duration"), "bold magenta"), (T("header_desc"), "white")]
+    try:
+        with DB.scope(read_only=True) as conn:
+            UI.stream_table(columns, rows(conn), widths=[10, 8, 8, 9, None])
+        if last.get('more'):
+            # stderr, so `work HISTORY --limit 50 > page.txt` keeps only the rows
+            dates = "".join(f"{d} " for d in (start_date_str, end_date_str) if d)
+            print(f"{T('history_next')}: work HISTORY {dates}--limit {limit} --after {last['key']}", file=sys.stderr)
+    except BrokenPipeError:
+        # Reader (head, a pager) went away: stop quietly instead of a traceback at exit
+        os.dup2(os.open(os.devnull, os.O_WRONLY), sys.stdout.fileno())
+
+# --- Import ---
+# IMPORT streams a file and writes in executemany batches inside one transaction, so memory stays
+# bounded by the batch size plus one open session and a set of touched days per user.
+
+IMPORT_BATCH_ROWS = 5000
+IMPORT_MAX_ERRORS_SHOWN = 20
+
+class ImportRecordError(ValueError):
+    """A record that fails validation; carries the input line number."""
+    def __init__(self, lineno: int, message: str):
+        super().__init__(f"line {lineno}: {message}")
+
+IMPORT_FORMATS = (".csv", ".jsonl", ".ndjson")
+
+def read_import_records(path: Path):
+    """
+    Yield (lineno, kind, user, when, description) per event, kind START/STOP.
+    Unparseable records come out as (lineno, "ERROR", None, None, message) so reading goes on.
+    """
+    if path.suffix.lower() == ".csv":
+        import csv
+        with open(path, newline="", encoding="utf-8") as f:
+            for lineno, row in enumerate(csv.reader(f), 1):
+                if not row:
+                    continue
+                # EXPORT-CSV layout: Date, Start, End, Duration, Description (header is translated)
+                try:
+                    if len(row[0]) != 10 or len(row[1]) != 8:
+                        raise ValueError
+                    start = datetime.fromisoformat(f"{row[0]}T{row[1]}") # C parser, ~10x strptime
+                except (ValueError, IndexError):
+                    if lineno != 1: # Else the (translated) header
+                        yield lineno, "ERROR", None, None, "expected Date,Start,End,Duration,Description"
+                    continue
+                try:
+                    if len(row) > 3 and row[3]:
+                        h, m, sec = (int(part) for part in row[3].split(":"))
+                        end = start + timedelta(hours=h, minutes=m, seconds=sec)
+                    else:
+                        end = datetime.fromisoformat(f"{row[0]}T{row[2]}")
+                        if end <= start:
+                            end += timedelta(days=1) # Crossed midnight
+                except (ValueError, IndexError):
+                    yield lineno, "ERROR", None, None, "bad End/Duration"
+                    continue
+                description = row[4] if len(row) > 4 and row[4] else None
+                yield lineno, "START", None, start, description
+                yield lineno, "STOP", None, end, None
+    else:
+        import json
+        with open(path, encoding="utf-8") as f:
+            for lineno, line in enumerate(f, 1):
+                if not line.strip():
+                    continue
+                # {"start", "end", "description"?, "user"?} or {"timestamp", "event_type", "description"?, "user"?}
+                try:
+                    item = json.loads(line)
+                    user = item.get("user")
+                    if "event_type" in item:
+                        events = [(item["event_type"].upper(), datetime.fromisoformat(item["timestamp"]), item.get("description"))]
+                    else:
+                        events = [("START", datetime.fromisoformat(item["start"]), item.get("description")),
+                                  ("STOP", datetime.fromisoformat(item["end"]), None)]
+                except (ValueError, KeyError, TypeError, AttributeError) as e:
+                    yield lineno, "ERROR", None, None, f"invalid record ({e})"
+                    continue
+                for kind, when, description in events:
+                    yield lineno, kind, user, when, description
+
+@app.command(name="IMPORT")
+def import_history(file: Path = typer.Argument(..., help="CSV written by EXPORT-CSV, or JSONL."),
+                   dry_run: bool = typer.Option(False, "--dry-run", help="Validate and count, then roll back."),
+                   skip_invalid: bool = typer.Option(False, "--skip-invalid", help="Commit the valid records even if some fail.")):
+    """Bulk-load history (sessions or START/STOP events) from CSV or JSONL."""
+    init_db()
+    ensure_logged_in()
+    if not file.exists():
+        UI.print(f"[bold red]File not found: {file}[/bold red]", border_style="red")
+        raise typer.Exit(code=1)
+    if file.suffix.lower() not in IMPORT_FORMATS:
+        UI.print(f"[bold red]Unsupported file type. Use: {', '.join(IMPORT_FORMATS)}[/bold red]", border_style="red")
+        raise typer.Exit(code=1)
+
+    current_uid = get_current_user_id()
+    conn = get_db_connection()
+    user_ids = {}    # username -> id
+    open_starts = {} # uid -> (lineno, start, start_epoch, description)
+    last_epoch = {}  # uid -> epoch of the last accepted event (input must be chronological per user)
+    limits = {}      # uid -> running timer start: history must end before it
+    existing = {}    # uid -> (first, last) stored event epoch: only starts inside can be duplicates
+    days = {}        # uid -> days whose rollup needs recomputing
+    hour = get_day_start_hour()
+    day_of = calendar_buckets("day", hour)
+    events, sessions = [], []
+    imported = duplicates = 0
+    errors = []
+    failed_line = None
+    progress = sys.stderr.isatty()
+
+    def flush():
+        conn.executemany("INSERT INTO events (timestamp, ts_epoch, event_type, description, user_id) VALUES (?, ?, ?, ?, ?)", events)
+        conn.executemany("INSERT INTO sessions (user_id, start, end, duration_seconds, description) VALUES (?, ?, ?, ?, ?)", sessions)
+        events.clear()
+        sessions.clear()
+        if progress:
+            print(f"\r{imported} sessions...", end="", file=sys.stderr, flush=True)
+
+    def resolve_user(lineno, user) -> int:
+        if user is None:
+            return current_uid
+        if user not in user_ids:
+            row = conn.execute("SELECT id FROM users WHERE username=?", (user,)).fetchone()
+            if not row:
+                raise ImportRecordError(lineno, f"unknown user '{user}'")
+            user_ids[user] = row['id']
+        return user_ids[user]
+
+    if conn.in_transaction:
+        conn.commit()
+    conn.execute("BEGIN IMMEDIATE")
+    try:
+        for lineno, kind, user, when, description in read_import_records(file):
+            if lineno == failed_line:
+                continue # Rest of a session record whose START already failed
+            try:
+                if kind == "ERROR":
+                    raise ImportRecordError(lineno, description)
+                uid = resolve_user(lineno, user)
+                epoch = to_epoch(when)
+                if uid not in limits:
+                    active = get_active_timer(conn, uid)
+                    limits[uid] = active['ts_epoch'] if active else None
+                    span = conn.execute("SELECT MIN(ts_epoch) AS lo, MAX(ts_epoch) AS hi FROM events WHERE user_id=?", (uid,)).fetchone()
+                    existing[uid] = (span['lo'], span['hi']) if span['lo'] is not None else None
+                if limits[uid] is not None and epoch >= limits[uid]:
+                    raise ImportRecordError(lineno, "after the running timer started; stop it first")
+                if epoch < last_epoch.get(uid, epoch):
+                    raise ImportRecordError(lineno, "out of order (input must be chronological per user)")
+
+                if kind == "START":
+                    if uid in open_starts:
+                        raise ImportRecordError(lineno, f"START while the session from line {open_starts[uid][0]} is open")
+                    open_starts[uid] = (lineno, when, epoch, description)
+                elif kind == "STOP":
+                    if uid not in open_starts:
+                        raise ImportRecordError(lineno, "STOP without START")
+                    _, start, start_epoch, description = open_starts.pop(uid)
+                    # Idempotent re-runs: a START already stored at that second is the same session
+                    span = existing[uid]
+                    if span and span[0] <= start_epoch <= span[1] and conn.execute(
+                            "SELECT 1 FROM events WHERE user_id=? AND ts_epoch=? AND event_type='START' LIMIT 1",
+                            (uid, start_epoch)).fetchone():
+                        duplicates += 1
+                    else:
+                        start_iso, end_iso = start.isoformat(), when.isoformat()
+                        # Stored sessions never overlap, so the last one starting before this end is the only candidate
+                        if span and start_epoch < span[1] and epoch > span[0]:
+                            clash = conn.execute(
+                                "SELECT start, end FROM sessions WHERE user_id=? AND start < ? ORDER BY start DESC LIMIT 1",
+                                (uid, end_iso)).fetchone()
+                            if clash and clash['end'] > start_iso:
+                                raise ImportRecordError(lineno, f"overlaps the stored session {clash['start']} - {clash['end']}")
+                        desc_enc = encrypt_text(description) if description else None
+                        events.append((start_iso, start_epoch, 'START', desc_enc, uid))
+                        events.append((end_iso, epoch, 'STOP', None, uid))
+                        sessions.append((uid, start_iso, end_iso, epoch - start_epoch, desc_enc))
+                        days.setdefault(uid, set()).update(
+                            piece[0] for piece in clip_intervals([(start_epoch, epoch)], day_of))
+                        imported += 1
+                        if len(sessions) >= IMPORT_BATCH_ROWS:
+                            flush()
+                else:
+                    raise ImportRecordError(lineno, f"unknown event_type '{kind}'")
+                last_epoch[uid] = epoch
+            except ImportRecordError as e:
+                failed_line = lineno
+                # Drop a START from the same record so it can't block the next one
+                for uid_open in [u for u, st in open_starts.items() if st[0] == lineno]:
+                    del open_starts[uid_open]
+                errors.append(str(e))
+                if len(errors) <= IMPORT_MAX_ERRORS_SHOWN:
+                    console.print(str(e), style="red", markup=False)
+
+        for lineno, *_rest in open_starts.values():
+            errors.append(f"line {lineno}: START never stopped")
+            if len(errors) <= IMPORT_MAX_ERRORS_SHOWN:
+                console.print(errors[-1], style="red", markup=False)
+        flush()
+        if progress:
+            print(file=sys.stderr)
+        for uid, touched in days.items():
+            refresh_daily_totals(conn, uid, touched, hour)
+
+        if dry_run or (errors and not skip_invalid):
+            conn.rollback()
+        else:
+            conn.commit()
+            write_status_file(conn, current_uid, hour=hour)
+            log_audit("IMPORT", f"{file.name}: {imported} sessions, {duplicates} duplicates, {len(errors)} errors")
+    except BaseException:
+        conn.rollback()
+        raise
+
+    summary = f"{T('import_sessions')}: {imported}\n{T('import_duplicates')}: {duplicates}\n{T('import_errors')}: {len(errors)}"
+    if dry_run:
+        UI.print(f"{summary}\n[yellow]{T('batch_dry_run')}[/yellow]", title="Import", border_style="yellow")
+    elif errors and not skip_invalid:
+        UI.print(f"{summary}\n[red]{T('import_rolled_back')}[/red]", title="Import", border_style="red")
+        raise typer.Exit(code=1)
+    else:
+        UI.print(f"[bold green]{summary}[/bold green]", title="Import", border_style="green")
+
 def open_email_client(file_path: str, subject: str, body: str):
     """Open default email client with attachment."""
     import urllib.parse
+    import webbrowser
+    import subprocess
     
     # Try xdg-email (Linux)
     if SYSTEM_PLATFORM == "Linux" and shutil.which("xdg-email"):
@@ -1193,33 +2156,45 @@ def open_email_client(file_path: str, subject: str, body: str):
     webbrowser.open(mailto)
     UI.print(f"[yellow]{T('email_manual_hint')}[/yellow]\n[bold]{file_path}[/bold]", border_style="yellow")
 
-def get_events_from_db(db_path, start_date_str, end_date_str):
-    """Generic fetcher."""
-    start_date = parse_date(start_date_str)
-    end_date = parse_date(end_date_str)
-    s_iso = start_date.strftime("%Y-%m-%dT00:00:00")
-    e_iso = (end_date + timedelta(days=1)).strftime("%Y-%m-%dT00:00:00")
+def iter_sessions_from_db(db_path, start_date_str, end_date_str):
+    """
+    Generic source: finished sessions of the current user, from the live DB or a backup,
+    yielded one at a time off the cursor. The connection stays open until it is drained.
+    """
+    lo, hi = day_range(parse_date(start_date_str), parse_date(end_date_str))
+    s_iso, e_iso = lo.isoformat(), hi.isoformat()
+    uid = get_current_user_id()
     
     # Connection might need decrypt logic if using backup?
-    # Actually decrypt logic is in 'process_sessions' which calls 'decrypt_text'
+    # Actually decrypt logic is in 'Session.description', which calls 'decrypt_text' when the writer reads it
     # 'decrypt_text' uses global FERNET.
     # If we are using a backup, we assume the CURRENT key works for it (or it was decrypted before backup? no).
     # If backup was encrypted with OLD key, we can't decrypt it unless we have that key.
     # Assumption: User uses current key.
     
+    if Path(db_path) == DB_PATH:
+        with DB.scope(read_only=True) as conn:
+            yield from iter_sessions(session_rows(conn, uid, s_iso, e_iso))
+        return
+
     try:
         conn = sqlite3.connect(db_path)
         conn.row_factory = sqlite3.Row
-        cur = conn.execute(
-             "SELECT timestamp, event_type, description FROM events WHERE timestamp >= ? AND timestamp < ? ORDER BY timestamp ASC",
-            (s_iso, e_iso)
-        )
-        events = [dict(row) for row in cur.fetchall()]
-        conn.close()
-        return events
+        profile_connection(conn)
+        try:
+            has_sessions = conn.execute(
+                "SELECT 1 FROM sqlite_master WHERE type='table' AND name='sessions'"
+            ).fetchone()
+            if has_sessions:
+                rows = session_rows(conn, uid, s_iso, e_iso)
+            else:
+                # Backups older than the sessions table: pair raw events
+                rows = pair_event_rows(conn, uid, s_iso, e_iso)
+            yield from iter_sessions(rows)
+        finally:
+            conn.close()
     except Exception as e:
         console.print(f"[red]DB Error: {e}[/red]")
-        return []
 
 @app.command(name="SEND-TO")
 def send_to():
@@ -1252,13 +2227,13 @@ def send_to():
     # Format
     fmt = typer.prompt("Format (CSV/PDF)", default="PDF").upper()
     
-    # Events
-    events = get_events_from_db(DB_PATH, s_str, e_str)
-    if not events:
+    # Sessions
+    sessions = iter_sessions_from_db(DB_PATH, s_str, e_str)
+    first = next(sessions, None)
+    if first is None:
         UI.print("[yellow]No data found.[/yellow]")
         return
-
-    sessions = process_sessions(events)
+    sessions = chain((first,), sessions)
     
     if fmt == "CSV":
         fpath = generate_csv_file(sessions, s_str, e_str)
@@ -1303,8 +2278,7 @@ def send_backup_to():
     fmt = typer.prompt("Format (CSV/PDF)", default="PDF").upper()
     
     # Get Data
-    events = get_events_from_db(target_db, s_str, e_str)
-    sessions = process_sessions(events)
+    sessions = iter_sessions_from_db(target_db, s_str, e_str)
     
     if fmt == "CSV":
         fpath = generate_csv_file(sessions, s_str, e_str)
@@ -1319,55 +2293,72 @@ def send_backup_to():
 
 # --- Backup Features ---
 
-def check_auto_backup():
+def _add_months(day: datetime, months: int) -> datetime:
+    """First day of the month `months` after day's month."""
+    index = day.year * 12 + day.month - 1 + months
+    return datetime(index // 12, index % 12 + 1, 1)
+
+def schedule_auto_backup() -> str:
     """
-    Check if auto-backup is needed based on config.
+    Work out the next due day from the frequency and the last auto-backup, and store it.
     Freq: DAILY, MONTHLY (default), NEVER, CUSTOM
     """
-    try:
-        freq = get_config("backup_freq")
-        if not freq:
-            freq = "MONTHLY"
-            set_config("backup_freq", freq)
-            
-        if freq == "NEVER":
-            return
-
-        last_backup_str = get_config("last_auto_backup")
-        # If no record, assume we need one (or maybe set to now to avoid immediate?) 
+    freq = get_config("backup_freq")
+    if not freq:
+        freq = "MONTHLY"
+        set_config("backup_freq", freq)
+
+    last_backup_str = get_config("last_auto_backup")
+    if freq == "NEVER":
+        next_due = "NEVER"
+    elif not last_backup_str:
         # For safety, let's do one if never done.
-        
-        should_backup = False
-        now = datetime.now()
-        
-        if not last_backup_str:
-            should_backup = True
+        next_due = get_today_str()
+    else:
+        last_backup = datetime.fromisoformat(last_backup_str)
+        if freq == "DAILY":
+            next_due = (last_backup + timedelta(days=1)).strftime("%Y-%m-%d")
+        elif freq == "CUSTOM":
+            # Custom interval in months (e.g., every 3 months)
+            interval = int(get_config("backup_interval") or "1")
+            next_due = _add_months(last_backup, interval).strftime("%Y-%m-%d")
         else:
-            last_backup = datetime.fromisoformat(last_backup_str)
-            
-            if freq == "DAILY":
-                if now.date() > last_backup.date():
-                    should_backup = True
-            elif freq == "MONTHLY":
-                # Check if month changed
-                if now.month != last_backup.month or now.year != last_backup.year:
-                    should_backup = True
-            elif freq == "CUSTOM":
-                # Custom interval in months (e.g., every 3 months)
-                interval = int(get_config("backup_interval") or "1")
-                # Simple check: month difference
-                months_diff = (now.year - last_backup.year) * 12 + now.month - last_backup.month
-                if months_diff >= interval:
-                    should_backup = True
-
-        if should_backup:
-            backup_database() # This existing function handles the copy
-            set_config("last_auto_backup", now.isoformat())
-            # console.print(f"[dim]{T('backup_auto_triggered')}: {freq}[/dim]")
+            # MONTHLY: once the month changes
+            next_due = _add_months(last_backup, 1).strftime("%Y-%m-%d")
 
+    set_config("next_auto_backup", next_due)
+    return next_due
+
+@profiled("auto_backup")
+def check_auto_backup():
+    """Per-run check: compare today with the stored due day; the copy itself runs detached."""
+    try:
+        next_due = get_config("next_auto_backup")
+        if next_due is None:
+            next_due = schedule_auto_backup() # Databases from before the stamp existed
+        if auto_backup_due(next_due, get_today_str()):
+            spawn_auto_backup()
     except Exception:
         pass # Fail silently on auto-backup checks
 
+@app.command(name="BACKUP-AUTO", hidden=True)
+def backup_auto():
+    """Background half of the auto-backup, spawned by check_auto_backup (which took the lock)."""
+    try:
+        init_db()
+        now = datetime.now()
+        try:
+            _, backup_folder = backup_database()
+            set_config("last_auto_backup", now.isoformat())
+            schedule_auto_backup()
+            log_audit("BACKUP_AUTO", f"Created backup at {backup_folder}")
+        except Exception as e:
+            # Try again tomorrow rather than on every command until then
+            set_config("next_auto_backup", (now + timedelta(days=1)).strftime("%Y-%m-%d"))
+            log_audit("BACKUP_AUTO", f"Failed: {e}")
+    finally:
+        release_auto_backup_lock()
+
 
 @app.command(name="LOAD-BACKUP")
 def load_backup(filename: str):
@@ -1382,12 +2373,17 @@ def load_backup(filename: str):
         return
         
     if typer.confirm(f"{T('backup_restore_confirm')} '{filename}'?", abort=True):
-        import shutil
         try:
-            # Close existing connections if possible? 
-            # In this script execution, we haven't opened yet unless init_db called.
-            # We overwrite DB_PATH
-            shutil.copy(backup_path, DB_PATH)
+            # Copy pages through SQLite instead of over the file, so a live -wal/-shm
+            # pair can't be replayed on top of the restored data
+            source = sqlite3.connect(backup_path)
+            try:
+                source.backup(get_db_connection())
+            finally:
+                source.close()
+            DB.close() # Next use re-reads schema version and config
+            init_db()
+            refresh_status_file()
             UI.print(f"[bold green]{T('backup_restored')}[/bold green]", border_style="green")
         except Exception as e:
             UI.print(f"[bold red]Restore Error: {e}[/bold red]", border_style="red")
@@ -1408,21 +2404,25 @@ def config_backup(frequency: str, interval: int = 1):
     set_config("backup_freq", freq)
     if freq == "CUSTOM":
         set_config("backup_interval", str(interval))
+    schedule_auto_backup()
         
     UI.print(f"[bold green]{T('backup_config_updated')} {freq}[/bold green]", border_style="green")
 
 
 
 # --- Encryption Features ---
-from cryptography.fernet import Fernet
+# The key (and cryptography itself) is loaded on first use, not at module import.
 
-KEY_PATH = DB_PATH.parent / ".secret.key"
 FERNET = None
+_KEY_LOADED = False
 
+@profiled("crypto")
 def load_key():
     """Load encryption key if exists."""
-    global FERNET
+    global FERNET, _KEY_LOADED
+    _KEY_LOADED = True
     if KEY_PATH.exists():
+        from cryptography.fernet import Fernet
         with open(KEY_PATH, "rb") as key_file:
             key = key_file.read()
             try:
@@ -1430,21 +2430,26 @@ def load_key():
             except Exception:
                 pass # Invalid key?
 
-# Initialize key on module load
-load_key()
+def get_fernet():
+    """Active Fernet instance or None. Loads the key the first time it is needed."""
+    if not _KEY_LOADED:
+        load_key()
+    return FERNET
 
+@profiled("crypto")
 def encrypt_text(text: str) -> str:
     """Encrypt text if FERNET is active."""
-    if not FERNET or not text:
+    if not text or not get_fernet():
         return text
     try:
         return FERNET.encrypt(text.encode()).decode()
     except Exception:
         return text
 
+@profiled("crypto")
 def decrypt_text(text: str) -> str:
     """Decrypt text if FERNET is active."""
-    if not FERNET or not text:
+    if not text or not get_fernet():
         return text
     try:
         # Check if it looks encrypted (starts with gAAAA...) - loose check
@@ -1467,6 +2472,7 @@ def init_encryption(check_first: bool = False):
              return
     
     # Generate Key
+    from cryptography.fernet import Fernet
     key = Fernet.generate_key()
     with open(KEY_PATH, "wb") as key_file:
         key_file.write(key)
@@ -1503,7 +2509,9 @@ def change_key():
     
     # Delete DB and Key
     try:
-        if DB_PATH.exists(): os.remove(DB_PATH)
+        DB.close()
+        for path in [DB_PATH] + db_side_files(DB_PATH):
+            if path.exists(): os.remove(path)
         if KEY_PATH.exists(): os.remove(KEY_PATH)
         UI.print("[green]Data wiped. Starting setup...[/green]", border_style="green")
         init_encryption()
@@ -1515,7 +2523,7 @@ def encrypt_on():
     """Enable encryption on existing data."""
     init_db()
     
-    if not FERNET:
+    if not get_fernet():
         # Generate temporary if not exists? Or demand init?
         # Better to run init logic.
         if not KEY_PATH.exists():
@@ -1523,22 +2531,23 @@ def encrypt_on():
              return
 
     # Migrate: Plain -> Encrypt
+    # Sessions and the running timer keep their own copy of the START description
     conn = get_db_connection()
-    events = [dict(row) for row in conn.execute("SELECT id, description FROM events").fetchall()]
-    
-    for ev in events:
-        desc = ev.get('description')
-        if desc:
-            # We assume it is plain text right now.
-            # Safety: try to decrypt. If fail, it's plain. If succeed, it's already encrypted?
-            # Double encryption is bad.
-            # Simple heuristic: If we just turned on, we assume everything is plain unless we track state.
-            # But the requirement says "Migrate".
-            encrypted = encrypt_text(desc)
-            conn.execute("UPDATE events SET description = ? WHERE id = ?", (encrypted, ev['id']))
+    for table in ("events", "sessions", "active_timers"):
+        rows = [dict(row) for row in conn.execute(f"SELECT rowid AS id, description FROM {table}").fetchall()]
+        
+        for ev in rows:
+            desc = ev.get('description')
+            if desc:
+                # We assume it is plain text right now.
+                # Safety: try to decrypt. If fail, it's plain. If succeed, it's already encrypted?
+                # Double encryption is bad.
+                # Simple heuristic: If we just turned on, we assume everything is plain unless we track state.
+                # But the requirement says "Migrate".
+                encrypted = encrypt_text(desc)
+                conn.execute(f"UPDATE {table} SET description = ? WHERE rowid = ?", (encrypted, ev['id']))
             
     conn.commit()
-    conn.close()
     UI.print(f"[bold green]{T('encrypt_enabled')}[/bold green]", border_style="green")
 
 @app.command(name="ENCRIPT-OFF")
@@ -1546,22 +2555,22 @@ def encrypt_off():
     """Disable encryption (Decrypt data)."""
     global FERNET
     init_db()
-    if not FERNET:
+    if not get_fernet():
         UI.print("[red]Encryption not active.[/red]", border_style="red")
         return
         
     # Migrate: Encrypt -> Plain
     conn = get_db_connection()
-    events = [dict(row) for row in conn.execute("SELECT id, description FROM events").fetchall()]
-    
-    for ev in events:
-        desc = ev.get('description')
-        if desc:
-            plain = decrypt_text(desc)
-            conn.execute("UPDATE events SET description = ? WHERE id = ?", (plain, ev['id']))
+    for table in ("events", "sessions", "active_timers"):
+        rows = [dict(row) for row in conn.execute(f"SELECT rowid AS id, description FROM {table}").fetchall()]
+        
+        for ev in rows:
+            desc = ev.get('description')
+            if desc:
+                plain = decrypt_text(desc)
+                conn.execute(f"UPDATE {table} SET description = ? WHERE rowid = ?", (plain, ev['id']))
             
     conn.commit()
-    conn.close()
     
     # Delete Key
     if KEY_PATH.exists():
@@ -1576,12 +2585,9 @@ def main(ctx: typer.Context):
     """
     Working_Code Time Tracker
     """
-    # Always check auto-backup on any run
-    if DB_PATH.exists():
-        try:
-            check_auto_backup() 
-        except: 
-            pass
+    # Always check auto-backup on any run (except in the background run itself)
+    if DB_PATH.exists() and ctx.invoked_subcommand != "BACKUP-AUTO":
+        check_auto_backup()
 
     if ctx.invoked_subcommand is None:
         # Custom Help
@@ -1599,6 +2605,8 @@ def main(ctx: typer.Context):
             ("TIME", "desc_time", "work TIME"),
             ("TIME-TODAY", "desc_time_today", "work TIME-TODAY"),
             ("DB", "desc_db", "work DB"),
+            ("DB-PROFILE", "desc_db_profile", "work DB-PROFILE [shared]"),
+            ("DAY-START", "desc_day_start", "work DAY-START 6"),
             ("BACKUP", "desc_backup", "work BACKUP"),
             ("LOAD-BACKUP", "desc_load_backup", "work LOAD-BACKUP [file]"),
             ("CONFIG-BACKUP-AUTO", "desc_config_backup", "work CONFIG-BACKUP-AUTO [freq]"),
@@ -1606,6 +2614,14 @@ def main(ctx: typer.Context):
             ("TIME-RANGE", "desc_time_range", "work TIME-RANGE d1/m1..."),
             ("INIT-TIME", "desc_init_time", "work INIT-TIME"),
             ("INIT-TIME_WHEN", "desc_init_time_when", "work INIT-TIME_WHEN..."),
+            ("ROLLUP-CHECK", "desc_rollup_check", "work ROLLUP-CHECK [--fix]"),
+            ("PROMPT", "desc_prompt", "work PROMPT [--today]"),
+            ("BATCH", "desc_batch", "work BATCH ops.txt [--dry-run]"),
+            ("IMPORT", "desc_import", "work IMPORT history.csv [--dry-run]"),
+            ("HISTORY", "desc_history", "work HISTORY [dd/mm/yyyy] [dd/mm/yyyy] [--limit N]"),
+            ("TIME-STATS", "desc_time_stats", "work TIME-STATS --by month [d1] [d2] [--json]"),
+            ("--daemon", "desc_daemon", "work --daemon &"),
+            ("--profile", "desc_profile", "work --profile TIME-RANGE d1 d2"),
             ("CLEAR-ALL", "desc_clear_all", "work CLEAR-ALL"),
             ("LANG", "desc_lang", "work LANG"),
             ("LANG-SET", "desc_lang_set", "work LANG-SET"),
@@ -1629,10 +2645,157 @@ def main(ctx: typer.Context):
         console.print(table)
         console.print(Align.center(f"[dim]{T('help_footer')}[/dim]"))
 
+# --- Daemon Mode ---
+# `work --daemon` keeps the DB connection, config snapshot, Fernet key and translations warm.
+# fast_path.daemon_request forwards DAEMON_COMMANDS here; replies carry the rendered output.
+
+AUDIT_FLUSH_LINES = 50
+_DAEMON_STAMP = {}
+
+def _daemon_refresh():
+    """Drop warm state another process invalidated: a replaced DB file (CHANGE-KEY, restores) or key file."""
+    global FERNET, _KEY_LOADED
+    stamps = {}
+    for name, path in (("db", DB_PATH), ("key", KEY_PATH)):
+        try:
+            st = path.stat()
+            stamps[name] = (st.st_dev, st.st_ino, st.st_mtime_ns if name == "key" else 0)
+        except OSError:
+            stamps[name] = None
+    if stamps["db"] != _DAEMON_STAMP.get("db", stamps["db"]):
+        DB.close()
+    if stamps["key"] != _DAEMON_STAMP.get("key", stamps["key"]):
+        FERNET, _KEY_LOADED = None, False
+    _DAEMON_STAMP.update(stamps)
+
+def _daemon_run(request: dict) -> (int, str):
+    """Run one forwarded command against the warm state, capturing everything it prints."""
+    global console
+    from io import StringIO
+    from contextlib import redirect_stdout, redirect_stderr
+
+    _daemon_refresh()
+    reset_language() # May have been changed by a command that ran in-process
+    buf = StringIO()
+    daemon_console = console
+    console = Console(file=buf, width=request.get("width") or 80, force_terminal=request.get("tty", False))
+    stdin, sys.stdin = sys.stdin, StringIO("") # Never block on a prompt
+    cwd = os.getcwd()
+    code = 0
+    try:
+        os.chdir(request["cwd"]) # Exports are written to the caller's directory
+        with redirect_stdout(buf), redirect_stderr(buf):
+            try:
+                result = app(args=request["argv"], prog_name="work", standalone_mode=False)
+                code = result if isinstance(result, int) else 0
+            except typer.Abort:
+                print("Aborted!")
+                code = 1
+            except SystemExit as e:
+                code = e.code if isinstance(e.code, int) else 1
+            except Exception as e:
+                if hasattr(e, "show"): # Usage errors: same message Typer prints standalone
+                    e.show(file=buf)
+                    code = getattr(e, "exit_code", 2)
+                else:
+                    console.print(Panel(f"[bold red]An unexpected error occurred:[/bold red]\n{e}", title="System Error", border_style="red"))
+                    code = 1
+    finally:
+        os.chdir(cwd)
+        sys.stdin = stdin
+        console = daemon_console
+        if DB._conn is not None and DB._conn.in_transaction:
+            DB._conn.rollback() # A failed command must not leave locks behind
+    return code, buf.getvalue()
+
+def serve_daemon():
+    """Foreground server: `work --daemon &`, stop with Ctrl+C or SIGTERM."""
+    import json
+    import signal
+    import socket
+
+    if not hasattr(socket, "AF_UNIX"):
+        UI.print(f"[red]{T('daemon_unsupported')}[/red]", border_style="red")
+        sys.exit(1)
+
+    init_db()
+    load_config_snapshot()
+    get_fernet()
+    _daemon_refresh()
+
+    sock_path = str(fast_path.DAEMON_SOCKET)
+    if fast_path.DAEMON_SOCKET.exists():
+        probe = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        try:
+            probe.connect(sock_path)
+            UI.print(f"[yellow]{T('daemon_already_running')}[/yellow]", border_style="yellow")
+            sys.exit(1)
+        except OSError:
+            os.unlink(sock_path) # Left behind by a daemon that didn't shut down cleanly
+        finally:
+            probe.close()
+
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    old_umask = os.umask(0o177) # Owner only: the socket acts as the logged-in user
+    try:
+        server.bind(sock_path)
+    finally:
+        os.umask(old_umask)
+    server.listen(16)
+    server.settimeout(1.0)
+
+    def _stop(signum, frame):
+        raise KeyboardInterrupt
+    signal.signal(signal.SIGTERM, _stop)
+
+    fast_path.buffer_audit(True)
+    log_audit("DAEMON_START", f"PID {os.getpid()}")
+    UI.print(f"{T('daemon_listening')} [cyan]{sock_path}[/cyan] (PID {os.getpid()})", title="Daemon", border_style="cyan")
+    try:
+        while True:
+            try:
+                client, _ = server.accept()
+            except socket.timeout:
+                fast_path.flush_audit() # Idle: write what has been collected
+                continue
+            with client:
+                try:
+                    client.settimeout(10)
+                    chunks = []
+                    while True:
+                        chunk = client.recv(65536)
+                        if not chunk:
+                            break
+                        chunks.append(chunk)
+                    request = json.loads(b"".join(chunks))
+                except (OSError, ValueError):
+                    continue # Probe, or a client that went away: nothing to answer
+                code, out = _daemon_run(request)
+                try:
+                    client.sendall(json.dumps({"code": code, "out": out}).encode("utf-8"))
+                except OSError:
+                    pass
+            if len(fast_path._AUDIT_BUFFER) >= AUDIT_FLUSH_LINES:
+                fast_path.flush_audit()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.close()
+        if os.path.exists(sock_path):
+            os.unlink(sock_path)
+        log_audit("DAEMON_STOP", f"PID {os.getpid()}")
+        fast_path.buffer_audit(False)
+        UI.print(T('daemon_stopped'), border_style="dim")
+
 if __name__ == "__main__":
     try:
-        app()
+        if sys.argv[1:] == ["--daemon"]:
+            serve_daemon()
+        else:
+            app()
     except Exception as e:
         console.print(Panel(f"[bold red]An unexpected error occurred:[/bold red]\n{e}", title="System Error", border_style="red"))
         # In debug mode (optional), you might want to raise e to see the stack trace
         # raise e
+    finally:
+        DB.close()
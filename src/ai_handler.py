@@ -1,5 +1,3 @@
-import google.generativeai as genai
-from openai import OpenAI
 import datetime
 
 class AIHandler:
@@ -7,9 +5,13 @@ class AIHandler:
         self.provider = provider.upper()
         self.api_key = api_key
         
+        # Only the selected provider's SDK is imported (both are slow to load)
         if self.provider == "GEMINI":
+            import google.generativeai as genai
             genai.configure(api_key=self.api_key)
+            self.genai = genai
         elif self.provider == "OPENAI":
+            from openai import OpenAI
             self.client = OpenAI(api_key=self.api_key)
             
     def format_context(self, events: list) -> str:
@@ -62,7 +64,7 @@ class AIHandler:
             return f"AI Error: {str(e)}"
 
     def _ask_gemini(self, prompt: str) -> str:
-        model = genai.GenerativeModel('gemini-pro')
+        model = self.genai.GenerativeModel('gemini-pro')
         response = model.generate_content(prompt)
         return response.text
 
@@ -0,0 +1,697 @@
+"""
+Stdlib-only core of Work-CLI.
+
+Holds the paths, storage profiles and timer state operations shared with
+Working_Code.py, plus a minimal dispatcher that serves ON/OFF/TIME/TIME-TODAY
+in FAST-MODE without importing typer or rich. Anything it can't handle
+returns False and falls through to the full Typer app.
+"""
+import time
+PROFILE_T0 = time.perf_counter() # Earliest point of our own code: the "imports" phase starts here
+
+import os
+import sys
+import atexit
+import sqlite3
+import functools
+from datetime import date, datetime, timedelta
+from pathlib import Path
+from typing import Optional
+from contextlib import contextmanager
+from translations import LANGUAGES, get_text, load_language
+
+# Configuration
+DB_NAME = "working_code.db"
+SCRIPT_DIR = Path(__file__).parent.absolute()
+# Go up one level from src/ to root, then into data/
+DB_PATH = SCRIPT_DIR.parent / "data" / DB_NAME
+LOGS_DIR = SCRIPT_DIR.parent / "logs"
+LOG_FILE = LOGS_DIR / "log.txt"
+KEY_PATH = DB_PATH.parent / ".secret.key"
+BACKUP_DIR = SCRIPT_DIR.parent / "backup"
+
+# Schema the helpers below are written against. Working_Code.MIGRATIONS must end here.
+SCHEMA_VERSION = 7
+
+HOT_COMMANDS = ("ON", "OFF", "TIME", "TIME-TODAY")
+
+# Shell-prompt status, readable without SQLite. One file per user id plus "current" for the
+# logged-in user, each a single fixed-layout line, atomically replaced:
+#   <running 0|1> <start epoch, 10 digits> <day YYYYMMDD> <closed seconds that day, 10 digits>
+#   <epoch the day started at, 10 digits>
+STATUS_DIR = DB_PATH.parent / "status"
+STATUS_LAYOUT = "{running:d} {start:010d} {day} {closed:010d} {day_start:010d}\n"
+
+# Auto-backup: config 'next_auto_backup' holds the due day (YYYY-MM-DD, or NEVER), so the
+# per-run check is one comparison. The copy runs in a detached BACKUP-AUTO process holding the lock.
+AUTO_BACKUP_LOCK = BACKUP_DIR / ".auto-backup.lock"
+AUTO_BACKUP_STALE = 3600 # Seconds: an older lock was left by a run that died
+
+# `work --daemon` listens here. Only commands that never prompt or open a browser are forwarded.
+DAEMON_SOCKET = DB_PATH.parent / ".work.sock"
+DAEMON_COMMANDS = HOT_COMMANDS + (
+    "TIME-SELECT", "TIME-RANGE", "TIME-STATS", "INIT-TIME", "INIT-TIME_WHEN", "DB", "DB-PROFILE", "DAY-START", "LANG",
+    "FAST-MODE", "NORMAL-MODE", "LOGOUT", "USER-LOG-OUT", "BACKUP", "EXPORT-CSV", "EXPORT-PDF", "ROLLUP-CHECK",
+)
+# The daemon serves one request at a time: a client gives up rather than wait behind a stuck one
+DAEMON_CONNECT_TIMEOUT = 2 # Seconds; not accepting in time means run in-process instead
+DAEMON_TIMEOUT_ENV = "WORK_DAEMON_TIMEOUT" # Seconds to wait for the reply (default 60)
+
+# --- Phase Profiler ---
+# `work --profile CMD` or WORK_PROFILE=table|json. Times are exclusive (a phase running inside
+# another is not counted twice); every statement on a profiled connection is counted.
+PROFILE_ENV = "WORK_PROFILE"
+PROFILE_LOG = LOGS_DIR / "profile.jsonl"
+_PROFILE = None
+
+def enable_profiling(argv: list) -> list:
+    """Strip --profile from argv and start collecting if it (or WORK_PROFILE) asks for it."""
+    global _PROFILE
+    mode = os.environ.get(PROFILE_ENV, "").lower()
+    if "--profile" in argv:
+        argv = [a for a in argv if a != "--profile"]
+        mode = mode or "table"
+    if mode in ("1", "true", "table", "json"):
+        _PROFILE = {"mode": "json" if mode == "json" else "table", "argv": argv,
+                    "phases": {}, "stack": [], "connections": 0, "statements": 0}
+        atexit.register(_profile_report)
+    return argv
+
+@contextmanager
+def phase(name: str):
+    if _PROFILE is None:
+        yield
+        return
+    frame = [time.perf_counter(), 0.0] # start, time spent in nested phases
+    _PROFILE["stack"].append(frame)
+    try:
+        yield
+    finally:
+        _PROFILE["stack"].pop()
+        elapsed = time.perf_counter() - frame[0]
+        entry = _PROFILE["phases"].setdefault(name, [0.0, 0])
+        entry[0] += elapsed - frame[1]
+        entry[1] += 1
+        if _PROFILE["stack"]:
+            _PROFILE["stack"][-1][1] += elapsed
+
+def profiled(name: str):
+    """Decorator form of phase(); a single None check when profiling is off."""
+    def decorator(func):
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if _PROFILE is None:
+                return func(*args, **kwargs)
+            with phase(name):
+                return func(*args, **kwargs)
+        return wrapper
+    return decorator
+
+def record_phase(name: str, seconds: float):
+    """Add a phase measured outside phase(), e.g. module imports."""
+    if _PROFILE is not None:
+        entry = _PROFILE["phases"].setdefault(name, [0.0, 0])
+        entry[0] += seconds
+        entry[1] += 1
+
+def profile_connection(conn: sqlite3.Connection):
+    """Count the connection and each statement it runs."""
+    if _PROFILE is None:
+        return
+    _PROFILE["connections"] += 1
+    def count(statement):
+        _PROFILE["statements"] += 1
+    conn.set_trace_callback(count)
+
+def _profile_report():
+    total = time.perf_counter() - PROFILE_T0
+    phases = sorted(_PROFILE["phases"].items(), key=lambda item: -item[1][0])
+    other = total - sum(seconds for seconds, _ in _PROFILE["phases"].values())
+
+    if _PROFILE["mode"] == "json":
+        import json
+        entry = {
+            "ts": datetime.now().isoformat(timespec="seconds"),
+            "argv": _PROFILE["argv"],
+            "total_ms": round(total * 1000, 2),
+            "phases": {name: {"ms": round(seconds * 1000, 2), "calls": calls} for name, (seconds, calls) in phases},
+            "other_ms": round(other * 1000, 2),
+            "connections": _PROFILE["connections"],
+            "statements": _PROFILE["statements"],
+        }
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+        with open(PROFILE_LOG, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+        return
+
+    # stderr, plain text: keeps the command's own output clean and needs no rich
+    out = sys.stderr
+    print(f"\n--- PROFILE: {' '.join(_PROFILE['argv']) or '(help)'} ---", file=out)
+    print(f"{'Phase':<14}{'ms':>10}{'Calls':>8}", file=out)
+    for name, (seconds, calls) in phases + [("other", (other, 0))]:
+        print(f"{name:<14}{seconds * 1000:>10.2f}{calls or '':>8}", file=out)
+    print(f"{'total':<14}{total * 1000:>10.2f}", file=out)
+    print(f"DB connections: {_PROFILE['connections']}  statements: {_PROFILE['statements']}", file=out)
+
+# --- Storage Profiles ---
+# PRAGMAs applied once when the connection opens. None leaves SQLite's own default.
+# "shared" suits one DB used by several people/processes at once (e.g. the Docker image):
+# WAL lets readers run while a writer commits, at the cost of -wal/-shm side files.
+DB_PROFILES = {
+    "default": {"journal_mode": None, "synchronous": None, "cache_size": None, "mmap_size": None, "busy_timeout": 10000},
+    "shared": {"journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -8000, "mmap_size": 64 * 1024 * 1024, "busy_timeout": 30000},
+    "performance": {"journal_mode": "WAL", "synchronous": "NORMAL", "cache_size": -32000, "mmap_size": 256 * 1024 * 1024, "busy_timeout": 10000},
+}
+DB_PROFILE_ENV = "WORK_DB_PROFILE"
+
+def resolve_db_profile(config_value: Optional[str]) -> str:
+    """Profile: env WORK_DB_PROFILE -> config 'db_profile' -> default."""
+    name = (os.environ.get(DB_PROFILE_ENV) or config_value or "default").lower()
+    return name if name in DB_PROFILES else "default"
+
+def apply_db_profile(conn: sqlite3.Connection, name: str):
+    profile = DB_PROFILES[name]
+    conn.execute(f"PRAGMA busy_timeout = {int(profile['busy_timeout'])}")
+    if profile["journal_mode"]:
+        # Persistent in the file: only switch when it differs (needs a moment without readers)
+        current = conn.execute("PRAGMA journal_mode").fetchone()[0]
+        if current.upper() != profile["journal_mode"]:
+            conn.execute(f"PRAGMA journal_mode = {profile['journal_mode']}")
+    if profile["synchronous"]:
+        conn.execute(f"PRAGMA synchronous = {profile['synchronous']}")
+    if profile["cache_size"] is not None:
+        conn.execute(f"PRAGMA cache_size = {int(profile['cache_size'])}")
+    if profile["mmap_size"] is not None:
+        conn.execute(f"PRAGMA mmap_size = {int(profile['mmap_size'])}")
+
+# --- Helpers ---
+
+def resolve_language(config_value: Optional[str]) -> str:
+    """Determine language: DB -> System -> Default (EN)."""
+    # 1. Config value from DB
+    if config_value and config_value in LANGUAGES:
+        return config_value
+
+    # 2. Check System
+    try:
+        import locale # Only needed for this fallback; keeps the daemon client's startup small
+        sys_lang, _ = locale.getdefaultlocale()
+        if sys_lang:
+             prefix = sys_lang.split("_")[0].upper()
+             # Map common codes
+             if prefix in ["ES", "EN", "FR", "PT"]:
+                 return prefix
+             if prefix == "BR": return "PT" # Portuguese Brazil
+    except Exception:
+        pass
+
+    # 3. Default
+    return "EN"
+
+def to_epoch(dt: datetime) -> int:
+    """Naive local datetime -> integer epoch seconds (the events.ts_epoch unit)."""
+    return int(dt.timestamp())
+
+def get_day_bounds(target_date: datetime) -> (str, str):
+    """Half-open [day, next day) bounds, comparable with ISO timestamps and index friendly."""
+    day = target_date.strftime("%Y-%m-%d")
+    next_day = (target_date + timedelta(days=1)).strftime("%Y-%m-%d")
+    return day, next_day
+
+def format_duration(td: timedelta) -> str:
+    total_seconds = int(td.total_seconds())
+    hours, remainder = divmod(total_seconds, 3600)
+    minutes, seconds = divmod(remainder, 60)
+    return f"{hours:02}:{minutes:02}:{seconds:02}"
+
+# --- Intervals ---
+# Sessions are [start, end) epoch intervals. clip_intervals() cuts them at bucket edges (days,
+# weeks, months, years) so a night shift counts towards both days it touches. Bucket
+# lookups are memoized, so a pass over sessions sorted by start costs one calendar computation
+# per bucket crossed, not per session.
+
+BUCKET_UNITS = ("day", "week", "month", "year")
+
+def day_start_hour(config_value: Optional[str]) -> int:
+    """Config 'day_start_hour' -> hour (0-23) at which a tracking day begins. Default midnight."""
+    try:
+        hour = int(config_value)
+    except (TypeError, ValueError):
+        return 0
+    return hour if 0 <= hour < 24 else 0
+
+def logical_date(moment: datetime, hour: int = 0) -> date:
+    """The tracking day a local moment belongs to when days start at hour:00."""
+    return (moment - timedelta(hours=hour)).date()
+
+def day_start(day: date, hour: int = 0) -> datetime:
+    """Local moment a tracking day begins."""
+    return datetime(day.year, day.month, day.day, hour)
+
+def calendar_buckets(unit: str = "day", hour: int = 0):
+    """
+    bucket_of(epoch) -> (key, lo, hi) for local calendar units, days starting at hour:00.
+    Keys sort chronologically: 2024-01-31, 2024-W05, 2024-01, 2024.
+    """
+    if unit not in BUCKET_UNITS:
+        raise ValueError(f"Unknown bucket unit: {unit}")
+    last = [None, 0, -1]
+
+    def bucket_of(epoch):
+        if last[1] <= epoch < last[2]:
+            return last
+        d = logical_date(datetime.fromtimestamp(epoch), hour)
+        if unit == "day":
+            first, following, key = d, d + timedelta(days=1), d.isoformat()
+        elif unit == "week":
+            first = d - timedelta(days=d.weekday())
+            following = first + timedelta(days=7)
+            year, week, _ = first.isocalendar()
+            key = f"{year}-W{week:02}"
+        elif unit == "month":
+            first = d.replace(day=1)
+            following = (first + timedelta(days=32)).replace(day=1)
+            key = first.strftime("%Y-%m")
+        else:
+            first = d.replace(month=1, day=1)
+            following = first.replace(year=first.year + 1)
+            key = str(first.year)
+        # Via local wall time, so DST days are 23 or 25 hours long
+        last[:] = key, to_epoch(day_start(first, hour)), to_epoch(day_start(following, hour))
+        return last
+
+    return bucket_of
+
+def clip_intervals(intervals, bucket_of):
+    """
+    Yield (key, lo, hi, interval) for each piece of each interval cut at bucket edges.
+    intervals are tuples starting with (start epoch, end epoch); the first piece of one has
+    lo == interval[0]. A zero-length interval still yields its single (empty) piece.
+    """
+    for interval in intervals:
+        start, end = interval[0], interval[1]
+        while True:
+            key, _, hi = bucket_of(start)
+            piece_end = end if end <= hi else hi
+            yield key, start, piece_end, interval
+            if piece_end >= end:
+                break
+            start = piece_end
+
+def bucket_rollup(intervals, bucket_of, lo: float = float("-inf"), hi: float = float("inf")) -> dict:
+    """
+    Per-bucket aggregates in one pass, counting only the time inside [lo, hi):
+    {key: [seconds, sessions started, first moment worked, full length of the sessions started]}.
+    """
+    buckets = {}
+    for key, piece_lo, piece_hi, interval in clip_intervals(intervals, bucket_of):
+        if piece_lo < lo:
+            piece_lo = lo
+        if piece_hi > hi:
+            piece_hi = hi
+        started = piece_lo == interval[0]
+        if piece_hi <= piece_lo and not (started and piece_lo < hi):
+            continue # Outside the range (an empty session inside it still counts)
+        agg = buckets.get(key)
+        if agg is None:
+            agg = buckets[key] = [0, 0, piece_lo, 0]
+        agg[0] += piece_hi - piece_lo
+        if started:
+            agg[1] += 1
+            agg[3] += interval[1] - interval[0]
+        if piece_lo < agg[2]:
+            agg[2] = piece_lo
+    return buckets
+
+def day_rollup(intervals, hour: int = 0) -> dict:
+    """
+    Per-day aggregates in one pass: {day: [seconds, sessions started, first moment worked]}.
+    Same shape as a daily_totals row; a session crossing day starts adds time to each day.
+    """
+    return {day: agg[:3] for day, agg in bucket_rollup(intervals, calendar_buckets("day", hour)).items()}
+
+# The daemon collects audit lines here and writes them in batches (see flush_audit)
+_AUDIT_BUFFER: Optional[list] = None
+
+@profiled("audit")
+def write_audit(user: str, action: str, details: str = ""):
+    """Append one line to the audit log."""
+    timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    entry = f"[{timestamp}] [{user}] [{action}] {details}\n"
+
+    if _AUDIT_BUFFER is not None:
+        _AUDIT_BUFFER.append(entry)
+        return
+
+    if not LOGS_DIR.exists():
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+
+    with open(LOG_FILE, "a", encoding="utf-8") as f:
+        f.write(entry)
+
+def buffer_audit(enabled: bool):
+    """Switch write_audit between writing immediately and buffering until flush_audit."""
+    global _AUDIT_BUFFER
+    if not enabled:
+        flush_audit()
+    _AUDIT_BUFFER = [] if enabled else None
+
+def flush_audit() -> int:
+    """Write buffered audit lines with a single append. Returns how many were written."""
+    if not _AUDIT_BUFFER:
+        return 0
+    if not LOGS_DIR.exists():
+        LOGS_DIR.mkdir(parents=True, exist_ok=True)
+    with open(LOG_FILE, "a", encoding="utf-8") as f:
+        f.write("".join(_AUDIT_BUFFER))
+    count = len(_AUDIT_BUFFER)
+    _AUDIT_BUFFER.clear()
+    return count
+
+# --- Timer State ---
+# These never commit: callers own the transaction, so several can be grouped.
+
+@profiled("query")
+def get_active_timer(conn, uid) -> Optional[sqlite3.Row]:
+    """Running session (timestamp, ts_epoch, description): a primary key lookup on active_timers."""
+    return conn.execute(
+        "SELECT started_at AS timestamp, started_epoch AS ts_epoch, description FROM active_timers WHERE user_id=?", (uid,)
+    ).fetchone()
+
+def add_to_daily_totals(conn, uid, start_epoch: int, end_epoch: int, hour: int = 0):
+    """Incremental rollup update for one newly closed session, split at day starts."""
+    conn.executemany('''
+        INSERT INTO daily_totals (user_id, day, seconds, sessions, first_start) VALUES (?, ?, ?, ?, ?)
+        ON CONFLICT(user_id, day) DO UPDATE SET
+            seconds = seconds + excluded.seconds,
+            sessions = sessions + excluded.sessions,
+            first_start = MIN(first_start, excluded.first_start)
+    ''', [(uid, day, seconds, started, datetime.fromtimestamp(first).isoformat())
+          for day, (seconds, started, first) in day_rollup([(start_epoch, end_epoch)], hour).items()])
+
+@profiled("write")
+def open_session(conn, uid, now: datetime, description: Optional[str]) -> bool:
+    """Write START. False if a timer is already running (nothing written, caller rolls back)."""
+    # State row first: its primary key stops a concurrent ON from opening a second session
+    claimed = conn.execute(
+        "INSERT OR IGNORE INTO active_timers (user_id, started_at, started_epoch, description) VALUES (?, ?, ?, ?)",
+        (uid, now.isoformat(), to_epoch(now), description)
+    ).rowcount
+    if not claimed:
+        return False
+    conn.execute("INSERT INTO events (timestamp, ts_epoch, event_type, description, user_id) VALUES (?, ?, ?, ?, ?)",
+                 (now.isoformat(), to_epoch(now), 'START', description, uid))
+    return True
+
+@profiled("write")
+def close_session(conn, uid, active, now: datetime, hour: int = 0) -> Optional[int]:
+    """Write STOP, session, rollup and state together. Returns seconds, or None if already stopped."""
+    released = conn.execute("DELETE FROM active_timers WHERE user_id=?", (uid,)).rowcount
+    if not released:
+        return None # A concurrent OFF got there first
+    now_epoch = to_epoch(now)
+    seconds = now_epoch - active['ts_epoch']
+    conn.execute("INSERT INTO events (timestamp, ts_epoch, event_type, user_id) VALUES (?, ?, ?, ?)",
+                 (now.isoformat(), now_epoch, 'STOP', uid))
+    conn.execute("INSERT INTO sessions (user_id, start, end, duration_seconds, description) VALUES (?, ?, ?, ?, ?)",
+                 (uid, active['timestamp'], now.isoformat(), seconds, active['description']))
+    add_to_daily_totals(conn, uid, active['ts_epoch'], now_epoch, hour)
+    return seconds
+
+@profiled("query")
+def range_total_seconds(conn, uid, start_date: datetime, end_date: datetime, now: datetime, hour: int = 0) -> float:
+    """
+    Total for whole tracking days start_date..end_date (inclusive), read from the daily rollup.
+    Rollup rows hold sessions already cut at day starts, so the sum is exact at the edges.
+    """
+    range_start, _ = get_day_bounds(start_date)
+    _, range_end = get_day_bounds(end_date)
+    row = conn.execute(
+        "SELECT COALESCE(SUM(seconds), 0) AS seconds FROM daily_totals WHERE user_id=? AND day >= ? AND day < ?",
+        (uid, range_start, range_end)
+    ).fetchone()
+    total = row['seconds']
+
+    # Running session: only the part of it inside the range
+    active = get_active_timer(conn, uid)
+    if active:
+        lo = to_epoch(day_start(start_date.date(), hour))
+        hi = to_epoch(day_start(end_date.date() + timedelta(days=1), hour))
+        total += max(0, min(to_epoch(now), hi) - max(active['ts_epoch'], lo))
+    return total
+
+# --- Auto-Backup ---
+
+def auto_backup_due(next_due: Optional[str], today: str) -> bool:
+    return bool(next_due) and next_due != "NEVER" and next_due <= today
+
+def spawn_auto_backup() -> bool:
+    """Start `BACKUP-AUTO` detached, unless another run holds the lock. Never waits for it."""
+    try:
+        BACKUP_DIR.mkdir(parents=True, exist_ok=True)
+        try:
+            fd = os.open(AUTO_BACKUP_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        except FileExistsError:
+            if time.time() - AUTO_BACKUP_LOCK.stat().st_mtime < AUTO_BACKUP_STALE:
+                return False # Already running (or just finished and not yet rescheduled)
+            AUTO_BACKUP_LOCK.unlink()
+            fd = os.open(AUTO_BACKUP_LOCK, os.O_CREAT | os.O_EXCL | os.O_WRONLY)
+        os.write(fd, str(os.getpid()).encode("ascii"))
+        os.close(fd)
+    except OSError:
+        return False # Lost the race for a stale lock, or backup/ isn't writable
+
+    import subprocess
+    if os.name == "nt":
+        detach = {"creationflags": subprocess.DETACHED_PROCESS | subprocess.CREATE_NEW_PROCESS_GROUP}
+    else:
+        detach = {"start_new_session": True}
+    try:
+        # The child removes the lock when it is done
+        subprocess.Popen(
+            [sys.executable, str(SCRIPT_DIR / "Working_Code.py"), "BACKUP-AUTO"],
+            stdin=subprocess.DEVNULL, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, close_fds=True, **detach
+        )
+    except OSError:
+        release_auto_backup_lock()
+        return False
+    return True
+
+def release_auto_backup_lock():
+    try:
+        AUTO_BACKUP_LOCK.unlink()
+    except OSError:
+        pass
+
+# --- Status File ---
+
+@profiled("status")
+def write_status_file(conn, uid, now: Optional[datetime] = None, hour: int = 0):
+    """Rewrite the user's status line (and "current") after a committed change. Best effort."""
+    now = now or datetime.now()
+    today = logical_date(now, hour)
+    day = today.isoformat()
+    active = get_active_timer(conn, uid)
+    row = conn.execute("SELECT seconds FROM daily_totals WHERE user_id=? AND day=?", (uid, day)).fetchone()
+    line = STATUS_LAYOUT.format(
+        running=active is not None,
+        start=active['ts_epoch'] if active else 0,
+        day=day.replace("-", ""),
+        closed=int(row['seconds']) if row else 0,
+        day_start=to_epoch(day_start(today, hour)),
+    )
+    try:
+        STATUS_DIR.mkdir(parents=True, exist_ok=True)
+        for name in (str(uid), "current"):
+            tmp = STATUS_DIR / f".{name}.{os.getpid()}.tmp"
+            tmp.write_text(line, encoding="ascii")
+            os.replace(tmp, STATUS_DIR / name) # Readers see the old line or the new one, never half
+    except OSError:
+        pass # The prompt just goes stale; the DB is the source of truth
+
+def remove_status_file(uid: Optional[int] = None):
+    """Drop "current" (logout), and the user's own file too when given (account deleted)."""
+    for name in ["current"] + ([str(uid)] if uid is not None else []):
+        try:
+            (STATUS_DIR / name).unlink()
+        except OSError:
+            pass
+
+def prompt_text(today: bool = False, now: Optional[datetime] = None) -> str:
+    """Elapsed time of the running timer (or today's total) from the status file alone."""
+    try:
+        running, start, day, closed, *rest = (STATUS_DIR / "current").read_text(encoding="ascii").split()
+        # Files written before the day-start field: days began at midnight
+        lo = int(rest[0]) if rest else to_epoch(datetime.strptime(day, "%Y%m%d"))
+    except (OSError, ValueError):
+        return ""
+    now = now or datetime.now()
+    now_epoch = to_epoch(now)
+    start = int(start)
+    if not today:
+        return format_duration(timedelta(seconds=now_epoch - start)) if running == "1" else ""
+
+    # Same rule as TIME-TODAY: closed time of today plus the part of the running session since
+    # the day started. Walk forward when the file was written on an earlier day.
+    total = int(closed)
+    hi = to_epoch(datetime.fromtimestamp(lo) + timedelta(days=1))
+    while now_epoch >= hi:
+        lo, hi, total = hi, to_epoch(datetime.fromtimestamp(hi) + timedelta(days=1)), 0
+    if running == "1":
+        total += max(0, now_epoch - max(start, lo))
+    return format_duration(timedelta(seconds=total))
+
+# --- Daemon Client ---
+
+def daemon_request(argv) -> Optional[int]:
+    """
+    Run argv in a warm `work --daemon` and print its reply. Returns the exit code,
+    or None when no daemon is listening (or the command isn't forwardable): run in-process.
+    """
+    if argv and argv[0] not in DAEMON_COMMANDS:
+        return None
+    if not DAEMON_SOCKET.exists():
+        return None
+
+    import json
+    import socket
+    try:
+        client = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        client.settimeout(DAEMON_CONNECT_TIMEOUT)
+        client.connect(str(DAEMON_SOCKET))
+    except (OSError, AttributeError):
+        return None # Stale socket file, a daemon not accepting in time, or no AF_UNIX on this platform
+
+    try:
+        width = os.get_terminal_size(sys.stdout.fileno()).columns
+    except (OSError, ValueError):
+        width = 80
+    request = {"argv": list(argv), "cwd": os.getcwd(), "width": width, "tty": sys.stdout.isatty()}
+
+    try:
+        reply_timeout = float(os.environ.get(DAEMON_TIMEOUT_ENV) or 60)
+    except ValueError:
+        reply_timeout = 60.0
+
+    # From here on the request may already have run: never retry it in-process
+    chunks = []
+    with client:
+        try:
+            client.settimeout(reply_timeout)
+            client.sendall(json.dumps(request).encode("utf-8"))
+            client.shutdown(socket.SHUT_WR)
+            while True:
+                chunk = client.recv(65536)
+                if not chunk:
+                    break
+                chunks.append(chunk)
+        except socket.timeout:
+            print(get_text('daemon_timeout', resolve_language(None)).format(seconds=f"{reply_timeout:g}"), file=sys.stderr)
+            return 1
+        except OSError:
+            chunks = [] # Connection reset: reported as lost below
+
+    try:
+        reply = json.loads(b"".join(chunks))
+    except ValueError:
+        print(get_text('daemon_lost', resolve_language(None)), file=sys.stderr)
+        return 1
+    sys.stdout.write(reply["out"])
+    return reply["code"]
+
+# --- FAST-MODE Dispatcher ---
+
+@profiled("render")
+def _print(title: str, *lines: str):
+    """Plain output, same layout as UI.print in FAST-MODE."""
+    print(f"--- {title.upper()} ---")
+    for line in lines:
+        print(line)
+
+def run(argv) -> bool:
+    """Serve a hot command in FAST-MODE. Returns False to fall through to the Typer app."""
+    if argv and argv[0] == "PROMPT" and argv[1:] in ([], ["--today"]):
+        # Any UI mode: reads the status file only, never the DB
+        text = prompt_text(today=bool(argv[1:]))
+        if text:
+            print(text)
+        return True
+    if not argv or argv[0] not in HOT_COMMANDS:
+        return False
+    command, args = argv[0], argv[1:]
+    if any(a.startswith("-") for a in args) or len(args) > (1 if command == "ON" else 0):
+        return False # Options/--help/bad usage: let Typer handle them
+    if not DB_PATH.exists() or not os.access(DB_PATH, os.W_OK):
+        return False
+
+    conn = sqlite3.connect(DB_PATH, timeout=10)
+    conn.row_factory = sqlite3.Row
+    profile_connection(conn)
+    try:
+        with phase("auth"):
+            if conn.execute("PRAGMA user_version").fetchone()[0] != SCHEMA_VERSION:
+                return False # Needs migrating: the full app does that
+            config = {row['key']: row['value'] for row in conn.execute("SELECT key, value FROM config")}
+        uid = config.get("current_user_id") or ""
+        if config.get("ui_mode") != "fast" or not uid.isdigit():
+            return False
+        if "next_auto_backup" not in config:
+            return False # Not scheduled yet: the full app works out the first due day
+        description = args[0] if args else None
+        if description and KEY_PATH.exists():
+            return False # Encrypting needs cryptography
+        apply_db_profile(conn, resolve_db_profile(config.get("db_profile")))
+
+        uid = int(uid)
+        texts = load_language(resolve_language(config.get("language")))
+        T = lambda key: texts.get(key, key)
+        now = datetime.now()
+        hour = day_start_hour(config.get("day_start_hour"))
+        if auto_backup_due(config["next_auto_backup"], now.strftime("%Y-%m-%d")):
+            spawn_auto_backup()
+
+        if command == "TIME":
+            active = get_active_timer(conn, uid)
+            if active:
+                duration = now - datetime.fromtimestamp(active['ts_epoch'])
+                _print(T('active_timer'), f"{T('current_session')}:", format_duration(duration))
+            else:
+                _print("Status", T('timer_inactive'))
+        elif command == "TIME-TODAY":
+            today = day_start(logical_date(now, hour), hour)
+            total = range_total_seconds(conn, uid, today, today, now, hour)
+            _print(T('daily_summary'), f"{T('total_time_today')} ({today.strftime('%d/%m/%Y')})",
+                   format_duration(timedelta(seconds=total)))
+        elif command == "ON":
+            if not open_session(conn, uid, now, description):
+                conn.rollback()
+                _print("Info", T('timer_already_running'))
+                return True
+            conn.commit()
+            write_status_file(conn, uid, now, hour)
+            _audit(conn, uid, "CMD_ON", f"Started. Desc: {description or 'None'}")
+            _print("Success", T('timer_started'), f"Time: {now.strftime('%H:%M:%S')}")
+            print(f"Note: {description}" if description else T('tip_use_description'))
+        elif command == "OFF":
+            active = get_active_timer(conn, uid)
+            seconds = close_session(conn, uid, active, now, hour) if active else None
+            if seconds is None:
+                conn.rollback()
+                _print("Info", T('timer_not_running'))
+                return True
+            conn.commit()
+            write_status_file(conn, uid, now, hour)
+            duration = format_duration(timedelta(seconds=seconds))
+            _audit(conn, uid, "CMD_OFF", f"Stopped. Duration: {duration}")
+            _print("Stopped", T('timer_stopped'), f"{T('stopped_at')}: {now.strftime('%H:%M:%S')}",
+                   f"{T('duration')}:   {duration}")
+        return True
+    except sqlite3.Error:
+        conn.rollback()
+        return False # Nothing committed: the full app retries and reports properly
+    finally:
+        conn.close()
+
+def _audit(conn, uid, action: str, details: str):
+    row = conn.execute("SELECT username FROM users WHERE id=?", (uid,)).fetchone()
+    write_audit(row['username'] if row else "SYSTEM/GUEST", action, details)
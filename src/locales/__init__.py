@@ -0,0 +1 @@
+"""Per-language text tables, imported on demand by translations.load_language()."""
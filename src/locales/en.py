@@ -0,0 +1,144 @@
+"""English texts: the reference set, and the fallback for every other language."""
+
+TEXTS = {
+    "error_critical_dir": "CRITICAL ERROR: Cannot create data directory",
+    "error_critical_write": "CRITICAL ERROR: Database is not writable",
+    "check_permissions": "Please check file permissions.",
+    "database_error": "Database Error",
+    "database_locked_hint": "Hint: The database might be locked by another process or permissions are denied.",
+    "invalid_date_format": "Error: Invalid date format. Please use dd/mm/yyyy.",
+    "timer_already_running": "Timer is already running! ⏳",
+    "timer_started": "TIMER STARTED",
+    "timer_not_running": "Timer is NOT running! 🛑",
+    "timer_stopped": "TIMER STOPPED",
+    "stopped_at": "Stopped at",
+    "duration": "Duration",
+    "current_session": "Current Session",
+    "active_timer": "Active Timer",
+    "timer_inactive": "Timer is inactive. 💤",
+    "daily_summary": "Daily Summary",
+    "total_time_today": "Total Time Today",
+    "database_path": "Database Path",
+    "database_exist_error": "Database does not exist yet!",
+    "backup_created": "Backup created",
+    "location": "Location",
+    "total_time_on": "Total Time on",
+    "historical_data": "Historical Data",
+    "range_summary": "Range Summary",
+    "total_time": "Total Time",
+    "first_start_today": "First Start Today",
+    "no_sessions_today": "No sessions started today.",
+    "first_start_on": "First Start on",
+    "no_sessions_found": "No sessions found on",
+    "database_empty": "Database empty.",
+    "clear_confirmation": "Are you sure you want to delete ALL tracking data? (Backups are safe)",
+    "aborted": "Aborted.",
+    "database_cleared": "Database CLEARED. 🗑️",
+    "welcome_banner": "Visual Time Tracker",
+    "col_command": "Command",
+    "col_desc": "Description",
+    "col_usage": "Usage",
+    "desc_on": "Start the timer",
+    "desc_off": "Stop the timer",
+    "desc_time": "Current session duration",
+    "desc_time_today": "Total time worked today",
+    "desc_db": "Show database path",
+    "desc_backup": "Backup database",
+    "desc_time_select": "Time for specific day",
+    "desc_time_range": "Time for date range",
+    "desc_init_time": "First start time today",
+    "desc_init_time_when": "First start on specific day",
+    "desc_clear_all": "Clear all data",
+    "desc_lang": "Show current language",
+    "desc_lang_set": "Change language",
+    "language_current": "Current Language",
+    "language_select": "Select Language",
+    "language_updated": "Language updated to",
+    "help_footer": "Use 'work [COMMAND] --help' for more info.",
+    "ai_config_menu": "AI Provider Configuration",
+    "ai_provider_select": "Select AI Provider (GEMINI/OPENAI)",
+    "ai_key_prompt": "Enter API Key",
+    "ai_key_saved": "API Key saved for",
+    "ai_analyzing": "Analyzing data with",
+    "ai_error": "AI Error",
+    "desc_ai_config": "Configure AI Provider",
+    "desc_ai_gen_ask": "Ask AI (Full Context)",
+    "desc_ai_range_ask": "Ask AI (Date Range)",
+    "desc_export_csv": "Export history to CSV",
+    "desc_export_pdf": "Export history to PDF Report",
+    "export_csv_success": "Data exported to CSV",
+    "export_pdf_success": "PDF Report generated",
+    "header_date": "Date",
+    "header_start": "Start",
+    "header_end": "End",
+    "header_duration": "Duration",
+    "report_title": "Work History Report",
+    "report_summary": "Summary",
+    "total_sessions": "Total Sessions",
+    "total_duration": "Total Duration",
+    "desc_load_backup": "Restore backup file",
+    "desc_config_backup": "Configure Auto-Backup",
+    "backup_restore_confirm": "WARNING: This will overwrite current data. Restore from",
+    "backup_restored": "Database successfully restored.",
+    "backup_not_found": "Backup file not found.",
+    "backup_config_updated": "Auto-backup frequency set to",
+    "backup_auto_triggered": "Auto-backup triggered",
+    "tip_use_description": "Tip: You can add a description: work ON 'Task Name'",
+    "header_desc": "Description",
+    "desc_init_encryption": "Initialize Encryption",
+    "desc_get_key": "Show Encryption Key",
+    "desc_change_key": "Change Key (Wipe Data)",
+    "desc_encrypt_on": "Enable Encryption (Migrate)",
+    "desc_encrypt_off": "Disable Encryption (Migrate)",
+    "encrypt_init_prompt": "Do you want to enable database encryption for privacy? (y/n)",
+    "encrypt_key_setup": "Setup Key",
+    "encrypt_key_saved": "Encryption Key saved. Do not lose it if you move data.",
+    "encrypt_warning_wipe": "WARNING: Changing key requires wiping data or re-encrypting. This specific command wipes data for safety. Continue?",
+    "encrypt_enabled": "Encryption Enabled. Database encrypted.",
+    "encrypt_disabled": "Encryption Disabled. Database decrypted.",
+    "desc_send_to": "Email Report (Interactive)",
+    "desc_send_backup_to": "Email from Backup (Interactive)",
+    "email_subject": "Work Report",
+    "email_body_prompt": "Enter email body text",
+    "email_sent_auto": "Email client opened with attachment.",
+    "email_manual_hint": "If it didn't open, please compose email manually and attach:",
+    "auth_login_required": "Login Required. Use 'work LOGIN' or 'work REGISTER'.",
+    "auth_register_success": "User registered successfully!",
+    "auth_login_success": "Logged in as",
+    "auth_logout": "Logged out.",
+    "auth_failed": "Authentication Failed. Invalid username or password.",
+    "auth_user_delete_confirm": "WARNING: This will permanently delete your user and ALL your data. Password required:",
+    "desc_login": "Login to your account",
+    "desc_register": "Create a new account",
+    "desc_user_delete": "Delete account (Permanent)",
+    "desc_logout": "End session",
+    "desc_db_profile": "Show/set storage profile",
+    "desc_rollup_check": "Check daily totals against events",
+    "daemon_lost": "Lost connection to the work daemon; the command may not have run.",
+    "daemon_timeout": "The work daemon did not reply within {seconds}s; the command may still run.",
+    "daemon_listening": "Daemon listening on",
+    "daemon_already_running": "A work daemon is already running.",
+    "daemon_unsupported": "Daemon mode needs Unix domain sockets (not available on this platform).",
+    "daemon_stopped": "Daemon stopped.",
+    "desc_daemon": "Keep a warm background process for instant replies",
+    "desc_prompt": "Running time for shell prompts (no DB access)",
+    "desc_profile": "Time each phase of a command (WORK_PROFILE=json logs it)",
+    "batch_dry_run": "Dry run: nothing was saved.",
+    "desc_batch": "Run many operations from a file/stdin in one transaction",
+    "import_sessions": "Sessions imported",
+    "import_duplicates": "Already present (skipped)",
+    "import_errors": "Invalid records",
+    "import_rolled_back": "Nothing was imported. Fix the file or use --skip-invalid.",
+    "desc_import": "Bulk-load history from CSV/JSONL",
+    "history_next": "Next page",
+    "desc_history": "List past sessions page by page",
+    "day_start_is": "Tracking days start at {hour}",
+    "desc_day_start": "Show/set the hour a day starts",
+    "desc_time_stats": "Totals per week/month/year",
+    "stats_invalid_unit": "Invalid period. Use",
+    "stats_empty": "No sessions in this range.",
+    "header_period": "Period",
+    "header_sessions": "Sessions",
+    "header_average": "Average",
+    "header_first_start": "First Start",
+}
@@ -0,0 +1,144 @@
+"""Spanish texts. Keys missing here fall back to EN (locales/en.py)."""
+
+TEXTS = {
+    "error_critical_dir": "ERROR CRÍTICO: No se puede crear el directorio de datos",
+    "error_critical_write": "ERROR CRÍTICO: La base de datos no es escribible",
+    "check_permissions": "Por favor verifique los permisos.",
+    "database_error": "Error de Base de Datos",
+    "database_locked_hint": "Consejo: La base de datos puede estar bloqueada o sin permisos.",
+    "invalid_date_format": "Error: Formato de fecha inválido. Use dd/mm/yyyy.",
+    "timer_already_running": "¡El temporizador ya está corriendo! ⏳",
+    "timer_started": "TEMPORIZADOR INICIADO",
+    "timer_not_running": "¡El temporizador NO está corriendo! 🛑",
+    "timer_stopped": "TEMPORIZADOR DETENIDO",
+    "stopped_at": "Detenido a las",
+    "duration": "Duración",
+    "current_session": "Sesión Actual",
+    "active_timer": "Temporizador Activo",
+    "timer_inactive": "Temporizador inactivo. 💤",
+    "daily_summary": "Resumen Diario",
+    "total_time_today": "Tiempo Total Hoy",
+    "database_path": "Ruta de Base de Datos",
+    "database_exist_error": "¡La base de datos aún no existe!",
+    "backup_created": "Copia de seguridad creada",
+    "location": "Ubicación",
+    "total_time_on": "Tiempo Total el",
+    "historical_data": "Datos Históricos",
+    "range_summary": "Resumen de Rango",
+    "total_time": "Tiempo Total",
+    "first_start_today": "Primer Inicio Hoy",
+    "no_sessions_today": "No hay sesiones iniciadas hoy.",
+    "first_start_on": "Primer Inicio el",
+    "no_sessions_found": "No se encontraron sesiones el",
+    "database_empty": "Base de datos vacía.",
+    "clear_confirmation": "¿Está seguro de borrar TODOS los datos? (Las copias de seguridad están seguras)",
+    "aborted": "Cancelado.",
+    "database_cleared": "Base de datos BORRADA. 🗑️",
+    "welcome_banner": "Rastreador de Tiempo Visual",
+    "col_command": "Comando",
+    "col_desc": "Descripción",
+    "col_usage": "Uso",
+    "desc_on": "Iniciar temporizador",
+    "desc_off": "Detener temporizador",
+    "desc_time": "Duración sesión actual",
+    "desc_time_today": "Tiempo trabajado hoy",
+    "desc_db": "Ver ruta base de datos",
+    "desc_backup": "Crear copia de seguridad",
+    "desc_time_select": "Tiempo en fecha específica",
+    "desc_time_range": "Tiempo en rango de fechas",
+    "desc_init_time": "Hora primer inicio hoy",
+    "desc_init_time_when": "Hora primer inicio fecha",
+    "desc_clear_all": "Borrar todos los datos",
+    "desc_lang": "Ver idioma actual",
+    "desc_lang_set": "Cambiar idioma",
+    "language_current": "Idioma Actual",
+    "language_select": "Seleccionar Idioma",
+    "language_updated": "Idioma actualizado a",
+    "help_footer": "Use 'work [COMANDO] --help' para más info.",
+    "ai_config_menu": "Configuración de Proveedor IA",
+    "ai_provider_select": "Seleccione Proveedor IA (GEMINI/OPENAI)",
+    "ai_key_prompt": "Ingrese API Key",
+    "ai_key_saved": "API Key guardada para",
+    "ai_analyzing": "Analizando datos con",
+    "ai_error": "Error de IA",
+    "desc_ai_config": "Configurar Proveedor IA",
+    "desc_ai_gen_ask": "Preguntar IA (Contexto Completo)",
+    "desc_ai_range_ask": "Preguntar IA (Rango Fechas)",
+    "desc_export_csv": "Exportar historial a CSV",
+    "desc_export_pdf": "Exportar reporte PDF",
+    "export_csv_success": "Datos exportados a CSV",
+    "export_pdf_success": "Reporte PDF generado",
+    "header_date": "Fecha",
+    "header_start": "Inicio",
+    "header_end": "Fin",
+    "header_duration": "Duración",
+    "report_title": "Reporte de Historial Laboral",
+    "report_summary": "Resumen",
+    "total_sessions": "Total Sesiones",
+    "total_duration": "Tiempo Total",
+    "desc_load_backup": "Restaurar copia de seguridad",
+    "desc_config_backup": "Configurar Auto-Backup",
+    "backup_restore_confirm": "ADVERTENCIA: Esto sobrescribirá los datos actuales. ¿Restaurar desde",
+    "backup_restored": "Base de datos restaurada con éxito.",
+    "backup_not_found": "Archivo de copia de seguridad no encontrado.",
+    "backup_config_updated": "Frecuencia de auto-backup configurada en",
+    "backup_auto_triggered": "Auto-backup activado",
+    "tip_use_description": "Consejo: Puedes añadir una descripción: work ON 'Nombre Tarea'",
+    "header_desc": "Descripción",
+    "desc_init_encryption": "Inicializar Encriptación",
+    "desc_get_key": "Mostrar Clave Encriptación",
+    "desc_change_key": "Cambiar Clave (Borrar Datos)",
+    "desc_encrypt_on": "Activar Encriptación (Migrar)",
+    "desc_encrypt_off": "Desactivar Encriptación (Migrar)",
+    "encrypt_init_prompt": "¿Quieres activar la encriptación de la base de datos para privacidad? (y/n)",
+    "encrypt_key_setup": "Configurar Clave",
+    "encrypt_key_saved": "Clave guardada. No la pierdas si mueves los datos.",
+    "encrypt_warning_wipe": "ADVERTENCIA: Cambiar la clave requiere borrar datos o re-encriptar. Este comando borra datos por seguridad. ¿Continuar?",
+    "encrypt_enabled": "Encriptación Activada. Base de datos encriptada.",
+    "encrypt_disabled": "Encriptación Desactivada. Base de datos desencriptada.",
+    "desc_send_to": "Enviar Reporte (Email)",
+    "desc_send_backup_to": "Enviar desde Backup (Email)",
+    "email_subject": "Reporte de Trabajo",
+    "email_body_prompt": "Ingresa el texto del correo",
+    "email_sent_auto": "Cliente de correo abierto con adjunto.",
+    "email_manual_hint": "Si no abrió, por favor adjunta manualmente:",
+    "auth_login_required": "Inicio de Sesión Requerido. Usa 'work LOGIN' o 'work REGISTER'.",
+    "auth_register_success": "¡Usuario registrado con éxito!",
+    "auth_login_success": "Sesión iniciada como",
+    "auth_logout": "Sesión cerrada.",
+    "auth_failed": "Fallo de Autenticación. Usuario o contraseña inválidos.",
+    "auth_user_delete_confirm": "ADVERTENCIA: Esto borrará permanentemente tu usuario y TODOS tus datos. Contraseña requerida:",
+    "desc_login": "Iniciar sesión",
+    "desc_register": "Crear cuenta nueva",
+    "desc_user_delete": "Borrar cuenta (Permanente)",
+    "desc_logout": "Cerrar sesión",
+    "desc_db_profile": "Ver/cambiar perfil de almacenamiento",
+    "desc_rollup_check": "Comprobar totales diarios contra eventos",
+    "daemon_lost": "Se perdió la conexión con el daemon de work; puede que el comando no se haya ejecutado.",
+    "daemon_timeout": "El daemon de work no respondió en {seconds}s; puede que el comando aún se ejecute.",
+    "daemon_listening": "Daemon escuchando en",
+    "daemon_already_running": "Ya hay un daemon de work en ejecución.",
+    "daemon_unsupported": "El modo daemon necesita sockets Unix (no disponibles en esta plataforma).",
+    "daemon_stopped": "Daemon detenido.",
+    "desc_daemon": "Mantener un proceso en segundo plano para respuestas instantáneas",
+    "desc_prompt": "Tiempo en curso para el prompt de la shell (sin acceder a la BD)",
+    "desc_profile": "Medir cada fase de un comando (WORK_PROFILE=json lo registra)",
+    "batch_dry_run": "Simulación: no se guardó nada.",
+    "desc_batch": "Ejecutar muchas operaciones desde un archivo/stdin en una transacción",
+    "import_sessions": "Sesiones importadas",
+    "import_duplicates": "Ya existentes (omitidas)",
+    "import_errors": "Registros inválidos",
+    "import_rolled_back": "No se importó nada. Corrija el archivo o use --skip-invalid.",
+    "desc_import": "Cargar historial desde CSV/JSONL",
+    "history_next": "Página siguiente",
+    "desc_history": "Lista las sesiones pasadas página a página",
+    "day_start_is": "Los días de registro empiezan a las {hour}",
+    "desc_day_start": "Ver/cambiar la hora en que empieza el día",
+    "desc_time_stats": "Totales por semana/mes/año",
+    "stats_invalid_unit": "Periodo no válido. Usa",
+    "stats_empty": "No hay sesiones en este rango.",
+    "header_period": "Periodo",
+    "header_sessions": "Sesiones",
+    "header_average": "Media",
+    "header_first_start": "Primer inicio",
+}
@@ -0,0 +1,144 @@
+"""French texts. Keys missing here fall back to EN (locales/en.py)."""
+
+TEXTS = {
+    "error_critical_dir": "ERREUR CRITIQUE: Impossible de créer le répertoire",
+    "error_critical_write": "ERREUR CRITIQUE: Base de données non inscriptible",
+    "check_permissions": "Veuillez vérifier les permissions.",
+    "database_error": "Erreur Base de Données",
+    "database_locked_hint": "Astuce: La base de données est peut-être verrouillée.",
+    "invalid_date_format": "Erreur: Format de date invalide. Utilisez jj/mm/aaaa.",
+    "timer_already_running": "Le minuteur tourne déjà! ⏳",
+    "timer_started": "MINUTEUR DÉMARRÉ",
+    "timer_not_running": "Le minuteur NE tourne PAS! 🛑",
+    "timer_stopped": "MINUTEUR ARRÊTÉ",
+    "stopped_at": "Arrêté à",
+    "duration": "Durée",
+    "current_session": "Session Actuelle",
+    "active_timer": "Minuteur Actif",
+    "timer_inactive": "Minuteur inactif. 💤",
+    "daily_summary": "Résumé Quotidien",
+    "total_time_today": "Temps Total Aujourd'hui",
+    "database_path": "Chemin Base de Données",
+    "database_exist_error": "La base de données n'existe pas encore!",
+    "backup_created": "Sauvegarde créée",
+    "location": "Emplacement",
+    "total_time_on": "Temps Total le",
+    "historical_data": "Données Historiques",
+    "range_summary": "Résumé de Période",
+    "total_time": "Temps Total",
+    "first_start_today": "Premier Démarrage",
+    "no_sessions_today": "Aucune session démarrée aujourd'hui.",
+    "first_start_on": "Premier Démarrage le",
+    "no_sessions_found": "Aucune session trouvée le",
+    "database_empty": "Base de données vide.",
+    "clear_confirmation": "Voulez-vous vraiment effacer TOUTES les données? (Sauvegardes sécurisées)",
+    "aborted": "Annulé.",
+    "database_cleared": "Base de données EFFACÉE. 🗑️",
+    "welcome_banner": "Suivi du Temps Visuel",
+    "col_command": "Commande",
+    "col_desc": "Description",
+    "col_usage": "Usage",
+    "desc_on": "Démarrer le minuteur",
+    "desc_off": "Arrêter le minuteur",
+    "desc_time": "Durée session actuelle",
+    "desc_time_today": "Temps total aujourd'hui",
+    "desc_db": "Voir chemin BDD",
+    "desc_backup": "Sauvegarder BDD",
+    "desc_time_select": "Temps pour date spécifique",
+    "desc_time_range": "Temps pour plage de dates",
+    "desc_init_time": "Premier démarrage ajd",
+    "desc_init_time_when": "Premier démarrage date",
+    "desc_clear_all": "Effacer toutes les données",
+    "desc_lang": "Voir langue actuelle",
+    "desc_lang_set": "Changer de langue",
+    "language_current": "Langue Actuelle",
+    "language_select": "Sélectionner Langue",
+    "language_updated": "Langue mise à jour vers",
+    "help_footer": "Utilisez 'work [COMMANDE] --help' pour plus d'infos.",
+    "ai_config_menu": "Configuration Fournisseur IA",
+    "ai_provider_select": "Sélectionner Fournisseur IA (GEMINI/OPENAI)",
+    "ai_key_prompt": "Entrez Clé API",
+    "ai_key_saved": "Clé API enregistrée pour",
+    "ai_analyzing": "Analyse des données avec",
+    "ai_error": "Erreur IA",
+    "desc_ai_config": "Configurer Fournisseur IA",
+    "desc_ai_gen_ask": "Demander IA (Contexte Complet)",
+    "desc_ai_range_ask": "Demander IA (Plage Dates)",
+    "desc_export_csv": "Exporter en CSV",
+    "desc_export_pdf": "Exporter rapport PDF",
+    "export_csv_success": "Données exportées en CSV",
+    "export_pdf_success": "Rapport PDF généré",
+    "header_date": "Date",
+    "header_start": "Début",
+    "header_end": "Fin",
+    "header_duration": "Durée",
+    "report_title": "Rapport d'activité",
+    "report_summary": "Résumé",
+    "total_sessions": "Sessions Totales",
+    "total_duration": "Durée Totale",
+    "desc_load_backup": "Restaurer la sauvegarde",
+    "desc_config_backup": "Configurer Auto-Sauvegarde",
+    "backup_restore_confirm": "ATTENTION: Cela écrasera les données actuelles. Restaurer depuis",
+    "backup_restored": "Base de données restaurée avec succès.",
+    "backup_not_found": "Fichier de sauvegarde introuvable.",
+    "backup_config_updated": "Fréquence de sauvegarde auto réglée sur",
+    "backup_auto_triggered": "Sauvegarde auto déclenchée",
+    "tip_use_description": "Astuce: Vous pouvez ajouter une description: work ON 'Nom Tâche'",
+    "header_desc": "Description",
+    "desc_init_encryption": "Initialiser Chiffrement",
+    "desc_get_key": "Afficher Clé Chiffrement",
+    "desc_change_key": "Changer Clé (Effacer Données)",
+    "desc_encrypt_on": "Activer Chiffrement (Migrer)",
+    "desc_encrypt_off": "Désactiver Chiffrement (Migrer)",
+    "encrypt_init_prompt": "Voulez-vous activer le chiffrement pour la confidentialité? (y/n)",
+    "encrypt_key_setup": "Configurer Clé",
+    "encrypt_key_saved": "Clé sauvegardée. Ne la perdez pas.",
+    "encrypt_warning_wipe": "ATTENTION: Changer la clé nécessite d'effacer les données. Continuer?",
+    "encrypt_enabled": "Chiffrement Activé.",
+    "encrypt_disabled": "Chiffrement Désactivé.",
+    "desc_send_to": "Envoyer Rapport (Email)",
+    "desc_send_backup_to": "Envoyer depuis Backup (Email)",
+    "email_subject": "Rapport de Travail",
+    "email_body_prompt": "Entrez le texte du courriel",
+    "email_sent_auto": "Client de messagerie ouvert.",
+    "email_manual_hint": "Si non ouvert, veuillez joindre manuellement:",
+    "auth_login_required": "Connexion requise. Utilisez 'work LOGIN' ou 'work REGISTER'.",
+    "auth_register_success": "Utilisateur enregistré avec succès!",
+    "auth_login_success": "Connecté en tant que",
+    "auth_logout": "Déconnecté.",
+    "auth_failed": "Échec de l'authentification. Nom d'utilisateur ou mot de passe invalide.",
+    "auth_user_delete_confirm": "ATTENTION: Cela supprimera définitivement votre compte et TOUTES vos données. Mot de passe requis:",
+    "desc_login": "Se connecter",
+    "desc_register": "Créer un compte",
+    "desc_user_delete": "Supprimer compte (Permanent)",
+    "desc_logout": "Se déconnecter",
+    "desc_db_profile": "Voir/changer le profil de stockage",
+    "desc_rollup_check": "Vérifier les totaux journaliers",
+    "daemon_lost": "Connexion au démon work perdue ; la commande n'a peut-être pas été exécutée.",
+    "daemon_timeout": "Le démon work n'a pas répondu en {seconds}s ; la commande peut encore s'exécuter.",
+    "daemon_listening": "Démon à l'écoute sur",
+    "daemon_already_running": "Un démon work est déjà en cours d'exécution.",
+    "daemon_unsupported": "Le mode démon nécessite des sockets Unix (indisponibles sur cette plateforme).",
+    "daemon_stopped": "Démon arrêté.",
+    "desc_daemon": "Garder un processus en arrière-plan pour des réponses instantanées",
+    "desc_prompt": "Temps en cours pour le prompt du shell (sans accès à la BD)",
+    "desc_profile": "Chronométrer chaque phase d'une commande (WORK_PROFILE=json l'enregistre)",
+    "batch_dry_run": "Simulation : rien n'a été enregistré.",
+    "desc_batch": "Exécuter plusieurs opérations depuis un fichier/stdin en une transaction",
+    "import_sessions": "Sessions importées",
+    "import_duplicates": "Déjà présentes (ignorées)",
+    "import_errors": "Enregistrements invalides",
+    "import_rolled_back": "Rien n'a été importé. Corrigez le fichier ou utilisez --skip-invalid.",
+    "desc_import": "Importer l'historique depuis CSV/JSONL",
+    "history_next": "Page suivante",
+    "desc_history": "Liste les sessions passées page par page",
+    "day_start_is": "Les journées de suivi commencent à {hour}",
+    "desc_day_start": "Voir/changer l'heure de début de journée",
+    "desc_time_stats": "Totaux par semaine/mois/année",
+    "stats_invalid_unit": "Période invalide. Utilisez",
+    "stats_empty": "Aucune session sur cette période.",
+    "header_period": "Période",
+    "header_sessions": "Sessions",
+    "header_average": "Moyenne",
+    "header_first_start": "Premier début",
+}
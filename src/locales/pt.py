@@ -0,0 +1,144 @@
+"""Portuguese texts. Keys missing here fall back to EN (locales/en.py)."""
+
+TEXTS = {
+    "error_critical_dir": "ERRO CRÍTICO: Não é possível criar diretório",
+    "error_critical_write": "ERRO CRÍTICO: Banco de dados não gravável",
+    "check_permissions": "Verifique as permissões.",
+    "database_error": "Erro no Banco de Dados",
+    "database_locked_hint": "Dica: O banco pode estar bloqueado ou sem permissão.",
+    "invalid_date_format": "Erro: Formato inválido. Use dd/mm/aaaa.",
+    "timer_already_running": "O cronômetro já está rodando! ⏳",
+    "timer_started": "CRONÔMETRO INICIADO",
+    "timer_not_running": "O cronômetro NÃO está rodando! 🛑",
+    "timer_stopped": "CRONÔMETRO PARADO",
+    "stopped_at": "Parado às",
+    "duration": "Duração",
+    "current_session": "Sessão Atual",
+    "active_timer": "Cronômetro Ativo",
+    "timer_inactive": "Cronômetro inativo. 💤",
+    "daily_summary": "Resumo Diário",
+    "total_time_today": "Tempo Total Hoje",
+    "database_path": "Caminho do Banco",
+    "database_exist_error": "Banco de dados ainda não existe!",
+    "backup_created": "Backup criado",
+    "location": "Local",
+    "total_time_on": "Tempo Total em",
+    "historical_data": "Dados Históricos",
+    "range_summary": "Resumo do Período",
+    "total_time": "Tempo Total",
+    "first_start_today": "Primeiro Início Hoje",
+    "no_sessions_today": "Nenhuma sessão iniciada hoje.",
+    "first_start_on": "Primeiro Início em",
+    "no_sessions_found": "Nenhuma sessão encontrada em",
+    "database_empty": "Banco de dados vazio.",
+    "clear_confirmation": "Tem certeza que deseja apagar TODOS os dados? (Backups seguros)",
+    "aborted": "Cancelado.",
+    "database_cleared": "Banco de dados APAGADO. 🗑️",
+    "welcome_banner": "Rastreador de Tempo Visual",
+    "col_command": "Comando",
+    "col_desc": "Descrição",
+    "col_usage": "Uso",
+    "desc_on": "Iniciar cronômetro",
+    "desc_off": "Parar cronômetro",
+    "desc_time": "Duração da sessão atual",
+    "desc_time_today": "Tempo trabalhado hoje",
+    "desc_db": "Ver caminho do banco",
+    "desc_backup": "Fazer backup do banco",
+    "desc_time_select": "Tempo em data específica",
+    "desc_time_range": "Tempo em intervalo de datas",
+    "desc_init_time": "Hora primeiro início hoje",
+    "desc_init_time_when": "Hora primeiro início data",
+    "desc_clear_all": "Apagar todos os dados",
+    "desc_lang": "Ver idioma atual",
+    "desc_lang_set": "Mudar idioma",
+    "language_current": "Idioma Atual",
+    "language_select": "Selecionar Idioma",
+    "language_updated": "Idioma atualizado para",
+    "help_footer": "Use 'work [COMANDO] --help' para mais info.",
+    "ai_config_menu": "Configuração Provedor IA",
+    "ai_provider_select": "Selecionar Provedor IA (GEMINI/OPENAI)",
+    "ai_key_prompt": "Digite a Chave API",
+    "ai_key_saved": "Chave API salva para",
+    "ai_analyzing": "Analisando dados com",
+    "ai_error": "Erro de IA",
+    "desc_ai_config": "Configurar Provedor IA",
+    "desc_ai_gen_ask": "Perguntar IA (Contexto Completo)",
+    "desc_ai_range_ask": "Perguntar IA (Intervalo Datas)",
+    "desc_export_csv": "Exportar para CSV",
+    "desc_export_pdf": "Exportar relatório PDF",
+    "export_csv_success": "Dados exportados para CSV",
+    "export_pdf_success": "Relatório PDF gerado",
+    "header_date": "Data",
+    "header_start": "Início",
+    "header_end": "Fim",
+    "header_duration": "Duração",
+    "report_title": "Relatório de Histórico",
+    "report_summary": "Resumo",
+    "total_sessions": "Sessões Totais",
+    "total_duration": "Duração Total",
+    "desc_load_backup": "Restaurar backup",
+    "desc_config_backup": "Configurar Auto-Backup",
+    "backup_restore_confirm": "AVISO: Isso substituirá os dados atuais. Restaurar de",
+    "backup_restored": "Banco de dados restaurado com sucesso.",
+    "backup_not_found": "Arquivo de backup não encontrado.",
+    "backup_config_updated": "Frequência de auto-backup definida para",
+    "backup_auto_triggered": "Auto-backup acionado",
+    "tip_use_description": "Dica: Você pode adicionar uma descrição: work ON 'Nome Tarefa'",
+    "header_desc": "Descrição",
+    "desc_init_encryption": "Inicializar Criptografia",
+    "desc_get_key": "Mostrar Chave Criptografia",
+    "desc_change_key": "Mudar Chave (Apagar Dados)",
+    "desc_encrypt_on": "Ativar Criptografia (Migrar)",
+    "desc_encrypt_off": "Desativar Criptografia (Migrar)",
+    "encrypt_init_prompt": "Deseja ativar criptografia do banco de dados? (y/n)",
+    "encrypt_key_setup": "Configurar Chave",
+    "encrypt_key_saved": "Chave salva. Não a perca.",
+    "encrypt_warning_wipe": "AVISO: Mudar a chave requer apagar dados. Continuar?",
+    "encrypt_enabled": "Criptografia Ativada.",
+    "encrypt_disabled": "Criptografia Desativada.",
+    "desc_send_to": "Enviar Relatório (Email)",
+    "desc_send_backup_to": "Enviar do Backup (Email)",
+    "email_subject": "Relatório de Trabalho",
+    "email_body_prompt": "Digite o texto do email",
+    "email_sent_auto": "Cliente de email aberto.",
+    "email_manual_hint": "Se não abriu, anexe manualmente:",
+    "auth_login_required": "Login Necessário. Use 'work LOGIN' ou 'work REGISTER'.",
+    "auth_register_success": "Usuário registrado com sucesso!",
+    "auth_login_success": "Logado como",
+    "auth_logout": "Deslogado.",
+    "auth_failed": "Falha na autenticação. Usuário ou senha inválidos.",
+    "auth_user_delete_confirm": "AVISO: Isso apagará permanentemente seu usuário e TODOS os seus dados. Senha necessária:",
+    "desc_login": "Fazer login",
+    "desc_register": "Criar nova conta",
+    "desc_user_delete": "Apagar conta (Permanente)",
+    "desc_logout": "Sair da sessão",
+    "desc_db_profile": "Ver/alterar perfil de armazenamento",
+    "desc_rollup_check": "Verificar totais diários com eventos",
+    "daemon_lost": "Conexão com o daemon do work perdida; o comando pode não ter sido executado.",
+    "daemon_timeout": "O daemon do work não respondeu em {seconds}s; o comando ainda pode ser executado.",
+    "daemon_listening": "Daemon escutando em",
+    "daemon_already_running": "Já existe um daemon do work em execução.",
+    "daemon_unsupported": "O modo daemon precisa de sockets Unix (indisponíveis nesta plataforma).",
+    "daemon_stopped": "Daemon parado.",
+    "desc_daemon": "Manter um processo em segundo plano para respostas instantâneas",
+    "desc_prompt": "Tempo em curso para o prompt do shell (sem acesso ao BD)",
+    "desc_profile": "Medir cada fase de um comando (WORK_PROFILE=json registra)",
+    "batch_dry_run": "Simulação: nada foi salvo.",
+    "desc_batch": "Executar várias operações de um arquivo/stdin em uma transação",
+    "import_sessions": "Sessões importadas",
+    "import_duplicates": "Já existentes (ignoradas)",
+    "import_errors": "Registros inválidos",
+    "import_rolled_back": "Nada foi importado. Corrija o arquivo ou use --skip-invalid.",
+    "desc_import": "Importar histórico de CSV/JSONL",
+    "history_next": "Próxima página",
+    "desc_history": "Lista as sessões passadas página a página",
+    "day_start_is": "Os dias de registo começam às {hour}",
+    "desc_day_start": "Ver/alterar a hora de início do dia",
+    "desc_time_stats": "Totais por semana/mês/ano",
+    "stats_invalid_unit": "Período inválido. Use",
+    "stats_empty": "Sem sessões neste intervalo.",
+    "header_period": "Período",
+    "header_sessions": "Sessões",
+    "header_average": "Média",
+    "header_first_start": "Primeiro início",
+}
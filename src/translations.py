@@ -1,460 +1,34 @@
-TRANSLATIONS = {
-    "EN": {
-        "error_critical_dir": "CRITICAL ERROR: Cannot create data directory",
-        "error_critical_write": "CRITICAL ERROR: Database is not writable",
-        "check_permissions": "Please check file permissions.",
-        "database_error": "Database Error",
-        "database_locked_hint": "Hint: The database might be locked by another process or permissions are denied.",
-        "invalid_date_format": "Error: Invalid date format. Please use dd/mm/yyyy.",
-        "timer_already_running": "Timer is already running! ⏳",
-        "timer_started": "TIMER STARTED",
-        "timer_not_running": "Timer is NOT running! 🛑",
-        "timer_stopped": "TIMER STOPPED",
-        "stopped_at": "Stopped at",
-        "duration": "Duration",
-        "current_session": "Current Session",
-        "active_timer": "Active Timer",
-        "timer_inactive": "Timer is inactive. 💤",
-        "daily_summary": "Daily Summary",
-        "total_time_today": "Total Time Today",
-        "database_path": "Database Path",
-        "database_exist_error": "Database does not exist yet!",
-        "backup_created": "Backup created",
-        "location": "Location",
-        "total_time_on": "Total Time on",
-        "historical_data": "Historical Data",
-        "range_summary": "Range Summary",
-        "total_time": "Total Time",
-        "first_start_today": "First Start Today",
-        "no_sessions_today": "No sessions started today.",
-        "first_start_on": "First Start on",
-        "no_sessions_found": "No sessions found on",
-        "database_empty": "Database empty.",
-        "clear_confirmation": "Are you sure you want to delete ALL tracking data? (Backups are safe)",
-        "aborted": "Aborted.",
-        "database_cleared": "Database CLEARED. 🗑️",
-        "welcome_banner": "Visual Time Tracker",
-        "col_command": "Command",
-        "col_desc": "Description",
-        "col_usage": "Usage",
-        "desc_on": "Start the timer",
-        "desc_off": "Stop the timer",
-        "desc_time": "Current session duration",
-        "desc_time_today": "Total time worked today",
-        "desc_db": "Show database path",
-        "desc_backup": "Backup database",
-        "desc_time_select": "Time for specific day",
-        "desc_time_range": "Time for date range",
-        "desc_init_time": "First start time today",
-        "desc_init_time_when": "First start on specific day",
-        "desc_clear_all": "Clear all data",
-        "desc_lang": "Show current language",
-        "desc_lang_set": "Change language",
-        "language_current": "Current Language",
-        "language_select": "Select Language",
-        "language_updated": "Language updated to",
-        "help_footer": "Use 'work [COMMAND] --help' for more info.",
-        "ai_config_menu": "AI Provider Configuration",
-        "ai_provider_select": "Select AI Provider (GEMINI/OPENAI)",
-        "ai_key_prompt": "Enter API Key",
-        "ai_key_saved": "API Key saved for",
-        "ai_analyzing": "Analyzing data with",
-        "ai_error": "AI Error",
-        "desc_ai_config": "Configure AI Provider",
-        "desc_ai_gen_ask": "Ask AI (Full Context)",
-        "desc_ai_range_ask": "Ask AI (Date Range)",
-        "desc_export_csv": "Export history to CSV",
-        "desc_export_pdf": "Export history to PDF Report",
-        "export_csv_success": "Data exported to CSV",
-        "export_pdf_success": "PDF Report generated",
-        "header_date": "Date",
-        "header_start": "Start",
-        "header_end": "End",
-        "header_duration": "Duration",
-        "report_title": "Work History Report",
-        "report_summary": "Summary",
-        "total_sessions": "Total Sessions",
-        "total_duration": "Total Duration",
-        "desc_load_backup": "Restore backup file",
-        "desc_config_backup": "Configure Auto-Backup",
-        "backup_restore_confirm": "WARNING: This will overwrite current data. Restore from",
-        "backup_restored": "Database successfully restored.",
-        "backup_not_found": "Backup file not found.",
-        "backup_config_updated": "Auto-backup frequency set to",
-        "backup_auto_triggered": "Auto-backup triggered",
-        "tip_use_description": "Tip: You can add a description: work ON 'Task Name'",
-        "header_desc": "Description",
-        "desc_init_encryption": "Initialize Encryption",
-        "desc_get_key": "Show Encryption Key",
-        "desc_change_key": "Change Key (Wipe Data)",
-        "desc_encrypt_on": "Enable Encryption (Migrate)",
-        "desc_encrypt_off": "Disable Encryption (Migrate)",
-        "encrypt_init_prompt": "Do you want to enable database encryption for privacy? (y/n)",
-        "encrypt_key_setup": "Setup Key",
-        "encrypt_key_saved": "Encryption Key saved. Do not lose it if you move data.",
-        "encrypt_warning_wipe": "WARNING: Changing key requires wiping data or re-encrypting. This specific command wipes data for safety. Continue?",
-        "encrypt_enabled": "Encryption Enabled. Database encrypted.",
-        "encrypt_disabled": "Encryption Disabled. Database decrypted.",
-        "desc_send_to": "Email Report (Interactive)",
-        "desc_send_backup_to": "Email from Backup (Interactive)",
-        "email_subject": "Work Report",
-        "email_body_prompt": "Enter email body text",
-        "email_sent_auto": "Email client opened with attachment.",
-        "email_manual_hint": "If it didn't open, please compose email manually and attach:",
-        "auth_login_required": "Login Required. Use 'work LOGIN' or 'work REGISTER'.",
-        "auth_register_success": "User registered successfully!",
-        "auth_login_success": "Logged in as",
-        "auth_logout": "Logged out.",
-        "auth_failed": "Authentication Failed. Invalid username or password.",
-        "auth_user_delete_confirm": "WARNING: This will permanently delete your user and ALL your data. Password required:",
-        "desc_login": "Login to your account",
-        "desc_register": "Create a new account",
-        "desc_user_delete": "Delete account (Permanent)",
-        "desc_logout": "End session"
-    },
-    "ES": {
-        "error_critical_dir": "ERROR CRÍTICO: No se puede crear el directorio de datos",
-        "error_critical_write": "ERROR CRÍTICO: La base de datos no es escribible",
-        "check_permissions": "Por favor verifique los permisos.",
-        "database_error": "Error de Base de Datos",
-        "database_locked_hint": "Consejo: La base de datos puede estar bloqueada o sin permisos.",
-        "invalid_date_format": "Error: Formato de fecha inválido. Use dd/mm/yyyy.",
-        "timer_already_running": "¡El temporizador ya está corriendo! ⏳",
-        "timer_started": "TEMPORIZADOR INICIADO",
-        "timer_not_running": "¡El temporizador NO está corriendo! 🛑",
-        "timer_stopped": "TEMPORIZADOR DETENIDO",
-        "stopped_at": "Detenido a las",
-        "duration": "Duración",
-        "current_session": "Sesión Actual",
-        "active_timer": "Temporizador Activo",
-        "timer_inactive": "Temporizador inactivo. 💤",
-        "daily_summary": "Resumen Diario",
-        "total_time_today": "Tiempo Total Hoy",
-        "database_path": "Ruta de Base de Datos",
-        "database_exist_error": "¡La base de datos aún no existe!",
-        "backup_created": "Copia de seguridad creada",
-        "location": "Ubicación",
-        "total_time_on": "Tiempo Total el",
-        "historical_data": "Datos Históricos",
-        "range_summary": "Resumen de Rango",
-        "total_time": "Tiempo Total",
-        "first_start_today": "Primer Inicio Hoy",
-        "no_sessions_today": "No hay sesiones iniciadas hoy.",
-        "first_start_on": "Primer Inicio el",
-        "no_sessions_found": "No se encontraron sesiones el",
-        "database_empty": "Base de datos vacía.",
-        "clear_confirmation": "¿Está seguro de borrar TODOS los datos? (Las copias de seguridad están seguras)",
-        "aborted": "Cancelado.",
-        "database_cleared": "Base de datos BORRADA. 🗑️",
-        "welcome_banner": "Rastreador de Tiempo Visual",
-        "col_command": "Comando",
-        "col_desc": "Descripción",
-        "col_usage": "Uso",
-        "desc_on": "Iniciar temporizador",
-        "desc_off": "Detener temporizador",
-        "desc_time": "Duración sesión actual",
-        "desc_time_today": "Tiempo trabajado hoy",
-        "desc_db": "Ver ruta base de datos",
-        "desc_backup": "Crear copia de seguridad",
-        "desc_time_select": "Tiempo en fecha específica",
-        "desc_time_range": "Tiempo en rango de fechas",
-        "desc_init_time": "Hora primer inicio hoy",
-        "desc_init_time_when": "Hora primer inicio fecha",
-        "desc_clear_all": "Borrar todos los datos",
-        "desc_lang": "Ver idioma actual",
-        "desc_lang_set": "Cambiar idioma",
-        "language_current": "Idioma Actual",
-        "language_select": "Seleccionar Idioma",
-        "language_updated": "Idioma actualizado a",
-        "help_footer": "Use 'work [COMANDO] --help' para más info.",
-        "ai_config_menu": "Configuración de Proveedor IA",
-        "ai_provider_select": "Seleccione Proveedor IA (GEMINI/OPENAI)",
-        "ai_key_prompt": "Ingrese API Key",
-        "ai_key_saved": "API Key guardada para",
-        "ai_analyzing": "Analizando datos con",
-        "ai_error": "Error de IA",
-        "desc_ai_config": "Configurar Proveedor IA",
-        "desc_ai_gen_ask": "Preguntar IA (Contexto Completo)",
-        "desc_ai_range_ask": "Preguntar IA (Rango Fechas)",
-        "desc_export_csv": "Exportar historial a CSV",
-        "desc_export_pdf": "Exportar reporte PDF",
-        "export_csv_success": "Datos exportados a CSV",
-        "export_pdf_success": "Reporte PDF generado",
-        "header_date": "Fecha",
-        "header_start": "Inicio",
-        "header_end": "Fin",
-        "header_duration": "Duración",
-        "report_title": "Reporte de Historial Laboral",
-        "report_summary": "Resumen",
-        "total_sessions": "Total Sesiones",
-        "total_duration": "Tiempo Total",
-        "desc_load_backup": "Restaurar copia de seguridad",
-        "desc_config_backup": "Configurar Auto-Backup",
-        "backup_restore_confirm": "ADVERTENCIA: Esto sobrescribirá los datos actuales. ¿Restaurar desde",
-        "backup_restored": "Base de datos restaurada con éxito.",
-        "backup_not_found": "Archivo de copia de seguridad no encontrado.",
-        "backup_config_updated": "Frecuencia de auto-backup configurada en",
-        "backup_auto_triggered": "Auto-backup activado",
-        "tip_use_description": "Consejo: Puedes añadir una descripción: work ON 'Nombre Tarea'",
-        "header_desc": "Descripción",
-        "desc_init_encryption": "Inicializar Encriptación",
-        "desc_get_key": "Mostrar Clave Encriptación",
-        "desc_change_key": "Cambiar Clave (Borrar Datos)",
-        "desc_encrypt_on": "Activar Encriptación (Migrar)",
-        "desc_encrypt_off": "Desactivar Encriptación (Migrar)",
-        "encrypt_init_prompt": "¿Quieres activar la encriptación de la base de datos para privacidad? (y/n)",
-        "encrypt_key_setup": "Configurar Clave",
-        "encrypt_key_saved": "Clave guardada. No la pierdas si mueves los datos.",
-        "encrypt_warning_wipe": "ADVERTENCIA: Cambiar la clave requiere borrar datos o re-encriptar. Este comando borra datos por seguridad. ¿Continuar?",
-        "encrypt_enabled": "Encriptación Activada. Base de datos encriptada.",
-        "encrypt_disabled": "Encriptación Desactivada. Base de datos desencriptada.",
-        "desc_send_to": "Enviar Reporte (Email)",
-        "desc_send_backup_to": "Enviar desde Backup (Email)",
-        "email_subject": "Reporte de Trabajo",
-        "email_body_prompt": "Ingresa el texto del correo",
-        "email_sent_auto": "Cliente de correo abierto con adjunto.",
-        "email_manual_hint": "Si no abrió, por favor adjunta manualmente:",
-        "auth_login_required": "Inicio de Sesión Requerido. Usa 'work LOGIN' o 'work REGISTER'.",
-        "auth_register_success": "¡Usuario registrado con éxito!",
-        "auth_login_success": "Sesión iniciada como",
-        "auth_logout": "Sesión cerrada.",
-        "auth_failed": "Fallo de Autenticación. Usuario o contraseña inválidos.",
-        "auth_user_delete_confirm": "ADVERTENCIA: Esto borrará permanentemente tu usuario y TODOS tus datos. Contraseña requerida:",
-        "desc_login": "Iniciar sesión",
-        "desc_register": "Crear cuenta nueva",
-        "desc_user_delete": "Borrar cuenta (Permanente)",
-        "desc_logout": "Cerrar sesión"
-    },
-    "FR": {
-        "error_critical_dir": "ERREUR CRITIQUE: Impossible de créer le répertoire",
-        "error_critical_write": "ERREUR CRITIQUE: Base de données non inscriptible",
-        "check_permissions": "Veuillez vérifier les permissions.",
-        "database_error": "Erreur Base de Données",
-        "database_locked_hint": "Astuce: La base de données est peut-être verrouillée.",
-        "invalid_date_format": "Erreur: Format de date invalide. Utilisez jj/mm/aaaa.",
-        "timer_already_running": "Le minuteur tourne déjà! ⏳",
-        "timer_started": "MINUTEUR DÉMARRÉ",
-        "timer_not_running": "Le minuteur NE tourne PAS! 🛑",
-        "timer_stopped": "MINUTEUR ARRÊTÉ",
-        "stopped_at": "Arrêté à",
-        "duration": "Durée",
-        "current_session": "Session Actuelle",
-        "active_timer": "Minuteur Actif",
-        "timer_inactive": "Minuteur inactif. 💤",
-        "daily_summary": "Résumé Quotidien",
-        "total_time_today": "Temps Total Aujourd'hui",
-        "database_path": "Chemin Base de Données",
-        "database_exist_error": "La base de données n'existe pas encore!",
-        "backup_created": "Sauvegarde créée",
-        "location": "Emplacement",
-        "total_time_on": "Temps Total le",
-        "historical_data": "Données Historiques",
-        "range_summary": "Résumé de Période",
-        "total_time": "Temps Total",
-        "first_start_today": "Premier Démarrage",
-        "no_sessions_today": "Aucune session démarrée aujourd'hui.",
-        "first_start_on": "Premier Démarrage le",
-        "no_sessions_found": "Aucune session trouvée le",
-        "database_empty": "Base de données vide.",
-        "clear_confirmation": "Voulez-vous vraiment effacer TOUTES les données? (Sauvegardes sécurisées)",
-        "aborted": "Annulé.",
-        "database_cleared": "Base de données EFFACÉE. 🗑️",
-        "welcome_banner": "Suivi du Temps Visuel",
-        "col_command": "Commande",
-        "col_desc": "Description",
-        "col_usage": "Usage",
-        "desc_on": "Démarrer le minuteur",
-        "desc_off": "Arrêter le minuteur",
-        "desc_time": "Durée session actuelle",
-        "desc_time_today": "Temps total aujourd'hui",
-        "desc_db": "Voir chemin BDD",
-        "desc_backup": "Sauvegarder BDD",
-        "desc_time_select": "Temps pour date spécifique",
-        "desc_time_range": "Temps pour plage de dates",
-        "desc_init_time": "Premier démarrage ajd",
-        "desc_init_time_when": "Premier démarrage date",
-        "desc_clear_all": "Effacer toutes les données",
-        "desc_lang": "Voir langue actuelle",
-        "desc_lang_set": "Changer de langue",
-        "language_current": "Langue Actuelle",
-        "language_select": "Sélectionner Langue",
-        "language_updated": "Langue mise à jour vers",
-        "help_footer": "Utilisez 'work [COMMANDE] --help' pour plus d'infos.",
-        "ai_config_menu": "Configuration Fournisseur IA",
-        "ai_provider_select": "Sélectionner Fournisseur IA (GEMINI/OPENAI)",
-        "ai_key_prompt": "Entrez Clé API",
-        "ai_key_saved": "Clé API enregistrée pour",
-        "ai_analyzing": "Analyse des données avec",
-        "ai_error": "Erreur IA",
-        "desc_ai_config": "Configurer Fournisseur IA",
-        "desc_ai_gen_ask": "Demander IA (Contexte Complet)",
-        "desc_ai_range_ask": "Demander IA (Plage Dates)",
-        "desc_export_csv": "Exporter en CSV",
-        "desc_export_pdf": "Exporter rapport PDF",
-        "export_csv_success": "Données exportées en CSV",
-        "export_pdf_success": "Rapport PDF généré",
-        "header_date": "Date",
-        "header_start": "Début",
-        "header_end": "Fin",
-        "header_duration": "Durée",
-        "report_title": "Rapport d'activité",
-        "report_summary": "Résumé",
-        "total_sessions": "Sessions Totales",
-        "total_duration": "Durée Totale",
-        "desc_load_backup": "Restaurer la sauvegarde",
-        "desc_config_backup": "Configurer Auto-Sauvegarde",
-        "backup_restore_confirm": "ATTENTION: Cela écrasera les données actuelles. Restaurer depuis",
-        "backup_restored": "Base de données restaurée avec succès.",
-        "backup_not_found": "Fichier de sauvegarde introuvable.",
-        "backup_config_updated": "Fréquence de sauvegarde auto réglée sur",
-        "backup_auto_triggered": "Sauvegarde auto déclenchée",
-        "tip_use_description": "Astuce: Vous pouvez ajouter une description: work ON 'Nom Tâche'",
-        "header_desc": "Description",
-        "desc_init_encryption": "Initialiser Chiffrement",
-        "desc_get_key": "Afficher Clé Chiffrement",
-        "desc_change_key": "Changer Clé (Effacer Données)",
-        "desc_encrypt_on": "Activer Chiffrement (Migrer)",
-        "desc_encrypt_off": "Désactiver Chiffrement (Migrer)",
-        "encrypt_init_prompt": "Voulez-vous activer le chiffrement pour la confidentialité? (y/n)",
-        "encrypt_key_setup": "Configurer Clé",
-        "encrypt_key_saved": "Clé sauvegardée. Ne la perdez pas.",
-        "encrypt_warning_wipe": "ATTENTION: Changer la clé nécessite d'effacer les données. Continuer?",
-        "encrypt_enabled": "Chiffrement Activé.",
-        "encrypt_disabled": "Chiffrement Désactivé.",
-        "desc_send_to": "Envoyer Rapport (Email)",
-        "desc_send_backup_to": "Envoyer depuis Backup (Email)",
-        "email_subject": "Rapport de Travail",
-        "email_body_prompt": "Entrez le texte du courriel",
-        "email_sent_auto": "Client de messagerie ouvert.",
-        "email_manual_hint": "Si non ouvert, veuillez joindre manuellement:",
-        "auth_login_required": "Connexion requise. Utilisez 'work LOGIN' ou 'work REGISTER'.",
-        "auth_register_success": "Utilisateur enregistré avec succès!",
-        "auth_login_success": "Connecté en tant que",
-        "auth_logout": "Déconnecté.",
-        "auth_failed": "Échec de l'authentification. Nom d'utilisateur ou mot de passe invalide.",
-        "auth_user_delete_confirm": "ATTENTION: Cela supprimera définitivement votre compte et TOUTES vos données. Mot de passe requis:",
-        "desc_login": "Se connecter",
-        "desc_register": "Créer un compte",
-        "desc_user_delete": "Supprimer compte (Permanent)",
-        "desc_logout": "Se déconnecter"
-    },
-    "PT": {
-        "error_critical_dir": "ERRO CRÍTICO: Não é possível criar diretório",
-        "error_critical_write": "ERRO CRÍTICO: Banco de dados não gravável",
-        "check_permissions": "Verifique as permissões.",
-        "database_error": "Erro no Banco de Dados",
-        "database_locked_hint": "Dica: O banco pode estar bloqueado ou sem permissão.",
-        "invalid_date_format": "Erro: Formato inválido. Use dd/mm/aaaa.",
-        "timer_already_running": "O cronômetro já está rodando! ⏳",
-        "timer_started": "CRONÔMETRO INICIADO",
-        "timer_not_running": "O cronômetro NÃO está rodando! 🛑",
-        "timer_stopped": "CRONÔMETRO PARADO",
-        "stopped_at": "Parado às",
-        "duration": "Duração",
-        "current_session": "Sessão Atual",
-        "active_timer": "Cronômetro Ativo",
-        "timer_inactive": "Cronômetro inativo. 💤",
-        "daily_summary": "Resumo Diário",
-        "total_time_today": "Tempo Total Hoje",
-        "database_path": "Caminho do Banco",
-        "database_exist_error": "Banco de dados ainda não existe!",
-        "backup_created": "Backup criado",
-        "location": "Local",
-        "total_time_on": "Tempo Total em",
-        "historical_data": "Dados Históricos",
-        "range_summary": "Resumo do Período",
-        "total_time": "Tempo Total",
-        "first_start_today": "Primeiro Início Hoje",
-        "no_sessions_today": "Nenhuma sessão iniciada hoje.",
-        "first_start_on": "Primeiro Início em",
-        "no_sessions_found": "Nenhuma sessão encontrada em",
-        "database_empty": "Banco de dados vazio.",
-        "clear_confirmation": "Tem certeza que deseja apagar TODOS os dados? (Backups seguros)",
-        "aborted": "Cancelado.",
-        "database_cleared": "Banco de dados APAGADO. 🗑️",
-        "welcome_banner": "Rastreador de Tempo Visual",
-        "col_command": "Comando",
-        "col_desc": "Descrição",
-        "col_usage": "Uso",
-        "desc_on": "Iniciar cronômetro",
-        "desc_off": "Parar cronômetro",
-        "desc_time": "Duração da sessão atual",
-        "desc_time_today": "Tempo trabalhado hoje",
-        "desc_db": "Ver caminho do banco",
-        "desc_backup": "Fazer backup do banco",
-        "desc_time_select": "Tempo em data específica",
-        "desc_time_range": "Tempo em intervalo de datas",
-        "desc_init_time": "Hora primeiro início hoje",
-        "desc_init_time_when": "Hora primeiro início data",
-        "desc_clear_all": "Apagar todos os dados",
-        "desc_lang": "Ver idioma atual",
-        "desc_lang_set": "Mudar idioma",
-        "language_current": "Idioma Atual",
-        "language_select": "Selecionar Idioma",
-        "language_updated": "Idioma atualizado para",
-        "help_footer": "Use 'work [COMANDO] --help' para mais info.",
-        "ai_config_menu": "Configuração Provedor IA",
-        "ai_provider_select": "Selecionar Provedor IA (GEMINI/OPENAI)",
-        "ai_key_prompt": "Digite a Chave API",
-        "ai_key_saved": "Chave API salva para",
-        "ai_analyzing": "Analisando dados com",
-        "ai_error": "Erro de IA",
-        "desc_ai_config": "Configurar Provedor IA",
-        "desc_ai_gen_ask": "Perguntar IA (Contexto Completo)",
-        "desc_ai_range_ask": "Perguntar IA (Intervalo Datas)",
-        "desc_export_csv": "Exportar para CSV",
-        "desc_export_pdf": "Exportar relatório PDF",
-        "export_csv_success": "Dados exportados para CSV",
-        "export_pdf_success": "Relatório PDF gerado",
-        "header_date": "Data",
-        "header_start": "Início",
-        "header_end": "Fim",
-        "header_duration": "Duração",
-        "report_title": "Relatório de Histórico",
-        "report_summary": "Resumo",
-        "total_sessions": "Sessões Totais",
-        "total_duration": "Duração Total",
-        "desc_load_backup": "Restaurar backup",
-        "desc_config_backup": "Configurar Auto-Backup",
-        "backup_restore_confirm": "AVISO: Isso substituirá os dados atuais. Restaurar de",
-        "backup_restored": "Banco de dados restaurado com sucesso.",
-        "backup_not_found": "Arquivo de backup não encontrado.",
-        "backup_config_updated": "Frequência de auto-backup definida para",
-        "backup_auto_triggered": "Auto-backup acionado",
-        "tip_use_description": "Dica: Você pode adicionar uma descrição: work ON 'Nome Tarefa'",
-        "header_desc": "Descrição",
-        "desc_init_encryption": "Inicializar Criptografia",
-        "desc_get_key": "Mostrar Chave Criptografia",
-        "desc_change_key": "Mudar Chave (Apagar Dados)",
-        "desc_encrypt_on": "Ativar Criptografia (Migrar)",
-        "desc_encrypt_off": "Desativar Criptografia (Migrar)",
-        "encrypt_init_prompt": "Deseja ativar criptografia do banco de dados? (y/n)",
-        "encrypt_key_setup": "Configurar Chave",
-        "encrypt_key_saved": "Chave salva. Não a perca.",
-        "encrypt_warning_wipe": "AVISO: Mudar a chave requer apagar dados. Continuar?",
-        "encrypt_enabled": "Criptografia Ativada.",
-        "encrypt_disabled": "Criptografia Desativada.",
-        "desc_send_to": "Enviar Relatório (Email)",
-        "desc_send_backup_to": "Enviar do Backup (Email)",
-        "email_subject": "Relatório de Trabalho",
-        "email_body_prompt": "Digite o texto do email",
-        "email_sent_auto": "Cliente de email aberto.",
-        "email_manual_hint": "Se não abriu, anexe manualmente:",
-        "auth_login_required": "Login Necessário. Use 'work LOGIN' ou 'work REGISTER'.",
-        "auth_register_success": "Usuário registrado com sucesso!",
-        "auth_login_success": "Logado como",
-        "auth_logout": "Deslogado.",
-        "auth_failed": "Falha na autenticação. Usuário ou senha inválidos.",
-        "auth_user_delete_confirm": "AVISO: Isso apagará permanentemente seu usuário e TODOS os seus dados. Senha necessária:",
-        "desc_login": "Fazer login",
-        "desc_register": "Criar nova conta",
-        "desc_user_delete": "Apagar conta (Permanente)",
-        "desc_logout": "Sair da sessão"
-    }
-}
+"""
+Text lookup for the CLI. Each language lives in locales/<code>.py and is imported
+the first time it is needed; only the active language (and EN) is ever loaded.
+"""
+import importlib
+
+LANGUAGES = ("EN", "ES", "FR", "PT")
+_CATALOGS = {}
+
+def load_language(lang: str) -> dict:
+    """Texts for lang with the EN fallback already merged in. Built once per process."""
+    if lang not in LANGUAGES:
+        lang = "EN"
+    catalog = _CATALOGS.get(lang)
+    if catalog is None:
+        texts = importlib.import_module(f"locales.{lang.lower()}").TEXTS
+        catalog = texts if lang == "EN" else {**load_language("EN"), **texts}
+        _CATALOGS[lang] = catalog
+    return catalog
 
 def get_text(key: str, lang: str = "EN") -> str:
     """Retrieve text for a given key and language. Fallback to EN."""
-    if lang not in TRANSLATIONS:
-        lang = "EN"
-    return TRANSLATIONS[lang].get(key, TRANSLATIONS["EN"].get(key, key))
+    return load_language(lang).get(key, key)
+
+def missing_keys() -> dict:
+    """{lang: [keys present in EN but not in lang]} for every language with gaps."""
+    reference = importlib.import_module("locales.en").TEXTS
+    gaps = {}
+    for lang in LANGUAGES[1:]:
+        texts = importlib.import_module(f"locales.{lang.lower()}").TEXTS
+        missing = [key for key in reference if key not in texts]
+        if missing:
+            gaps[lang] = missing
+    return gaps
@@ -0,0 +1,78 @@
+"""
+Shared fixtures. The CLI keeps data/, logs/ and backup/ next to src/, so every test runs a
+private copy of src/ under tmp_path, as a subprocess, exactly like `work` would.
+"""
+import os
+import shutil
+import sqlite3
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+import pytest
+
+REPO = Path(__file__).resolve().parent.parent
+SRC = REPO / "src"
+sys.path.insert(0, str(SRC)) # Pure helpers (fast_path, translations) are tested in-process
+
+# Opt-in: WORK_SLOW_TESTS=1 runs the large-data tests (millions of rows, minutes)
+slow = pytest.mark.skipif(not os.environ.get("WORK_SLOW_TESTS"), reason="set WORK_SLOW_TESTS=1 to run")
+
+
+class Work:
+    """`work ...` against an isolated install, with one registered and logged-in user."""
+
+    def __init__(self, root: Path):
+        self.root = root
+        self.script = root / "src" / "Working_Code.py"
+        self.db_path = root / "data" / "working_code.db"
+
+    def run(self, *args, input: str = "", check: bool = True, python_flags=()) -> subprocess.CompletedProcess:
+        env = dict(os.environ, COLUMNS="200", PYTHONWARNINGS="ignore")
+        env.pop("WORK_PROFILE", None)
+        result = subprocess.run(
+            [sys.executable, *python_flags, str(self.script), *args],
+            input=input, capture_output=True, text=True, cwd=self.root, env=env, timeout=600,
+        )
+        if check:
+            assert result.returncode == 0, f"work {' '.join(args)} -> {result.returncode}\n{result.stdout}\n{result.stderr}"
+        return result
+
+    def peak_rss_mb(self, *args) -> float:
+        """Run `work ...` (output discarded) and return the child's peak RSS in MB (Linux units)."""
+        probe = (
+            "import resource, subprocess, sys\n"
+            "subprocess.run(sys.argv[1:], stdout=subprocess.DEVNULL, check=True)\n"
+            "print(resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss / 1024)\n"
+        )
+        result = subprocess.run([sys.executable, "-c", probe, sys.executable, str(self.script), *args],
+                                capture_output=True, text=True, cwd=self.root, timeout=3600)
+        assert result.returncode == 0, result.stderr
+        return float(result.stdout)
+
+    def db(self) -> sqlite3.Connection:
+        conn = sqlite3.connect(self.db_path)
+        conn.row_factory = sqlite3.Row
+        return conn
+
+
+@pytest.fixture
+def local_tz(monkeypatch):
+    """Run with a given local timezone, e.g. local_tz("Europe/Madrid")."""
+    def set_tz(name: str):
+        monkeypatch.setenv("TZ", name)
+        time.tzset()
+    yield set_tz
+    monkeypatch.undo()
+    time.tzset()
+
+
+@pytest.fixture
+def work(tmp_path) -> Work:
+    shutil.copytree(SRC, tmp_path / "src", ignore=shutil.ignore_patterns("__pycache__"))
+    for folder in ("data", "logs", "backup"):
+        (tmp_path / folder).mkdir()
+    w = Work(tmp_path)
+    w.run("REGISTER", input="tester\npw\npw\n")
+    return w
@@ -0,0 +1,43 @@
+"""BATCH: a bad line fails on its own, the rest still commit; any failure sets the exit code."""
+
+
+def batch_results(output: str) -> list:
+    return [line.split("\t")[1] for line in output.splitlines() if line[:1].isdigit() and "\t" in line]
+
+
+def test_json_field_types_fail_only_their_line(work):
+    ops = "\n".join([
+        '{"op": "ON", "at": 5}',
+        '{"op": "ON", "args": "Task"}',
+        '{"op": "ON", "args": [1]}',
+        '{"op": 7}',
+        '{"op": "ON", "args": ["Task"], "at": "2024-01-31T09:00"}',
+        '{"op": "OFF", "at": "2024-01-31T10:00"}',
+    ]) + "\n"
+    result = work.run("BATCH", input=ops, check=False)
+    assert result.returncode == 1
+    assert batch_results(result.stdout) == ["ERROR"] * 4 + ["OK", "OK"]
+    assert '"at" must be a string' in result.stdout
+    assert '"args" must be a list of strings' in result.stdout
+    with work.db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 1
+
+
+def test_text_lines(work):
+    result = work.run("BATCH", input='ON "A" --at "31/01/2024 09:00"\nBOGUS\nOFF --at "31/01/2024 12:30"\n', check=False)
+    assert result.returncode == 1
+    assert batch_results(result.stdout) == ["OK", "ERROR", "OK"]
+    assert "03:30:00" in work.run("TIME-SELECT", "31/01/2024").stdout
+
+
+def test_clean_batch_exits_zero(work):
+    result = work.run("BATCH", input='ON --at "31/01/2024 09:00"\nOFF --at "31/01/2024 10:00"\n')
+    assert batch_results(result.stdout) == ["OK", "OK"]
+
+
+def test_unreadable_source_exits_non_zero(work):
+    result = work.run("BATCH", str(work.root / "missing.txt"), check=False)
+    assert result.returncode == 1
+    assert "Cannot read" in result.stdout
+    with work.db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM events").fetchone()[0] == 0
@@ -0,0 +1,57 @@
+"""Daemon client: a daemon that is not answering must not block `work`, nor run a command twice."""
+import socket
+import time
+
+import pytest
+
+import fast_path
+
+
+@pytest.fixture
+def sock_path(tmp_path, monkeypatch):
+    path = tmp_path / ".work.sock"
+    monkeypatch.setattr(fast_path, "DAEMON_SOCKET", path)
+    return path
+
+
+def test_stuck_daemon_times_out_without_running_in_process(sock_path, monkeypatch, capsys):
+    # Listening but never accepting: connect succeeds through the backlog, no reply ever comes
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    server.listen(1)
+    monkeypatch.setenv(fast_path.DAEMON_TIMEOUT_ENV, "0.5")
+    with server:
+        began = time.monotonic()
+        code = fast_path.daemon_request(["ON"])
+    assert code == 1 # Not None: the request was sent, so it must not be retried in-process
+    assert time.monotonic() - began < 5
+    assert "0.5s" in capsys.readouterr().err
+
+
+def test_daemon_not_accepting_falls_back_in_process(sock_path, monkeypatch):
+    monkeypatch.setattr(fast_path, "DAEMON_CONNECT_TIMEOUT", 0.5)
+    server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    server.bind(str(sock_path))
+    server.listen(0)
+    waiting = []
+    with server:
+        # Fill the backlog so further connects cannot complete
+        for _ in range(4):
+            filler = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            filler.setblocking(False)
+            try:
+                filler.connect(str(sock_path))
+            except BlockingIOError:
+                filler.close()
+                break
+            waiting.append(filler)
+        began = time.monotonic()
+        assert fast_path.daemon_request(["ON"]) is None
+        assert time.monotonic() - began < 5
+    for filler in waiting:
+        filler.close()
+
+
+def test_stale_socket_file_falls_back_in_process(sock_path):
+    sock_path.touch()
+    assert fast_path.daemon_request(["ON"]) is None
@@ -0,0 +1,51 @@
+"""
+Sessions across a day start: EXPORT-CSV writes them whole (so its output round-trips through
+IMPORT), totals split them per day, INIT-TIME only counts sessions begun that day.
+"""
+
+
+def test_export_import_round_trip(work):
+    work.run("BATCH", input=(
+        'ON "night" --at "10/03/2024 22:00"\nOFF --at "11/03/2024 02:00"\n'
+        'ON "day" --at "11/03/2024 09:00"\nOFF --at "11/03/2024 10:00"\n'
+    ))
+    assert "05:00:00" in work.run("TIME-RANGE", "10/03/2024", "11/03/2024").stdout
+
+    work.run("EXPORT-CSV", "10/03/2024", "11/03/2024")
+    csv_path = work.root / "work_history_10032024-11032024.csv"
+    rows = csv_path.read_text(encoding="utf-8").splitlines()[1:]
+    assert rows == ["2024-03-10,22:00:00,02:00:00,04:00:00,night", "2024-03-11,09:00:00,10:00:00,01:00:00,day"]
+
+    work.run("IMPORT", str(csv_path))
+    assert "05:00:00" in work.run("TIME-RANGE", "10/03/2024", "11/03/2024").stdout
+    with work.db() as conn:
+        assert conn.execute("SELECT COUNT(*) FROM sessions").fetchone()[0] == 2
+    assert "consistent" in work.run("ROLLUP-CHECK").stdout
+
+
+def test_night_shift_totals_split_per_day(work):
+    work.run("BATCH", input='ON --at "10/03/2024 22:00"\nOFF --at "11/03/2024 02:00"\n')
+    assert "02:00:00" in work.run("TIME-SELECT", "10/03/2024").stdout
+    assert "02:00:00" in work.run("TIME-SELECT", "11/03/2024").stdout
+
+
+def test_first_start_ignores_a_carried_over_session(work):
+    work.run("BATCH", input='ON --at "10/03/2024 22:00"\nOFF --at "11/03/2024 02:00"\nON --at "11/03/2024 09:00"\n')
+    assert "09:00:00" in work.run("INIT-TIME_WHEN", "11/03/2024").stdout
+    assert "22:00:00" in work.run("INIT-TIME_WHEN", "10/03/2024").stdout
+
+
+def test_history_and_export_select_the_same_tracking_days(work):
+    work.run("DAY-START", "6")
+    work.run("BATCH", input=(
+        'ON "late" --at "11/03/2024 03:00"\nOFF --at "11/03/2024 04:00"\n'  # Still 10/03 until 06:00
+        'ON "morning" --at "11/03/2024 09:00"\nOFF --at "11/03/2024 10:00"\n'
+        'ON "early" --at "12/03/2024 05:00"\nOFF --at "12/03/2024 05:30"\n'  # Still 11/03
+    ))
+    history = work.run("HISTORY", "11/03/2024", "11/03/2024").stdout
+    assert "late" not in history and "morning" in history and "early" in history
+
+    work.run("EXPORT-CSV", "11/03/2024", "11/03/2024")
+    rows = (work.root / "work_history_11032024-11032024.csv").read_text(encoding="utf-8").splitlines()[1:]
+    assert [row.rsplit(",", 1)[1] for row in rows] == ["morning", "early"]
+    assert "late" in work.run("HISTORY", "10/03/2024").stdout
@@ -0,0 +1,21 @@
+"""
+EXPORT-CSV streams from the cursor to the writer: peak memory must not grow with history size.
+Opt-in (WORK_SLOW_TESTS=1): generates WORK_SLOW_EVENTS events (default 5M = 2.5M sessions).
+"""
+import os
+
+from conftest import slow
+from synthetic import populate
+
+EVENTS = int(os.environ.get("WORK_SLOW_EVENTS", "5000000"))
+RSS_CAP_MB = float(os.environ.get("WORK_EXPORT_RSS_MB", "80"))
+
+
+@slow
+def test_export_csv_peak_rss_is_flat(work):
+    sessions = populate(work.db_path, EVENTS // 2)
+    rss = work.peak_rss_mb("EXPORT-CSV", "01/01/2015", "31/12/2400")
+    csv_path = work.root / "work_history_01012015-31122400.csv"
+    with open(csv_path, encoding="utf-8") as f:
+        assert sum(1 for _ in f) == sessions + 1 # Header
+    assert rss < RSS_CAP_MB, f"EXPORT-CSV of {sessions} sessions peaked at {rss:.0f} MB"
@@ -0,0 +1,47 @@
+"""IMPORT: validation against stored history and idempotent re-runs."""
+import json
+
+
+def write_jsonl(path, records):
+    path.write_text("".join(json.dumps(r) + "\n" for r in records), encoding="utf-8")
+    return str(path)
+
+
+def stored_sessions(work):
+    with work.db() as conn:
+        return [tuple(r) for r in conn.execute("SELECT start, end FROM sessions ORDER BY start")]
+
+
+def seed(work):
+    work.run("BATCH", input='ON "stored" --at "2025-03-11T09:00"\nOFF --at "2025-03-11T10:00"\n')
+
+
+def test_import_rejects_overlap_with_stored_session(work, tmp_path):
+    seed(work)
+    path = write_jsonl(tmp_path / "inside.jsonl", [{"start": "2025-03-11T09:30:00", "end": "2025-03-11T09:45:00"}])
+
+    result = work.run("IMPORT", path, check=False)
+    assert result.returncode == 1
+    assert "overlaps the stored session" in result.stdout
+    assert stored_sessions(work) == [("2025-03-11T09:00:00", "2025-03-11T10:00:00")]
+
+    work.run("IMPORT", path, "--skip-invalid")
+    assert stored_sessions(work) == [("2025-03-11T09:00:00", "2025-03-11T10:00:00")]
+
+
+def test_import_rejects_session_spanning_stored_one(work, tmp_path):
+    seed(work)
+    path = write_jsonl(tmp_path / "around.jsonl", [{"start": "2025-03-11T08:00:00", "end": "2025-03-11T11:00:00"}])
+    assert work.run("IMPORT", path, check=False).returncode == 1
+    assert len(stored_sessions(work)) == 1
+
+
+def test_import_accepts_adjacent_sessions(work, tmp_path):
+    seed(work)
+    path = write_jsonl(tmp_path / "adjacent.jsonl", [
+        {"start": "2025-03-11T08:00:00", "end": "2025-03-11T09:00:00"},
+        {"start": "2025-03-11T10:00:00", "end": "2025-03-11T10:30:00"},
+    ])
+    work.run("IMPORT", path)
+    assert len(stored_sessions(work)) == 3
+    assert "consistent" in work.run("ROLLUP-CHECK").stdout
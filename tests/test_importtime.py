@@ -0,0 +1,53 @@
+"""
+Cold-start regression guard: the hot commands must not pay for modules only other commands use.
+Parses `python -X importtime` output, so it catches a stray top-level import anywhere in the chain.
+"""
+import os
+
+import pytest
+
+# Needed by exports, email, PDF or AI commands only
+HEAVY = {"cryptography", "xhtml2pdf", "reportlab", "csv", "webbrowser", "google", "openai", "ai_handler"}
+# Interactive UI stack, skipped entirely on the FAST-MODE path
+UI_STACK = {"typer", "click", "rich"}
+# Generous ceiling for all imports of one hot command, in ms; override for slow machines
+BUDGET_MS = float(os.environ.get("WORK_IMPORT_BUDGET_MS", "1500"))
+
+
+def imported(work, *args):
+    """(top-level packages imported, total import time in ms) for one `work` run."""
+    result = work.run(*args, python_flags=("-X", "importtime"))
+    packages, total_us = set(), 0
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line or "self [us]" in line:
+            continue
+        # "import time:       123 |        456 |     package.module"
+        self_us, _, name = (part.strip() for part in line[len("import time:"):].split("|"))
+        packages.add(name.split(".")[0])
+        total_us += int(self_us)
+    return packages, total_us / 1000
+
+
+@pytest.fixture
+def encrypted_work(work):
+    # A key on disk: descriptions would be encrypted, yet TIME must not load cryptography
+    from cryptography.fernet import Fernet
+    (work.root / "data" / ".secret.key").write_bytes(Fernet.generate_key())
+    return work
+
+
+@pytest.mark.parametrize("command", [("TIME",), ("ON",), ("OFF",), ("TIME-TODAY",)])
+def test_hot_commands_skip_heavy_modules(encrypted_work, command):
+    packages, total_ms = imported(encrypted_work, *command)
+    assert "typer" in packages # Sanity: normal mode does load the CLI
+    assert not packages & HEAVY, f"{command[0]} imported {sorted(packages & HEAVY)}"
+    assert total_ms < BUDGET_MS
+
+
+@pytest.mark.parametrize("command", [("ON",), ("TIME",), ("TIME-TODAY",), ("OFF",)])
+def test_fast_mode_skips_ui_stack(encrypted_work, command):
+    encrypted_work.run("FAST-MODE")
+    packages, total_ms = imported(encrypted_work, *command)
+    assert "fast_path" in packages
+    assert not packages & (HEAVY | UI_STACK), f"{command[0]} imported {sorted(packages & (HEAVY | UI_STACK))}"
+    assert total_ms < BUDGET_MS
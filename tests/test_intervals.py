@@ -0,0 +1,56 @@
+"""Interval engine: sessions cut at day/week/month/year starts."""
+from datetime import date, datetime
+
+import pytest
+
+from fast_path import bucket_rollup, calendar_buckets, clip_intervals, day_rollup, logical_date, to_epoch
+
+
+def epoch(text: str) -> int:
+    return to_epoch(datetime.fromisoformat(text))
+
+
+def test_night_shift_is_split_at_midnight():
+    shift = (epoch("2024-03-10T22:00"), epoch("2024-03-11T02:00"))
+    pieces = [(key, hi - lo) for key, lo, hi, _ in clip_intervals([shift], calendar_buckets("day"))]
+    assert pieces == [("2024-03-10", 7200), ("2024-03-11", 7200)]
+
+    days = day_rollup([shift])
+    assert days["2024-03-10"][:2] == [7200, 1] # The session is counted on the day it started
+    assert days["2024-03-11"][:2] == [7200, 0]
+
+
+def test_day_start_hour_moves_the_boundary():
+    shift = (epoch("2024-03-10T22:00"), epoch("2024-03-11T02:00"))
+    assert list(day_rollup([shift], hour=6)) == ["2024-03-10"]
+    assert logical_date(datetime(2024, 3, 11, 5, 59), 6) == date(2024, 3, 10)
+
+
+@pytest.mark.parametrize("unit, keys", [
+    ("week", ["2024-W05", "2024-W06"]),
+    ("month", ["2024-01", "2024-02"]),
+    ("year", ["2024"]),
+])
+def test_calendar_bucket_keys(unit, keys):
+    shift = (epoch("2024-01-31T23:00"), epoch("2024-02-05T01:00"))
+    assert [key for key, *_ in clip_intervals([shift], calendar_buckets(unit))] == keys
+
+
+def test_dst_day_is_23_hours(local_tz):
+    local_tz("Europe/Madrid")
+    key, lo, hi = calendar_buckets("day")(epoch("2025-03-30T12:00"))
+    assert (key, hi - lo) == ("2025-03-30", 23 * 3600)
+    shift = (epoch("2025-03-29T23:00"), epoch("2025-03-30T04:00"))
+    assert {day: agg[0] for day, agg in day_rollup([shift]).items()} == {"2025-03-29": 3600, "2025-03-30": 3 * 3600}
+
+
+def test_bucket_rollup_clips_to_range_and_counts_starts():
+    before = (epoch("2024-01-31T23:00"), epoch("2024-02-01T01:00")) # Runs into the range
+    inside = (epoch("2024-02-02T09:00"), epoch("2024-02-02T10:00"))
+    empty = (epoch("2024-02-03T09:00"), epoch("2024-02-03T09:00"))
+    stats = bucket_rollup([before, inside, empty], calendar_buckets("month"),
+                          epoch("2024-02-01T00:00"), epoch("2024-03-01T00:00"))
+    seconds, started, first, length = stats["2024-02"]
+    assert list(stats) == ["2024-02"]
+    assert (seconds, started, length) == (2 * 3600, 2, 3600)
+    assert first == epoch("2024-02-01T00:00")
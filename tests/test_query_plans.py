@@ -0,0 +1,63 @@
+"""
+Hot queries must stay index lookups. The SQL is captured from the real helpers (trace callback),
+so a rewritten query or a dropped index shows up here as a SCAN.
+"""
+from datetime import datetime
+
+import pytest
+
+import Working_Code as W
+
+HOT_TABLES = ("daily_totals", "events", "active_timers", "sessions")
+# daily_totals' PRIMARY KEY (user_id, day) is backed by this automatic index
+ROLLUP_KEY = "SEARCH daily_totals USING INDEX sqlite_autoindex_daily_totals"
+
+
+@pytest.fixture
+def conn(work, monkeypatch):
+    work.run("BATCH", input='ON "a" --at "31/01/2024 09:00"\nOFF --at "31/01/2024 12:30"\nON "b" --at "01/02/2024 08:00"\n')
+    W.DB.close()
+    monkeypatch.setattr(W, "DB_PATH", work.db_path)
+    yield W.get_db_connection()
+    W.DB.close()
+
+
+def plans(conn, call) -> dict:
+    """{sql: [plan details]} for each statement on a hot table run by call()."""
+    statements = []
+    conn.set_trace_callback(statements.append)
+    try:
+        call()
+    finally:
+        conn.set_trace_callback(None)
+    return {sql: [row[-1] for row in conn.execute(f"EXPLAIN QUERY PLAN {sql}")]
+            for sql in statements if sql.lstrip().upper().startswith("SELECT") and any(t in sql for t in HOT_TABLES)}
+
+
+def assert_indexed(found: dict, search: str):
+    assert found, "no statement captured"
+    for sql, details in found.items():
+        assert not [d for d in details if d.startswith("SCAN") and any(t in d for t in HOT_TABLES)], (sql, details)
+    assert any(d.startswith(search) for details in found.values() for d in details), found
+
+
+def test_daily_total_uses_rollup_key(conn):
+    found = plans(conn, lambda: W.calculate_daily_total(datetime(2024, 1, 31)))
+    assert_indexed(found, ROLLUP_KEY)
+
+
+def test_range_total_uses_rollup_key(conn):
+    found = plans(conn, lambda: W.calculate_range_total(datetime(2024, 1, 1), datetime(2024, 12, 31)))
+    assert_indexed(found, ROLLUP_KEY)
+
+
+def test_first_start_uses_session_index(conn):
+    found = plans(conn, lambda: W.get_first_start(datetime(2024, 1, 31)))
+    assert_indexed(found, "SEARCH sessions USING COVERING INDEX idx_sessions_user_start")
+
+
+def test_latest_event_uses_epoch_index(conn):
+    uid = W.get_current_user_id()
+    found = plans(conn, lambda: W.sync_active_timer(conn, uid))
+    conn.rollback()
+    assert_indexed(found, "SEARCH events USING INDEX idx_events_user_epoch")
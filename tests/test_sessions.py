@@ -0,0 +1,84 @@
+"""Session pairing: the SQL window pairing must match the process_sessions reference."""
+import random
+import sqlite3
+from datetime import datetime, timedelta
+
+import pytest
+
+import Working_Code as W
+
+
+def events_db(events, uid=1):
+    conn = sqlite3.connect(":memory:")
+    conn.row_factory = sqlite3.Row
+    conn.execute("CREATE TABLE events (id INTEGER PRIMARY KEY, timestamp TEXT, ts_epoch INTEGER, "
+                 "event_type TEXT, description TEXT, user_id INTEGER)")
+    conn.executemany(
+        "INSERT INTO events (timestamp, ts_epoch, event_type, description, user_id) VALUES (?, ?, ?, ?, ?)",
+        [(ts, W.to_epoch(datetime.fromisoformat(ts)), kind, desc, uid) for ts, kind, desc in events]
+    )
+    return conn
+
+
+def reference(conn, lo, hi, uid=1):
+    rows = conn.execute("SELECT timestamp, event_type, description FROM events "
+                        "WHERE user_id = ? AND timestamp >= ? AND timestamp < ? ORDER BY timestamp, rowid", (uid, lo, hi))
+    return W.process_sessions([dict(row) for row in rows])
+
+
+def random_log(rng):
+    """Repeated STARTs, orphan STOPs, equal timestamps and sub-second times, inserted out of order."""
+    t, events = datetime(2024, 1, 1), []
+    for i in range(rng.randint(0, 60)):
+        t += timedelta(seconds=rng.choice([0, 0, 1, 59, 3600, 86399]), microseconds=rng.choice([0, 123456]))
+        events.append((t.isoformat(), rng.choice(["START", "STOP", "START"]), rng.choice([None, "", f"d{i}"])))
+    rng.shuffle(events)
+    return events
+
+
+@pytest.mark.parametrize("seed", range(200))
+def test_pair_event_rows_matches_reference(seed):
+    rng = random.Random(seed)
+    conn = events_db(random_log(rng))
+    lo, hi = "2024-01-01T00:00:00", rng.choice(["2024-01-03", "9999"])
+    assert list(W.iter_sessions(W.pair_event_rows(conn, 1, lo, hi))) == reference(conn, lo, hi)
+
+
+def test_pair_event_rows_keeps_users_apart():
+    # Interleaved users: user 2's STOP must not close user 1's START, nor the other way round
+    conn = events_db([("2024-01-01T09:00:00", "START", "one"), ("2024-01-01T11:00:00", "STOP", None)])
+    conn.executemany(
+        "INSERT INTO events (timestamp, ts_epoch, event_type, description, user_id) VALUES (?, ?, ?, ?, 2)",
+        [(ts, W.to_epoch(datetime.fromisoformat(ts)), kind, desc)
+         for ts, kind, desc in [("2024-01-01T08:00:00", "START", "two"), ("2024-01-01T10:00:00", "STOP", None)]]
+    )
+    for uid in (1, 2):
+        assert list(W.iter_sessions(W.pair_event_rows(conn, uid, "", "9999"))) == reference(conn, "", "9999", uid)
+    assert [s.description for s in W.iter_sessions(W.pair_event_rows(conn, 2, "", "9999"))] == ["two"]
+    assert [(s.start, s.end) for s in W.iter_sessions(W.pair_event_rows(conn, 1, "", "9999"))] == [("09:00:00", "11:00:00")]
+
+
+def test_repeated_start_and_orphan_stop():
+    conn = events_db([
+        ("2024-01-01T08:00:00", "STOP", None),      # Orphan: ignored
+        ("2024-01-01T09:00:00", "START", "first"),
+        ("2024-01-01T09:30:00", "START", "again"),  # Already running: ignored
+        ("2024-01-01T10:00:00", "STOP", None),
+        ("2024-01-01T11:00:00", "STOP", None),      # Orphan: ignored
+    ])
+    expected = [W.Session(W.to_epoch(datetime(2024, 1, 1, 9)), W.to_epoch(datetime(2024, 1, 1, 10)), "first")]
+    assert reference(conn, "", "9999") == expected
+    assert list(W.iter_sessions(W.pair_event_rows(conn, 1, "", "9999"))) == expected
+
+
+def test_pair_events_closes_before_opening_in_the_same_second():
+    # An imported 08:00-09:00 session inserted after a stored 09:00-10:00 one: ids out of time order
+    conn = events_db([
+        ("2024-01-01T09:00:00", "START", "stored"),
+        ("2024-01-01T10:00:00", "STOP", None),
+        ("2024-01-01T08:00:00", "START", "imported"),
+        ("2024-01-01T09:00:00", "STOP", None),
+    ])
+    rows = conn.execute("SELECT timestamp, ts_epoch, event_type, description, user_id FROM events ORDER BY ts_epoch, id")
+    assert [(start[11:16], end[11:16], desc) for _, start, end, _, desc in W.pair_events(rows)] == [
+        ("08:00", "09:00", "imported"), ("09:00", "10:00", "stored")]
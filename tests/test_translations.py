@@ -0,0 +1,31 @@
+"""Every language must carry every key EN has, with the same placeholders."""
+import re
+import string
+
+import pytest
+
+from conftest import SRC
+from translations import LANGUAGES, load_language, missing_keys
+
+EN = load_language("EN")
+
+
+def test_no_missing_keys():
+    assert missing_keys() == {}
+
+
+def fields(text: str) -> set:
+    return {name for _, name, _, _ in string.Formatter().parse(text) if name}
+
+
+@pytest.mark.parametrize("lang", LANGUAGES[1:])
+def test_placeholders_match_en(lang):
+    texts = load_language(lang)
+    assert {key: fields(texts[key]) for key in EN} == {key: fields(EN[key]) for key in EN}
+
+
+def test_keys_used_in_code_exist():
+    source = "".join(path.read_text(encoding="utf-8") for path in SRC.glob("*.py"))
+    used = set(re.findall(r"""\bT\(['"]([a-z0-9_]+)['"]\)""", source))
+    used |= set(re.findall(r"""\(\s*"[A-Z][A-Z_-]*",\s*"(desc_[a-z0-9_]+)",""", source)) # Help table rows
+    assert used - set(EN) == set()